@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import re
 from typing import Literal
 
 from browser_use.agent.message_manager.views import (
@@ -15,16 +16,26 @@ from browser_use.agent.views import (
 )
 from browser_use.browser.views import BrowserStateSummary
 from browser_use.filesystem.file_system import FileSystem
+from browser_use.llm.base import BaseChatModel
 from browser_use.llm.messages import (
 	BaseMessage,
 	ContentPartTextParam,
 	SystemMessage,
+	UserMessage,
 )
 from browser_use.observability import observe_debug
 from browser_use.utils import match_url_with_domain_pattern, time_execution_sync
 
 logger = logging.getLogger(__name__)
 
+# rough token estimate for budgeting the history, good enough without a provider specific tokenizer
+CHARS_PER_TOKEN = 4
+
+HISTORY_SUMMARY_PROMPT = """You compress the step history of a browser automation agent.
+Summarize the previous summary (if any) and the history items below into a short list of the facts, results and
+progress the agent still needs to finish its task: keep concrete values (names, numbers, urls, file names) and drop anything redundant.
+Answer only with the summary."""
+
 
 # ========== Logging Helper Functions ==========
 # These functions are used ONLY for formatting debug log output.
@@ -107,6 +118,8 @@ class MessageManager:
 		max_history_items: int | None = None,
 		vision_detail_level: Literal['auto', 'low', 'high'] = 'auto',
 		include_tool_call_examples: bool = False,
+		cache_friendly_prompt: bool = False,
+		max_history_tokens: int | None = None,
 	):
 		self.task = task
 		self.state = state
@@ -117,12 +130,18 @@ class MessageManager:
 		self.max_history_items = max_history_items
 		self.vision_detail_level = vision_detail_level
 		self.include_tool_call_examples = include_tool_call_examples
+		self.cache_friendly_prompt = cache_friendly_prompt
+		self.max_history_tokens = max_history_tokens
+		# every history item is only rendered once, each step just renders the items that were added since the last one
+		self._rendered_history_items: list[tuple[HistoryItem, str]] = []
 
 		assert max_history_items is None or max_history_items > 5, 'max_history_items must be None or greater than 5'
 
 		# Store settings as direct attributes instead of in a settings object
 		self.include_attributes = include_attributes or []
 		self.sensitive_data = sensitive_data
+		# (snapshot of sensitive_data, compiled redaction matcher), rebuilt only when sensitive_data changes
+		self._sensitive_data_matcher: tuple[tuple, tuple[re.Pattern[str], dict[str, str]] | None] | None = None
 		self.last_input_messages = []
 		# Only initialize messages if state is empty
 		if len(self.state.history.get_messages()) == 0:
@@ -131,15 +150,24 @@ class MessageManager:
 	@property
 	def agent_history_description(self) -> str:
 		"""Build agent history description from list of items, respecting max_history_items limit"""
+		return '\n'.join(self._get_agent_history_item_strings())
+
+	def _get_agent_history_item_strings(self) -> list[str]:
+		"""The history items to show to the model (as strings), respecting max_history_items limit"""
+		rendered_items = self._get_rendered_history_items()
+		if self.state.compacted_history_summary is not None:
+			# the summary of the compacted items takes their place right after the first item (initialization)
+			rendered_items.insert(1, self._render_history_summary())
+
 		if self.max_history_items is None:
 			# Include all items
-			return '\n'.join(item.to_string() for item in self.state.agent_history_items)
+			return rendered_items
 
-		total_items = len(self.state.agent_history_items)
+		total_items = len(rendered_items)
 
 		# If we have fewer items than the limit, just return all items
 		if total_items <= self.max_history_items:
-			return '\n'.join(item.to_string() for item in self.state.agent_history_items)
+			return rendered_items
 
 		# We have more items than the limit, so we need to omit some
 		omitted_count = total_items - self.max_history_items
@@ -149,13 +177,135 @@ class MessageManager:
 		recent_items_count = self.max_history_items - 1  # -1 for first item
 
 		items_to_include = [
-			self.state.agent_history_items[0].to_string(),  # Keep first item (initialization)
+			rendered_items[0],  # Keep first item (initialization)
 			f'<sys>[... {omitted_count} previous steps omitted...]</sys>',
 		]
 		# Add most recent items
-		items_to_include.extend([item.to_string() for item in self.state.agent_history_items[-recent_items_count:]])
+		items_to_include.extend(rendered_items[-recent_items_count:])
+
+		return items_to_include
+
+	def _get_rendered_history_items(self) -> list[str]:
+		"""HistoryItem.to_string() of all history items, rendering only the items that are new since the last call"""
+		items = self.state.agent_history_items
+		rendered = self._rendered_history_items
+		if len(rendered) > len(items) or (rendered and rendered[-1][0] is not items[len(rendered) - 1]):
+			rendered = []  # the history was replaced (e.g. a different state was loaded), render it from scratch
+		rendered.extend((item, item.to_string()) for item in items[len(rendered) :])
+		self._rendered_history_items = rendered
+		return [text for _, text in rendered]
+
+	def _render_history_summary(self) -> str:
+		return f"""<sys>
+[Summary of {self.state.compacted_history_items} earlier history items, compacted to save context]
+{self.state.compacted_history_summary}
+</sys>"""
+
+	def _get_history_items_to_compact(self) -> int:
+		"""
+		How many of the oldest history items (after the first one) have to be compacted to stay within max_history_tokens.
+
+		Once over budget, the history is compacted down to half of it, so compaction (which changes the prompt prefix
+		and invalidates provider prompt caches) only happens every so often instead of on every step.
+		"""
+		if self.max_history_tokens is None:
+			return 0
+		rendered_items = self._get_rendered_history_items()
+		summary_length = len(self._render_history_summary()) if self.state.compacted_history_summary is not None else 0
+		total_length = sum(len(text) for text in rendered_items) + summary_length
+		if total_length <= self.max_history_tokens * CHARS_PER_TOKEN:
+			return 0
+
+		target_length = self.max_history_tokens * CHARS_PER_TOKEN // 2
+		count = 0
+		# never compact the first item (initialization) or the most recent one
+		for text in rendered_items[1:-1]:
+			if total_length <= target_length:
+				break
+			total_length -= len(text)
+			count += 1
+		return count
+
+	def _bound_history_summary(self, summary: str) -> str:
+		"""Keep the summary itself within a quarter of the budget, dropping its oldest lines first"""
+		assert self.max_history_tokens is not None
+		max_length = self.max_history_tokens * CHARS_PER_TOKEN // 4
+		if len(summary) <= max_length:
+			return summary
+
+		lines = summary.split('\n')
+		kept_lines: list[str] = []
+		length = 40  # room for the omitted lines marker
+		for line in reversed(lines):
+			if length + len(line) + 1 > max_length:
+				break
+			kept_lines.insert(0, line)
+			length += len(line) + 1
+		if not kept_lines:
+			# a single line (e.g. an LLM summary without line breaks) longer than the limit
+			return lines[-1][: max_length - 3] + '...'
+		return '\n'.join([f'[... {len(lines) - len(kept_lines)} older summary lines omitted]', *kept_lines])
+
+	def _apply_history_compaction(self, count: int, summary: str) -> None:
+		items = self.state.agent_history_items
+		self.state.agent_history_items = [items[0], *items[1 + count :]]
+		self._rendered_history_items = [self._rendered_history_items[0], *self._rendered_history_items[1 + count :]]
+		self.state.compacted_history_summary = self._bound_history_summary(summary)
+		self.state.compacted_history_items += count
+		logger.debug(f'🗜️ Compacted {count} history items, {self.state.compacted_history_items} compacted in total')
+
+	@staticmethod
+	def _summarize_history_item(item: HistoryItem) -> str:
+		"""One line per compacted history item for the deterministic summary"""
+		step_str = f'step_{item.step_number}' if item.step_number is not None else 'step_unknown'
+		text = item.error or item.system_message or item.memory or item.next_goal or item.action_results or ''
+		text = re.sub(r'\s+', ' ', text).strip()
+		if len(text) > 150:
+			text = text[:147] + '...'
+		return f'{step_str}: {text}'
+
+	def compact_agent_history(self) -> None:
+		"""Compact the oldest history items into a deterministic summary if the history is over max_history_tokens.
+
+		The agent compacts through acompact_agent_history() once per step, before add_state_message().
+		"""
+		count = self._get_history_items_to_compact()
+		if not count:
+			return
+
+		lines = [self._summarize_history_item(item) for item in self.state.agent_history_items[1 : 1 + count]]
+		if self.state.compacted_history_summary:
+			lines.insert(0, self.state.compacted_history_summary)
+		self._apply_history_compaction(count, '\n'.join(lines))
+
+	async def acompact_agent_history(self, llm: BaseChatModel | None = None) -> None:
+		"""Same as compact_agent_history(), but let a (cheap) LLM write the summary if one is given"""
+		if llm is None:
+			self.compact_agent_history()
+			return
+
+		count = self._get_history_items_to_compact()
+		if not count:
+			return
+
+		history_text = '\n'.join(text for _, text in self._rendered_history_items[1 : 1 + count])
+		previous_summary = self.state.compacted_history_summary or 'None'
+		history_message = UserMessage(
+			content=f'<previous_summary>\n{previous_summary}\n</previous_summary>\n<history>\n{history_text}\n</history>'
+		)
+		if self.sensitive_data:
+			history_message = self._filter_sensitive_data(history_message)
+		messages: list[BaseMessage] = [SystemMessage(content=HISTORY_SUMMARY_PROMPT), history_message]
+		try:
+			response = await llm.ainvoke(messages)
+		except Exception as e:
+			logger.warning(
+				f'⚠️ Failed to summarize the agent history with {llm.model}, truncating it instead: {type(e).__name__}: {e}'
+			)
+			self.compact_agent_history()
+			return
 
-		return '\n'.join(items_to_include)
+		self._apply_history_compaction(count, response.completion.strip())
 
 	def add_new_task(self, new_task: str) -> None:
 		self.task = new_task
@@ -270,10 +420,11 @@ class MessageManager:
 
 		# otherwise add state message and result to next message (which will not stay in memory)
 		assert browser_state_summary
-		state_message = AgentMessagePrompt(
+		agent_history_items = self._get_agent_history_item_strings()
+		prompt = AgentMessagePrompt(
 			browser_state_summary=browser_state_summary,
 			file_system=self.file_system,
-			agent_history_description=self.agent_history_description,
+			agent_history_description='\n'.join(agent_history_items),
 			read_state_description=self.state.read_state_description,
 			task=self.task,
 			include_attributes=self.include_attributes,
@@ -283,7 +434,14 @@ class MessageManager:
 			available_file_paths=available_file_paths,
 			screenshots=screenshots,
 			vision_detail_level=self.vision_detail_level,
-		).get_user_message(use_vision)
+			agent_history_items=agent_history_items,
+		)
+
+		if self.cache_friendly_prompt:
+			stable_state_message, state_message = prompt.get_cache_friendly_user_messages(use_vision)
+			self._add_message_with_type(stable_state_message, 'stable_state')
+		else:
+			state_message = prompt.get_user_message(use_vision)
 
 		self._add_message_with_type(state_message, 'state')
 
@@ -333,7 +491,9 @@ class MessageManager:
 		self.last_input_messages = self.state.history.get_messages()
 		return self.last_input_messages
 
-	def _add_message_with_type(self, message: BaseMessage, message_type: Literal['system', 'state', 'consistent']) -> None:
+	def _add_message_with_type(
+		self, message: BaseMessage, message_type: Literal['system', 'stable_state', 'state', 'consistent']
+	) -> None:
 		"""Add message to history"""
 
 		# filter out sensitive data from the message
@@ -342,6 +502,8 @@ class MessageManager:
 
 		if message_type == 'system':
 			self.state.history.system_message = message
+		elif message_type == 'stable_state':
+			self.state.history.stable_state_message = message
 		elif message_type == 'state':
 			self.state.history.state_message = message
 		elif message_type == 'consistent':
@@ -349,38 +511,56 @@ class MessageManager:
 		else:
 			raise ValueError(f'Invalid message type: {message_type}')
 
+	def _get_sensitive_data_matcher(self) -> tuple[re.Pattern[str], dict[str, str]] | None:
+		"""
+		One regex matching every sensitive value + the <secret> tag to replace each value with.
+
+		Compiled once and reused until sensitive_data changes, so redacting a message is a single scan of its text
+		no matter how many credentials there are. Values of all domains are redacted, whatever page we're on.
+		"""
+		if not self.sensitive_data:
+			return None
+
+		snapshot = tuple(
+			(key, tuple(content.items()) if isinstance(content, dict) else content)
+			for key, content in self.sensitive_data.items()
+		)
+		if self._sensitive_data_matcher is not None and self._sensitive_data_matcher[0] == snapshot:
+			return self._sensitive_data_matcher[1]
+
+		# Collect all sensitive values, immediately converting old format to new format
+		replacements: dict[str, str] = {}
+		for key_or_domain, content in self.sensitive_data.items():
+			if isinstance(content, dict):
+				# Already in new format: {domain: {key: value}}
+				for key, val in content.items():
+					if val:  # Skip empty values
+						replacements.setdefault(val, f'<secret>{key}</secret>')
+			elif content:  # Old format: {key: value} - convert to new format internally
+				# We treat this as if it was {'http*://*': {key_or_domain: content}}
+				replacements.setdefault(content, f'<secret>{key_or_domain}</secret>')
+
+		matcher = None
+		if replacements:
+			# longest values first, so a secret that contains another secret is replaced as a whole
+			pattern = re.compile('|'.join(re.escape(val) for val in sorted(replacements, key=len, reverse=True)))
+			matcher = (pattern, replacements)
+		else:
+			logger.warning('No valid entries found in sensitive_data dictionary')
+
+		self._sensitive_data_matcher = (snapshot, matcher)
+		return matcher
+
 	@time_execution_sync('--filter_sensitive_data')
 	def _filter_sensitive_data(self, message: BaseMessage) -> BaseMessage:
 		"""Filter out sensitive data from the message"""
+		matcher = self._get_sensitive_data_matcher()
+		if matcher is None:
+			return message
+		pattern, replacements = matcher
 
 		def replace_sensitive(value: str) -> str:
-			if not self.sensitive_data:
-				return value
-
-			# Collect all sensitive values, immediately converting old format to new format
-			sensitive_values: dict[str, str] = {}
-
-			# Process all sensitive data entries
-			for key_or_domain, content in self.sensitive_data.items():
-				if isinstance(content, dict):
-					# Already in new format: {domain: {key: value}}
-					for key, val in content.items():
-						if val:  # Skip empty values
-							sensitive_values[key] = val
-				elif content:  # Old format: {key: value} - convert to new format internally
-					# We treat this as if it was {'http*://*': {key_or_domain: content}}
-					sensitive_values[key_or_domain] = content
-
-			# If there are no valid sensitive data entries, just return the original value
-			if not sensitive_values:
-				logger.warning('No valid entries found in sensitive_data dictionary')
-				return value
-
-			# Replace all valid sensitive data values with their placeholder tags
-			for key, val in sensitive_values.items():
-				value = value.replace(val, f'<secret>{key}</secret>')
-
-			return value
+			return pattern.sub(lambda match: replacements[match.group(0)], value)
 
 		if isinstance(message.content, str):
 			message.content = replace_sensitive(message.content)
@@ -71,6 +71,7 @@ class MessageHistory(BaseModel):
 	"""History of messages"""
 
 	system_message: BaseMessage | None = None
+	stable_state_message: BaseMessage | None = None  # only used by the cache friendly prompt layout
 	state_message: BaseMessage | None = None
 	consistent_messages: list[BaseMessage] = Field(default_factory=list)
 	model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -80,6 +81,8 @@ class MessageHistory(BaseModel):
 		messages = []
 		if self.system_message:
 			messages.append(self.system_message)
+		if self.stable_state_message:
+			messages.append(self.stable_state_message)
 		if self.state_message:
 			messages.append(self.state_message)
 		messages.extend(self.consistent_messages)
@@ -96,5 +99,8 @@ class MessageManagerState(BaseModel):
 		default_factory=lambda: [HistoryItem(step_number=0, system_message='Agent initialized')]
 	)
 	read_state_description: str = ''
+	# older history items that were compacted into a summary to stay within max_history_tokens
+	compacted_history_summary: str | None = None
+	compacted_history_items: int = 0
 
 	model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -2,7 +2,7 @@ import importlib.resources
 from datetime import datetime
 from typing import TYPE_CHECKING, Literal, Optional
 
-from browser_use.llm.messages import ContentPartImageParam, ContentPartTextParam, ImageURL, SystemMessage, UserMessage
+from browser_use.llm.messages import ContentPartImageBytesParam, ContentPartTextParam, SystemMessage, UserMessage
 from browser_use.observability import observe_debug
 from browser_use.utils import is_new_tab_page
 
@@ -92,6 +92,7 @@ class AgentMessagePrompt:
 		available_file_paths: list[str] | None = None,
 		screenshots: list[str] | None = None,
 		vision_detail_level: Literal['auto', 'low', 'high'] = 'auto',
+		agent_history_items: list[str] | None = None,
 	):
 		self.browser_state: 'BrowserStateSummary' = browser_state_summary
 		self.file_system: 'FileSystem | None' = file_system
@@ -106,6 +107,7 @@ class AgentMessagePrompt:
 		self.available_file_paths: list[str] | None = available_file_paths
 		self.screenshots = screenshots or []
 		self.vision_detail_level = vision_detail_level
+		self.agent_history_items: list[str] | None = agent_history_items  # for the cache friendly layout
 		assert self.browser_state
 
 	@observe_debug(ignore_input=True, ignore_output=True, name='_get_browser_state_description')
@@ -185,7 +187,7 @@ Available tabs:
 """
 		return browser_state
 
-	def _get_agent_state_description(self) -> str:
+	def _get_agent_state_description(self, include_user_request: bool = True) -> str:
 		if self.step_info:
 			step_info_description = f'Step {self.step_info.step_number + 1} of {self.step_info.max_steps} max possible steps\n'
 		else:
@@ -197,10 +199,10 @@ Available tabs:
 		if not len(_todo_contents):
 			_todo_contents = '[Current todo.md is empty, fill it with your plan when applicable]'
 
-		agent_state = f"""
-<user_request>
-{self.task}
-</user_request>
+		agent_state = ''
+		if include_user_request:
+			agent_state += f'\n<user_request>\n{self.task}\n</user_request>'
+		agent_state += f"""
 <file_system>
 {self.file_system.describe() if self.file_system else 'No file system available'}
 </file_system>
@@ -216,23 +218,11 @@ Available tabs:
 			agent_state += '<available_file_paths>\n' + '\n'.join(self.available_file_paths) + '\n</available_file_paths>\n'
 		return agent_state
 
-	@observe_debug(ignore_input=True, ignore_output=True, name='get_user_message')
-	def get_user_message(self, use_vision: bool = True) -> UserMessage:
-		# Don't pass screenshot to model if page is a new tab page, step is 0, and there's only one tab
-		if (
-			is_new_tab_page(self.browser_state.url)
-			and self.step_info is not None
-			and self.step_info.step_number == 0
-			and len(self.browser_state.tabs) == 1
-		):
-			use_vision = False
-
+	def _get_current_state_description(self, include_user_request: bool = True) -> str:
+		"""Everything that describes the current step: agent state, browser state, read state and page actions"""
 		state_description = (
-			'<agent_history>\n'
-			+ (self.agent_history_description.strip('\n') if self.agent_history_description else '')
-			+ '\n</agent_history>\n'
+			'<agent_state>\n' + self._get_agent_state_description(include_user_request).strip('\n') + '\n</agent_state>\n'
 		)
-		state_description += '<agent_state>\n' + self._get_agent_state_description().strip('\n') + '\n</agent_state>\n'
 		state_description += '<browser_state>\n' + self._get_browser_state_description().strip('\n') + '\n</browser_state>\n'
 		state_description += (
 			'<read_state>\n'
@@ -242,10 +232,25 @@ Available tabs:
 		if self.page_filtered_actions:
 			state_description += 'For this page, these additional actions are available:\n'
 			state_description += self.page_filtered_actions + '\n'
+		return state_description
 
+	def _should_use_vision(self, use_vision: bool) -> bool:
+		# Don't pass screenshot to model if page is a new tab page, step is 0, and there's only one tab
+		if (
+			is_new_tab_page(self.browser_state.url)
+			and self.step_info is not None
+			and self.step_info.step_number == 0
+			and len(self.browser_state.tabs) == 1
+		):
+			return False
+		return use_vision
+
+	def _build_user_message(self, state_description: str, use_vision: bool, cache: bool) -> UserMessage:
 		if use_vision is True and self.screenshots:
 			# Start with text description
-			content_parts: list[ContentPartTextParam | ContentPartImageParam] = [ContentPartTextParam(text=state_description)]
+			content_parts: list[ContentPartTextParam | ContentPartImageBytesParam] = [
+				ContentPartTextParam(text=state_description)
+			]
 
 			# Add screenshots with labels
 			for i, screenshot in enumerate(self.screenshots):
@@ -258,17 +263,44 @@ Available tabs:
 				# Add label as text content
 				content_parts.append(ContentPartTextParam(text=label))
 
-				# Add the screenshot
+				# Add the screenshot as raw bytes, each provider serializer encodes it the way its API needs
 				content_parts.append(
-					ContentPartImageParam(
-						image_url=ImageURL(
-							url=f'data:image/png;base64,{screenshot}',
-							media_type='image/png',
-							detail=self.vision_detail_level,
-						),
-					)
+					ContentPartImageBytesParam.from_base64(screenshot, media_type='image/png', detail=self.vision_detail_level)
 				)
 
-			return UserMessage(content=content_parts, cache=True)
+			return UserMessage(content=content_parts, cache=cache)
+
+		return UserMessage(content=state_description, cache=cache)
+
+	@observe_debug(ignore_input=True, ignore_output=True, name='get_user_message')
+	def get_user_message(self, use_vision: bool = True) -> UserMessage:
+		use_vision = self._should_use_vision(use_vision)
+
+		state_description = (
+			'<agent_history>\n'
+			+ (self.agent_history_description.strip('\n') if self.agent_history_description else '')
+			+ '\n</agent_history>\n'
+		)
+		state_description += self._get_current_state_description()
+
+		return self._build_user_message(state_description, use_vision, cache=True)
+
+	@observe_debug(ignore_input=True, ignore_output=True, name='get_cache_friendly_user_messages')
+	def get_cache_friendly_user_messages(self, use_vision: bool = True) -> tuple[UserMessage, UserMessage]:
+		"""
+		Same content as get_user_message(), laid out for provider prompt caching:
+
+		1. a cached message with everything that only grows between steps: the user request and the agent history,
+		   one content part per history item so the previous step's prompt stays a byte-identical prefix
+		2. a message with everything that changes every step: agent state, browser state, read state and screenshot
+		"""
+		use_vision = self._should_use_vision(use_vision)
+
+		stable_parts: list[ContentPartTextParam | ContentPartImageBytesParam] = [
+			ContentPartTextParam(text=f'<user_request>\n{self.task}\n</user_request>\n<agent_history>')
+		]
+		stable_parts.extend(ContentPartTextParam(text=f'\n{item}') for item in self.agent_history_items or [])
+		stable_message = UserMessage(content=stable_parts, cache=True)
 
-		return UserMessage(content=state_description, cache=True)
+		state_description = '</agent_history>\n' + self._get_current_state_description(include_user_request=False)
+		return stable_message, self._build_user_message(state_description, use_vision, cache=False)
@@ -25,7 +25,12 @@ from browser_use.agent.cloud_events import (
 from browser_use.agent.message_manager.utils import save_conversation
 from browser_use.dom.views import DEFAULT_INCLUDE_ATTRIBUTES
 from browser_use.llm.base import BaseChatModel
+from browser_use.llm.exceptions import ModelRateLimitError
 from browser_use.llm.messages import BaseMessage, UserMessage
+from browser_use.llm.routing import RoutingChatModel, RoutingSignals
+from browser_use.llm.schema import SchemaOptimizer
+from browser_use.llm.streaming import IncrementalJSONArrayParser
+from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
 from browser_use.tokens.service import TokenCost
 
 load_dotenv()
@@ -54,11 +59,11 @@ from browser_use.agent.views import (
 	StepMetadata,
 )
 from browser_use.browser import BrowserProfile, BrowserSession
-from browser_use.browser.session import DEFAULT_BROWSER_PROFILE
+from browser_use.browser.session import DEFAULT_BROWSER_PROFILE, CachedClickableElementHashes
 from browser_use.browser.types import Browser, BrowserContext, Page
-from browser_use.browser.views import BrowserStateSummary
+from browser_use.browser.views import BrowserStateSummary, PageChangeSignal
 from browser_use.config import CONFIG
-from browser_use.controller.registry.views import ActionModel
+from browser_use.controller.registry.views import ActionModel, ActionSubsetContext, ActionSubsetPolicy
 from browser_use.controller.service import Controller
 from browser_use.dom.history_tree_processor.service import (
 	DOMHistoryElement,
@@ -171,6 +176,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		use_thinking: bool = True,
 		flash_mode: bool = False,
 		max_history_items: int = 40,
+		max_history_tokens: int | None = None,
+		history_summary_llm: BaseChatModel | None = None,
 		page_extraction_llm: BaseChatModel | None = None,
 		planner_llm: BaseChatModel | None = None,  # Deprecated
 		planner_interval: int = 1,  # Deprecated
@@ -188,6 +195,10 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		vision_detail_level: Literal['auto', 'low', 'high'] = 'auto',
 		llm_timeout: int = 60,
 		step_timeout: int = 180,
+		stream_actions: bool = False,
+		prefetch_browser_state: bool = False,
+		cache_friendly_prompt: bool = False,
+		action_subset_policy: ActionSubsetPolicy | None = None,
 		**kwargs,
 	):
 		if not isinstance(llm, BaseChatModel):
@@ -213,7 +224,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			kwargs['memory_config'] = None
 
 		if page_extraction_llm is None:
-			page_extraction_llm = llm
+			# extraction is not an agent step, keep it out of the router's escalation state
+			page_extraction_llm = llm.cheap if isinstance(llm, RoutingChatModel) else llm
 		if available_file_paths is None:
 			available_file_paths = []
 
@@ -258,6 +270,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			use_thinking=use_thinking,
 			flash_mode=flash_mode,
 			max_history_items=max_history_items,
+			max_history_tokens=max_history_tokens,
+			history_summary_llm=history_summary_llm,
 			page_extraction_llm=page_extraction_llm,
 			planner_llm=None,  # Always None now (deprecated)
 			planner_interval=1,  # Always 1 now (deprecated)
@@ -267,12 +281,18 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			include_tool_call_examples=include_tool_call_examples,
 			llm_timeout=llm_timeout,
 			step_timeout=step_timeout,
+			stream_actions=stream_actions,
+			prefetch_browser_state=prefetch_browser_state,
+			cache_friendly_prompt=cache_friendly_prompt,
+			action_subset_policy=action_subset_policy,
 		)
 
 		# Token cost service
 		self.token_cost_service = TokenCost(include_cost=calculate_cost)
 		self.token_cost_service.register_llm(llm)
 		self.token_cost_service.register_llm(page_extraction_llm)
+		if history_summary_llm is not None:
+			self.token_cost_service.register_llm(history_summary_llm)
 		# Note: No longer registering planner_llm (deprecated)
 
 		# Initialize state
@@ -303,6 +323,10 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 		# Verify we can connect to the model
 		self._verify_and_setup_llm()
+		if self.settings.stream_actions and not hasattr(self.llm, 'ainvoke_streaming'):
+			self.logger.warning(
+				f'⚠️ stream_actions=True, but {type(self.llm).__name__} does not support streaming, using regular LLM calls'
+			)
 
 		# TODO: move this logic to the LLMs
 		# Handle users trying to use use_vision=True with DeepSeek models
@@ -348,8 +372,10 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			include_attributes=self.settings.include_attributes,
 			sensitive_data=sensitive_data,
 			max_history_items=self.settings.max_history_items,
+			max_history_tokens=self.settings.max_history_tokens,
 			vision_detail_level=self.settings.vision_detail_level,
 			include_tool_call_examples=self.settings.include_tool_call_examples,
+			cache_friendly_prompt=self.settings.cache_friendly_prompt,
 		)
 
 		if isinstance(browser, BrowserSession):
@@ -367,7 +393,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		if browser_session:
 			# Always copy sessions that are passed in to avoid agents overwriting each other's agent_current_page and human_current_page by accident
 			# The model_copy() method now handles copying all necessary fields and setting up ownership
-			if browser_session._owns_browser_resources:
+			if browser_session._owns_browser_resources or browser_session._owns_browser_context:
 				self.browser_session = browser_session
 			else:
 				self.logger.warning(
@@ -485,6 +511,21 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		self._external_pause_event = asyncio.Event()
 		self._external_pause_event.set()
 
+		# Streaming: the first action can be started while the rest of the LLM response is still streaming in
+		self._time_to_first_action: float | None = None
+		self._step_llm_usage: ChatInvokeUsage | None = None
+		self._early_action_task: asyncio.Task[ActionResult] | None = None
+
+		# Pipelining: the next step's browser state is captured while the current step is post-processed
+		self._prefetched_browser_state_task: asyncio.Task[tuple[BrowserStateSummary, PageChangeSignal | None]] | None = None
+		self._clickable_element_hashes_before_prefetch: CachedClickableElementHashes | None = None
+
+		# Tool subsetting: estimated prompt tokens of this step's output schema
+		self._action_schema_tokens: int | None = None
+
+		# Routing: page fingerprint at the last step, to tell a RoutingChatModel whether the agent's actions change the page
+		self._routing_page_change_signal: PageChangeSignal | None = None
+
 	@property
 	def logger(self) -> logging.Logger:
 		"""Get instance-specific logger with task ID in the name"""
@@ -644,24 +685,27 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 	def _setup_action_models(self) -> None:
 		"""Setup dynamic action models from controller's registry"""
+		self._agent_output_types: dict[tuple[type[ActionModel], bool, bool], type[AgentOutput]] = {}
 		# Initially only include actions with no filters
 		self.ActionModel = self.controller.registry.create_action_model()
 		# Create output model with the dynamic actions
-		if self.settings.flash_mode:
-			self.AgentOutput = AgentOutput.type_with_custom_actions_flash_mode(self.ActionModel)
-		elif self.settings.use_thinking:
-			self.AgentOutput = AgentOutput.type_with_custom_actions(self.ActionModel)
-		else:
-			self.AgentOutput = AgentOutput.type_with_custom_actions_no_thinking(self.ActionModel)
+		self.AgentOutput = self._get_agent_output_type(self.ActionModel)
 
 		# used to force the done action when max_steps is reached
 		self.DoneActionModel = self.controller.registry.create_action_model(include_actions=['done'])
-		if self.settings.flash_mode:
-			self.DoneAgentOutput = AgentOutput.type_with_custom_actions_flash_mode(self.DoneActionModel)
-		elif self.settings.use_thinking:
-			self.DoneAgentOutput = AgentOutput.type_with_custom_actions(self.DoneActionModel)
-		else:
-			self.DoneAgentOutput = AgentOutput.type_with_custom_actions_no_thinking(self.DoneActionModel)
+		self.DoneAgentOutput = self._get_agent_output_type(self.DoneActionModel)
+
+	def _get_agent_output_type(self, action_model: type[ActionModel]) -> type[AgentOutput]:
+		"""Get the AgentOutput type for an action model, built once per distinct action model + output mode"""
+		cache_key = (action_model, self.settings.flash_mode, self.settings.use_thinking)
+		if cache_key not in self._agent_output_types:
+			if self.settings.flash_mode:
+				self._agent_output_types[cache_key] = AgentOutput.type_with_custom_actions_flash_mode(action_model)
+			elif self.settings.use_thinking:
+				self._agent_output_types[cache_key] = AgentOutput.type_with_custom_actions(action_model)
+			else:
+				self._agent_output_types[cache_key] = AgentOutput.type_with_custom_actions_no_thinking(action_model)
+		return self._agent_output_types[cache_key]
 
 	def add_new_task(self, new_task: str) -> None:
 		"""Add a new task to the agent, keeping the same task_id as tasks are continuous"""
@@ -688,6 +732,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		"""Execute one step of the task"""
 		# Initialize timing first, before any exceptions can occur
 		self.step_start_time = time.time()
+		self._time_to_first_action = None
+		self._step_llm_usage = None
 
 		browser_state_summary = None
 
@@ -698,6 +744,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			# Phase 2: Get model output and execute actions
 			await self._get_next_action(browser_state_summary)
 			await self._execute_actions()
+			self._start_browser_state_prefetch()
 
 			# Phase 3: Post-processing
 			await self._post_process()
@@ -716,9 +763,11 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		assert self.browser_session is not None, 'BrowserSession is not set up'
 
 		self.logger.debug(f'🌐 Step {self.state.n_steps}: Getting browser state...')
-		browser_state_summary = await self.browser_session.get_browser_state_with_recovery(
-			cache_clickable_elements_hashes=True, include_screenshot=self.settings.use_vision
-		)
+		browser_state_summary = await self._get_prefetched_browser_state()
+		if browser_state_summary is None:
+			browser_state_summary = await self.browser_session.get_browser_state_with_recovery(
+				cache_clickable_elements_hashes=True, include_screenshot=self.settings.use_vision
+			)
 		current_page = await self.browser_session.get_current_page()
 
 		# Check for new downloads after getting browser state (catches PDF auto-downloads and previous step downloads)
@@ -729,7 +778,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 		# Update action models with page-specific actions
 		self.logger.debug(f'📝 Step {self.state.n_steps}: Updating action models...')
-		await self._update_action_models_for_page(current_page)
+		await self._update_action_models_for_page(current_page, browser_state_summary)
 
 		# Get page-specific filtered actions
 		page_filtered_actions = self.controller.registry.get_prompt_description(current_page)
@@ -739,6 +788,9 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			page_action_message = f'For this page, these additional actions are available:\n{page_filtered_actions}'
 			self._message_manager._add_message_with_type(UserMessage(content=page_action_message), 'consistent')
 
+		# the only place the history is compacted to max_history_tokens, it summarizes with history_summary_llm if set
+		await self._message_manager.acompact_agent_history(self.settings.history_summary_llm)
+
 		self.logger.debug(f'💬 Step {self.state.n_steps}: Adding state message to context...')
 		self._message_manager.add_state_message(
 			browser_state_summary=browser_state_summary,
@@ -758,29 +810,50 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 	async def _get_next_action(self, browser_state_summary: BrowserStateSummary) -> None:
 		"""Execute LLM interaction with retry logic and handle callbacks"""
 		input_messages = self._message_manager.get_messages()
+		if isinstance(self.llm, RoutingChatModel):
+			self.llm.set_step_signals(self._get_routing_signals())
 		self.logger.debug(
 			f'🤖 Step {self.state.n_steps}: Calling LLM with {len(input_messages)} messages (model: {self.llm.model})...'
 		)
 
 		try:
-			model_output = await asyncio.wait_for(
-				self._get_model_output_with_retry(input_messages), timeout=self.settings.llm_timeout
-			)
-		except TimeoutError:
-			raise TimeoutError(
-				f'LLM call timed out after {self.settings.llm_timeout} seconds. Keep your thinking and output short.'
-			)
+			try:
+				model_output = await asyncio.wait_for(
+					self._get_model_output_with_retry(input_messages), timeout=self.settings.llm_timeout
+				)
+			except TimeoutError:
+				raise TimeoutError(
+					f'LLM call timed out after {self.settings.llm_timeout} seconds. Keep your thinking and output short.'
+				)
 
-		self.state.last_model_output = model_output
+			self.state.last_model_output = model_output
 
-		# Check again for paused/stopped state after getting model output
-		await self._raise_if_stopped_or_paused()
+			# Check again for paused/stopped state after getting model output
+			await self._raise_if_stopped_or_paused()
 
-		# Handle callbacks and conversation saving
-		await self._handle_post_llm_processing(browser_state_summary, input_messages)
+			# Handle callbacks and conversation saving
+			await self._handle_post_llm_processing(browser_state_summary, input_messages)
 
-		# check again if Ctrl+C was pressed before we commit the output to history
-		await self._raise_if_stopped_or_paused()
+			# check again if Ctrl+C was pressed before we commit the output to history
+			await self._raise_if_stopped_or_paused()
+		except BaseException:
+			# the actions of this output will not be executed, so neither may an action started from its stream
+			await self._cancel_early_action()
+			raise
+
+	def _get_routing_signals(self) -> RoutingSignals:
+		"""How the previous step went, for a RoutingChatModel to pick the model of this step"""
+		assert self.browser_session is not None, 'BrowserSession is not set up'
+		page_change_signal = self.browser_session.page_change_signal
+		previous_signal, self._routing_page_change_signal = self._routing_page_change_signal, page_change_signal
+		return RoutingSignals(
+			step_number=self.state.n_steps,
+			consecutive_failures=self.state.consecutive_failures,
+			last_step_errors=sum(1 for result in self.state.last_result or [] if result.error),
+			page_changed=None
+			if previous_signal is None or page_change_signal is None
+			else not previous_signal.matches(page_change_signal),
+		)
 
 	async def _execute_actions(self) -> None:
 		"""Execute the actions from model output"""
@@ -788,11 +861,63 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			raise ValueError('No model output to execute actions from')
 
 		self.logger.debug(f'⚡ Step {self.state.n_steps}: Executing {len(self.state.last_model_output.action)} actions...')
-		result = await self.multi_act(self.state.last_model_output.action)
+		early_action_task, self._early_action_task = self._early_action_task, None
+		try:
+			result = await self.multi_act(self.state.last_model_output.action, early_action_task=early_action_task)
+		finally:
+			if early_action_task is not None and not early_action_task.done():
+				early_action_task.cancel()  # multi_act failed before it got to the first action
 		self.logger.debug(f'✅ Step {self.state.n_steps}: Actions completed')
 
 		self.state.last_result = result
 
+	def _start_browser_state_prefetch(self) -> None:
+		"""Start capturing the next step's browser state in the background (prefetch_browser_state=True)"""
+		if not self.settings.prefetch_browser_state or self.browser_session is None:
+			return
+		if self.state.last_result and self.state.last_result[-1].is_done:
+			return  # there is no next step
+		self._cancel_browser_state_prefetch()
+
+		browser_session = self.browser_session
+		# the capture updates the "new element" hashes, keep the old ones in case the prefetched state gets thrown away
+		self._clickable_element_hashes_before_prefetch = browser_session._cached_clickable_element_hashes
+
+		async def prefetch() -> tuple[BrowserStateSummary, PageChangeSignal | None]:
+			state = await browser_session.get_browser_state_with_recovery(
+				cache_clickable_elements_hashes=True, include_screenshot=self.settings.use_vision
+			)
+			return state, browser_session.page_change_signal
+
+		self._prefetched_browser_state_task = asyncio.create_task(prefetch())
+
+	async def _get_prefetched_browser_state(self) -> BrowserStateSummary | None:
+		"""Return the prefetched browser state, or None if there is none or the page changed since it was captured"""
+		prefetch_task, self._prefetched_browser_state_task = self._prefetched_browser_state_task, None
+		if prefetch_task is None:
+			return None
+		assert self.browser_session is not None, 'BrowserSession is not set up'
+
+		try:
+			browser_state_summary, page_change_signal = await prefetch_task
+			if page_change_signal is not None and page_change_signal.matches(
+				await self.browser_session.get_page_change_signal(wait_for_page_load=False)
+			):
+				self.logger.debug(f'⚡ Step {self.state.n_steps}: Using browser state prefetched during the last step')
+				return browser_state_summary
+			self.logger.debug(f'🔄 Step {self.state.n_steps}: Page changed since the browser state was prefetched, recapturing')
+		except Exception as e:
+			self.logger.debug(f'🔄 Step {self.state.n_steps}: Browser state prefetch failed, recapturing: {type(e).__name__}: {e}')
+
+		# the fresh capture has to see the same "new element" baseline as if the prefetch never happened
+		self.browser_session._cached_clickable_element_hashes = self._clickable_element_hashes_before_prefetch
+		return None
+
+	def _cancel_browser_state_prefetch(self) -> None:
+		prefetch_task, self._prefetched_browser_state_task = self._prefetched_browser_state_task, None
+		if prefetch_task is not None and not prefetch_task.done():
+			prefetch_task.cancel()
+
 	async def _post_process(self) -> None:
 		"""Handle post-action processing like download tracking and result logging"""
 		assert self.browser_session is not None, 'BrowserSession is not set up'
@@ -844,11 +969,14 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 				RateLimitError,  # OpenAI
 				ResourceExhausted,  # Google
 				AnthropicRateLimitError,  # Anthropic
+				ModelRateLimitError,  # any provider, mapped by our chat models
 			)
 
 			if isinstance(error, RATE_LIMIT_ERRORS) or 'on tokens per minute (TPM): Limit' in error_msg:
 				logger.warning(f'{prefix}{error_msg}')
-				await asyncio.sleep(self.settings.retry_delay)
+				# wait as long as the provider asked for (Retry-After) if it told us, the fixed retry_delay otherwise
+				retry_after = getattr(error, 'retry_after', None)
+				await asyncio.sleep(retry_after if retry_after is not None else self.settings.retry_delay)
 			else:
 				self.logger.error(f'{prefix}{error_msg}')
 
@@ -866,6 +994,10 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 				step_number=self.state.n_steps,
 				step_start_time=self.step_start_time,
 				step_end_time=step_end_time,
+				time_to_first_action=self._time_to_first_action,
+				prompt_tokens=self._step_llm_usage.prompt_tokens if self._step_llm_usage else None,
+				prompt_cached_tokens=self._step_llm_usage.prompt_cached_tokens if self._step_llm_usage else None,
+				action_schema_tokens=self._action_schema_tokens,
 			)
 
 			# Use _make_history_item like main branch
@@ -1018,8 +1150,19 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		"""Get next action from LLM based on current state"""
 
 		try:
-			response = await self.llm.ainvoke(input_messages, output_format=self.AgentOutput)
+			llm_call_start_time = time.time()
+			if self.settings.stream_actions and hasattr(self.llm, 'ainvoke_streaming'):
+				response = await self._get_model_output_streaming(input_messages, llm_call_start_time)
+			else:
+				response = await self.llm.ainvoke(input_messages, output_format=self.AgentOutput)
 			parsed = response.completion
+			if self._time_to_first_action is None:
+				self._time_to_first_action = time.time() - llm_call_start_time
+			self._step_llm_usage = response.usage
+			if response.usage and response.usage.prompt_cached_tokens is not None:
+				self.logger.debug(
+					f'💾 Step {self.state.n_steps}: {response.usage.prompt_cached_tokens}/{response.usage.prompt_tokens} prompt tokens read from the provider cache'
+				)
 
 			# cut the number of actions to max_actions_per_step if needed
 			if len(parsed.action) > self.settings.max_actions_per_step:
@@ -1034,6 +1177,51 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			# Just re-raise - Pydantic's validation errors are already descriptive
 			raise
 
+	async def _get_model_output_streaming(
+		self, input_messages: list[BaseMessage], llm_call_start_time: float
+	) -> ChatInvokeCompletion[AgentOutput]:
+		"""Stream the model output and hand the first action to _on_first_action_streamed() as soon as its JSON is complete"""
+		parser = IncrementalJSONArrayParser('action')
+
+		def on_text(chunk: str) -> None:
+			new_actions = parser.feed(chunk)
+			if new_actions and len(parser.items) == len(new_actions):
+				self._on_first_action_streamed(new_actions[0], llm_call_start_time)
+
+		return await self.llm.ainvoke_streaming(input_messages, self.AgentOutput, on_text)  # type: ignore[attr-defined]
+
+	def _on_first_action_streamed(self, action_data: dict[str, Any], llm_call_start_time: float) -> None:
+		"""Validate the first streamed action and start executing it while the rest of the response streams in"""
+		try:
+			action = self.ActionModel.model_validate(action_data)
+		except ValidationError as e:
+			self.logger.debug(f'First streamed action is not valid (yet), waiting for the full response: {e}')
+			return
+
+		self._time_to_first_action = time.time() - llm_call_start_time
+		self.logger.debug(f'⚡ Step {self.state.n_steps}: First action streamed after {self._time_to_first_action:.2f}s')
+
+		# done must only run once the whole output is validated, and only one action can be in flight
+		if 'done' in action.model_dump(exclude_unset=True) or self._early_action_task is not None:
+			return
+		if self.state.paused or self.state.stopped:
+			return
+		self._early_action_task = asyncio.create_task(self._act(action))
+
+	async def _cancel_early_action(self) -> None:
+		"""Stop an action that was started from a streamed response that then failed"""
+		early_action_task, self._early_action_task = self._early_action_task, None
+		if early_action_task is None:
+			return
+		if early_action_task.done():
+			self.logger.warning('⚠️ The first action already ran before the LLM response failed')
+			return
+		early_action_task.cancel()
+		try:
+			await early_action_task
+		except BaseException:
+			pass
+
 	def _log_agent_run(self) -> None:
 		"""Log the agent run"""
 		self.logger.info(f'🚀 Starting task...')
@@ -1423,18 +1611,21 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		self,
 		actions: list[ActionModel],
 		check_for_new_elements: bool = True,
+		early_action_task: asyncio.Task[ActionResult] | None = None,
 	) -> list[ActionResult]:
-		"""Execute multiple actions"""
+		"""Execute multiple actions (the first one may already have been started by early_action_task)"""
 		results: list[ActionResult] = []
 
 		assert self.browser_session is not None, 'BrowserSession is not set up'
 		cached_selector_map = {}
 		cached_path_hashes = set()
+		cached_page_change_signal = None
 		# check all actions if any has index, if so, get the selector map
 		for action in actions:
 			if action.get_index() is not None:
 				cached_selector_map = await self.browser_session.get_selector_map()
 				cached_path_hashes = {e.hash.branch_path_hash for e in cached_selector_map.values()}
+				cached_page_change_signal = self.browser_session.page_change_signal
 				break
 
 		# loop over actions and execute them
@@ -1446,7 +1637,14 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 					logger.info(msg)
 					break
 
-				if action.get_index() is not None:
+				if action.get_index() is not None and cached_page_change_signal is not None:
+					# cheap check first: if the page didn't change at all, the remaining indices are still valid
+					if cached_page_change_signal.matches(await self.browser_session.get_page_change_signal()):
+						self.logger.debug(f'⚡ Page unchanged after action {i} / {len(actions)}, skipping DOM re-extraction')
+					else:
+						cached_page_change_signal = None  # once the page changed, always do the full check below
+
+				if action.get_index() is not None and cached_page_change_signal is None:
 					new_browser_state_summary = await self.browser_session.get_browser_state_with_recovery(
 						cache_clickable_elements_hashes=False, include_screenshot=False
 					)
@@ -1487,17 +1685,11 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 				await asyncio.sleep(self.browser_profile.wait_between_actions)
 
 			try:
-				await self._raise_if_stopped_or_paused()
-
-				result = await self.controller.act(
-					action=action,
-					browser_session=self.browser_session,
-					file_system=self.file_system,
-					page_extraction_llm=self.settings.page_extraction_llm,
-					sensitive_data=self.sensitive_data,
-					available_file_paths=self.available_file_paths,
-					context=self.context,
-				)
+				if i == 0 and early_action_task is not None:
+					result = await early_action_task
+				else:
+					await self._raise_if_stopped_or_paused()
+					result = await self._act(action)
 
 				results.append(result)
 
@@ -1529,6 +1721,19 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 		return results
 
+	async def _act(self, action: ActionModel) -> ActionResult:
+		"""Execute a single action with the agent's context"""
+		assert self.browser_session is not None, 'BrowserSession is not set up'
+		return await self.controller.act(
+			action=action,
+			browser_session=self.browser_session,
+			file_system=self.file_system,
+			page_extraction_llm=self.settings.page_extraction_llm,
+			sensitive_data=self.sensitive_data,
+			available_file_paths=self.available_file_paths,
+			context=self.context,
+		)
+
 	async def log_completion(self) -> None:
 		"""Log the completion of the task"""
 		if self.history.is_successful():
@@ -1751,6 +1956,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 	async def close(self):
 		"""Close all resources"""
 		try:
+			self._cancel_browser_state_prefetch()
+
 			# First close browser resources
 			assert self.browser_session is not None, 'BrowserSession is not set up'
 			await self.browser_session.stop()
@@ -1761,26 +1968,34 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		except Exception as e:
 			self.logger.error(f'Error during cleanup: {e}')
 
-	async def _update_action_models_for_page(self, page) -> None:
+	async def _update_action_models_for_page(self, page, browser_state_summary: BrowserStateSummary | None = None) -> None:
 		"""Update action models with page-specific actions"""
+		excluded_actions = None
+		if self.settings.action_subset_policy is not None and browser_state_summary is not None:
+			excluded_actions = self.settings.action_subset_policy.get_excluded_actions(
+				ActionSubsetContext(browser_state=browser_state_summary, available_file_paths=self.available_file_paths or [])
+			)
+
 		# Create new action model with current page's filtered actions
-		self.ActionModel = self.controller.registry.create_action_model(page=page)
+		# (the registry and _get_agent_output_type cache these, so this is a dict lookup unless the action set changed)
+		self.ActionModel = self.controller.registry.create_action_model(page=page, exclude_actions=excluded_actions)
 		# Update output model with the new actions
-		if self.settings.flash_mode:
-			self.AgentOutput = AgentOutput.type_with_custom_actions_flash_mode(self.ActionModel)
-		elif self.settings.use_thinking:
-			self.AgentOutput = AgentOutput.type_with_custom_actions(self.ActionModel)
-		else:
-			self.AgentOutput = AgentOutput.type_with_custom_actions_no_thinking(self.ActionModel)
+		self.AgentOutput = self._get_agent_output_type(self.ActionModel)
+		self._action_schema_tokens = SchemaOptimizer.estimate_tokens(self.AgentOutput)
+
+		left_out = sorted((excluded_actions or set()) & self.controller.registry.registry.actions.keys())
+		if left_out:
+			full_schema_tokens = SchemaOptimizer.estimate_tokens(
+				self._get_agent_output_type(self.controller.registry.create_action_model(page=page))
+			)
+			self.logger.debug(
+				f'✂️ Step {self.state.n_steps}: Left {", ".join(left_out)} out of the action schema, '
+				f'~{self._action_schema_tokens} schema tokens instead of ~{full_schema_tokens}'
+			)
 
 		# Update done action model too
 		self.DoneActionModel = self.controller.registry.create_action_model(include_actions=['done'], page=page)
-		if self.settings.flash_mode:
-			self.DoneAgentOutput = AgentOutput.type_with_custom_actions_flash_mode(self.DoneActionModel)
-		elif self.settings.use_thinking:
-			self.DoneAgentOutput = AgentOutput.type_with_custom_actions(self.DoneActionModel)
-		else:
-			self.DoneAgentOutput = AgentOutput.type_with_custom_actions_no_thinking(self.DoneActionModel)
+		self.DoneAgentOutput = self._get_agent_output_type(self.DoneActionModel)
 
 	def get_trace_object(self) -> dict[str, Any]:
 		"""Get the trace and trace_details objects for the agent"""
@@ -14,7 +14,7 @@ from uuid_extensions import uuid7str
 
 from browser_use.agent.message_manager.views import MessageManagerState
 from browser_use.browser.views import BrowserStateHistory
-from browser_use.controller.registry.views import ActionModel
+from browser_use.controller.registry.views import ActionModel, ActionSubsetPolicy
 from browser_use.dom.history_tree_processor.service import (
 	DOMElementNode,
 	DOMHistoryElement,
@@ -56,6 +56,8 @@ class AgentSettings(BaseModel):
 	use_thinking: bool = True
 	flash_mode: bool = False  # If enabled, disables evaluation_previous_goal and next_goal, and sets use_thinking = False
 	max_history_items: int = 40
+	max_history_tokens: int | None = None  # Compact the oldest history items into a summary once the history exceeds this
+	history_summary_llm: BaseChatModel | None = None  # Writes that summary (default: deterministic truncation, no LLM call)
 
 	page_extraction_llm: BaseChatModel | None = None
 	planner_llm: BaseChatModel | None = None
@@ -66,6 +68,11 @@ class AgentSettings(BaseModel):
 	include_tool_call_examples: bool = False
 	llm_timeout: int = 60  # Timeout in seconds for LLM calls
 	step_timeout: int = 180  # Timeout in seconds for each step
+	stream_actions: bool = False  # Stream the LLM output (if supported) and start the first action before the rest arrives
+	prefetch_browser_state: bool = False  # Capture the next step's browser state in the background while the step wraps up
+	cache_friendly_prompt: bool = False  # Put the stable task + history first so providers can reuse the cached prompt prefix
+	# Leave actions the current step cannot use out of the schema (holds rule functions, so it is left out of serialized settings)
+	action_subset_policy: ActionSubsetPolicy | None = Field(default=None, exclude=True)
 
 
 class AgentState(BaseModel):
@@ -139,12 +146,23 @@ class StepMetadata(BaseModel):
 	step_start_time: float
 	step_end_time: float
 	step_number: int
+	time_to_first_action: float | None = None  # seconds from calling the LLM until the first action was available
+	prompt_tokens: int | None = None  # prompt tokens of the step's LLM call (if the provider reported usage)
+	prompt_cached_tokens: int | None = None  # how many of them were served from the provider's prompt cache
+	action_schema_tokens: int | None = None  # estimated prompt tokens of the output schema (with the offered actions)
 
 	@property
 	def duration_seconds(self) -> float:
 		"""Calculate step duration in seconds"""
 		return self.step_end_time - self.step_start_time
 
+	@property
+	def prompt_cache_hit_rate(self) -> float | None:
+		"""Share of the step's prompt tokens that were read from the provider's prompt cache"""
+		if not self.prompt_tokens or self.prompt_cached_tokens is None:
+			return None
+		return self.prompt_cached_tokens / self.prompt_tokens
+
 
 class AgentBrain(BaseModel):
 	thinking: str | None = None
@@ -0,0 +1,273 @@
+"""
+A pool of warm browsers that hands out a fresh, isolated BrowserContext to each task.
+
+Launching chromium costs 1-3s per task, so instead of every Agent run launching and killing its own browser:
+
+	pool = BrowserSessionPool(browser_profile=BrowserProfile(headless=True), size=4)
+	await pool.start()
+
+	async with pool.lease() as browser_session:
+		agent = Agent(task=..., llm=..., browser_session=browser_session)
+		await agent.run()
+
+	await pool.stop()
+
+Every lease is a BrowserSession.new_isolated_session() of a pooled browser: a brand new context (no cookies/storage/pages
+leak between tasks) that is closed when the lease is released. The browser underneath is health-checked before it's
+handed out and retired after `max_leases_per_browser` leases or `max_memory_growth_mb`.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+import psutil
+
+from browser_use.browser.profile import BrowserProfile
+from browser_use.browser.session import DEFAULT_BROWSER_PROFILE, BrowserSession
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PooledBrowser:
+	"""A warm browser owned by the pool, plus the bookkeeping needed to decide when to retire it"""
+
+	session: BrowserSession  # the owner session, launched with keep_alive=True so leases can never kill it
+	baseline_rss_mb: float | None = None
+	leases: int = 0
+	launched_at: float = field(default_factory=time.time)
+	spare_session: BrowserSession | None = None  # clean isolated session pre-created for the next lease
+
+
+def _get_process_tree_rss_mb(pid: int | None) -> float | None:
+	"""Total resident memory of a browser process and all its helper/renderer subprocesses"""
+	if not pid:
+		return None
+	try:
+		proc = psutil.Process(pid)
+		total = proc.memory_info().rss
+		for child in proc.children(recursive=True):
+			try:
+				total += child.memory_info().rss
+			except (psutil.NoSuchProcess, psutil.AccessDenied):
+				pass
+		return total / 1024 / 1024
+	except (psutil.NoSuchProcess, psutil.AccessDenied):
+		return None
+
+
+class BrowserSessionPool:
+	"""Keeps `size` browsers warm and leases a clean BrowserSession (own context) on top of them to each task"""
+
+	def __init__(
+		self,
+		browser_profile: BrowserProfile | None = None,
+		size: int = 2,
+		max_leases_per_browser: int | None = 50,
+		max_memory_growth_mb: float | None = None,
+		health_check_timeout: float = 5.0,
+	):
+		assert size >= 1, 'BrowserSessionPool size must be >= 1'
+		self.browser_profile = browser_profile or DEFAULT_BROWSER_PROFILE
+		self.size = size
+		self.max_leases_per_browser = max_leases_per_browser
+		self.max_memory_growth_mb = max_memory_growth_mb
+		self.health_check_timeout = health_check_timeout
+
+		# None entries are free slots that need a browser launched before they can be leased
+		self._idle: asyncio.Queue[PooledBrowser | None] = asyncio.Queue()
+		self._browsers: set[int] = set()  # id()s of all live PooledBrowsers, used to ignore stale releases after stop()
+		self._leased: dict[str, PooledBrowser] = {}  # lease BrowserSession.id -> PooledBrowser it runs on
+		self._background_tasks: set[asyncio.Task] = set()
+		self._started = False
+		self._closed = False
+
+		self.stats = {'leases': 0, 'launched': 0, 'retired': 0, 'unhealthy': 0}
+
+	def __repr__(self) -> str:
+		return f'BrowserSessionPool(size={self.size}, idle={self._idle.qsize()}, leased={len(self._leased)})'
+
+	async def start(self) -> 'BrowserSessionPool':
+		"""Launch all the browsers in the pool up front so the first leases are warm"""
+		if self._started:
+			return self
+		self._started = True
+		self._closed = False
+		self._idle = asyncio.Queue()
+		results = await asyncio.gather(*(self._launch_browser() for _ in range(self.size)), return_exceptions=True)
+		for result in results:
+			if isinstance(result, BaseException):
+				logger.warning(f'⚠️ Failed to pre-launch pooled browser: {type(result).__name__}: {result}')
+				self._idle.put_nowait(None)  # will be retried lazily on the next acquire()
+			else:
+				self._idle.put_nowait(result)
+		return self
+
+	async def stop(self) -> None:
+		"""Kill every browser in the pool, including ones that are currently leased out"""
+		self._closed = True
+		self._started = False
+		for task in list(self._background_tasks):
+			task.cancel()
+
+		entries: list[PooledBrowser] = list(self._leased.values())
+		while not self._idle.empty():
+			entry = self._idle.get_nowait()
+			if entry is not None:
+				entries.append(entry)
+		self._leased.clear()
+
+		await asyncio.gather(*(self._close_browser(entry) for entry in entries), return_exceptions=True)
+
+		# wake up anyone still waiting in acquire() so they fail instead of hanging forever
+		for _ in range(self.size):
+			self._idle.put_nowait(None)
+
+	async def __aenter__(self) -> 'BrowserSessionPool':
+		return await self.start()
+
+	async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+		await self.stop()
+
+	@asynccontextmanager
+	async def lease(self) -> AsyncIterator[BrowserSession]:
+		"""Lease a BrowserSession for the duration of the block, it's released (and its context wiped) on exit"""
+		browser_session = await self.acquire()
+		try:
+			yield browser_session
+		finally:
+			await self.release(browser_session)
+
+	async def acquire(self) -> BrowserSession:
+		"""Wait for a free browser and return a new BrowserSession with its own clean context on top of it"""
+		if not self._started:
+			await self.start()
+
+		while True:
+			entry = await self._idle.get()
+			if self._closed:
+				raise RuntimeError('BrowserSessionPool has been stopped')
+			if entry is None:
+				try:
+					entry = await self._launch_browser()
+				except Exception:
+					self._idle.put_nowait(None)  # give the slot back so other waiters don't deadlock
+					raise
+
+			try:
+				browser_session = await self._create_lease(entry)
+			except Exception as e:
+				logger.warning(f'⚠️ Pooled browser failed to open a new context, retiring it: {type(e).__name__}: {e}')
+				self.stats['unhealthy'] += 1
+				self._retire(entry)
+				continue
+
+			# reuse the existing responsiveness probe before trusting the browser with a task
+			assert browser_session.agent_current_page is not None
+			if not await browser_session._is_page_responsive(
+				browser_session.agent_current_page, timeout=self.health_check_timeout
+			):
+				logger.warning(f'⚠️ Pooled browser {entry.session} is unresponsive, retiring it')
+				self.stats['unhealthy'] += 1
+				await self._stop_lease(browser_session)
+				self._retire(entry)
+				continue
+
+			entry.leases += 1
+			self.stats['leases'] += 1
+			self._leased[browser_session.id] = entry
+			return browser_session
+
+	async def release(self, browser_session: BrowserSession) -> None:
+		"""Wipe the leased context and give the browser back to the pool (or retire it if it's used up)"""
+		entry = self._leased.pop(browser_session.id, None)
+		await self._stop_lease(browser_session)
+		if entry is None or id(entry) not in self._browsers:
+			return  # lease from before the pool was stopped, or released twice
+
+		reason = self._get_retirement_reason(entry)
+		if reason:
+			logger.debug(f'♻️ Retiring pooled browser {entry.session} after {entry.leases} leases ({reason})')
+			self._retire(entry)
+			return
+
+		# pre-create the next clean session now so the next acquire() doesn't have to wait for it
+		try:
+			entry.spare_session = await self._new_lease_session(entry)
+		except Exception as e:
+			logger.warning(f'⚠️ Pooled browser failed to reset its context, retiring it: {type(e).__name__}: {e}')
+			self.stats['unhealthy'] += 1
+			self._retire(entry)
+			return
+		self._idle.put_nowait(entry)
+
+	def _get_retirement_reason(self, entry: PooledBrowser) -> str | None:
+		browser = entry.session.browser
+		if not browser or not browser.is_connected():
+			return 'disconnected'
+		if self.max_leases_per_browser and entry.leases >= self.max_leases_per_browser:
+			return f'max_leases_per_browser={self.max_leases_per_browser}'
+		if self.max_memory_growth_mb and entry.baseline_rss_mb is not None:
+			rss_mb = _get_process_tree_rss_mb(entry.session.browser_pid)
+			if rss_mb is not None and rss_mb - entry.baseline_rss_mb > self.max_memory_growth_mb:
+				return f'memory grew {rss_mb - entry.baseline_rss_mb:.0f}MB > max_memory_growth_mb={self.max_memory_growth_mb}'
+		return None
+
+	async def _launch_browser(self) -> PooledBrowser:
+		# pooled browsers never touch the persistent user_data_dir, every lease gets its own incognito-style context anyway
+		# (template_user_data_dir is still honored, each pooled browser gets its own clone of it)
+		session = BrowserSession(browser_profile=self.browser_profile, keep_alive=True, user_data_dir=None)
+		await session.start()
+		entry = PooledBrowser(session=session, baseline_rss_mb=_get_process_tree_rss_mb(session.browser_pid))
+		self._browsers.add(id(entry))
+		self.stats['launched'] += 1
+		logger.debug(f'🏊 Launched pooled browser {session} ({len(self._browsers)}/{self.size} warm)')
+		return entry
+
+	async def _new_lease_session(self, entry: PooledBrowser) -> BrowserSession:
+		# new_isolated_session() would relaunch a dead browser in place, a pooled one gets retired instead
+		browser = entry.session.browser
+		if not browser or not browser.is_connected():
+			raise RuntimeError('Pooled browser is disconnected')
+		# the isolated session owns its context but never the pooled browser, so it can never close the browser
+		return await entry.session.new_isolated_session(browser_profile=self.browser_profile)
+
+	async def _create_lease(self, entry: PooledBrowser) -> BrowserSession:
+		browser_session, entry.spare_session = entry.spare_session, None
+		return browser_session or await self._new_lease_session(entry)
+
+	async def _stop_lease(self, browser_session: BrowserSession) -> None:
+		"""Close the lease's own context (a no-op if the task already stopped the session)"""
+		try:
+			await browser_session.stop()
+		except Exception as e:
+			logger.debug(f'Failed to close leased browser_context: {type(e).__name__}: {e}')
+
+	def _retire(self, entry: PooledBrowser) -> None:
+		"""Kill a pooled browser and launch a replacement for its slot in the background"""
+		self.stats['retired'] += 1
+		self._browsers.discard(id(entry))
+		task = asyncio.create_task(self._replace_browser(entry))
+		self._background_tasks.add(task)
+		task.add_done_callback(self._background_tasks.discard)
+
+	async def _replace_browser(self, entry: PooledBrowser) -> None:
+		await self._close_browser(entry)
+		if self._closed:
+			return
+		try:
+			self._idle.put_nowait(await self._launch_browser())
+		except Exception as e:
+			logger.warning(f'⚠️ Failed to launch replacement pooled browser: {type(e).__name__}: {e}')
+			self._idle.put_nowait(None)  # acquire() will try again
+
+	async def _close_browser(self, entry: PooledBrowser) -> None:
+		self._browsers.discard(id(entry))
+		try:
+			await entry.session.kill()
+		except Exception as e:
+			logger.debug(f'Failed to kill pooled browser {entry.session}: {type(e).__name__}: {e}')
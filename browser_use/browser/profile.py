@@ -584,6 +584,14 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 	wait_for_network_idle_page_load_time: float = Field(default=0.5, description='Time to wait for network idle.')
 	maximum_wait_page_load_time: float = Field(default=5.0, description='Maximum time to wait for page load.')
 	wait_between_actions: float = Field(default=0.5, description='Time to wait between actions.')
+	page_watchdog: bool = Field(
+		default=True,
+		description='Listen for CDP crash/detach/dialog events on every page to detect and recover from failures immediately, instead of waiting for a responsiveness probe to time out.',
+	)
+	page_health_check_ttl: float = Field(
+		default=2.0,
+		description='Seconds to trust a successful page responsiveness check before probing the page again (0 to probe before every call). Navigation, crashes and timeouts always invalidate it.',
+	)
 
 	# --- UI/viewport/DOM ---
 	include_dynamic_attributes: bool = Field(default=True, description='Include dynamic attributes in selectors.')
@@ -591,6 +599,14 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 	viewport_expansion: int = Field(default=500, description='Viewport expansion in pixels for LLM context.')
 
 	profile_directory: str = 'Default'  # e.g. 'Profile 1', 'Profile 2', 'Custom Profile', etc.
+	template_user_data_dir: str | Path | None = Field(
+		default=None,
+		description='Prepared user_data_dir to clone for every new browser (takes precedence over user_data_dir). The template is never modified, each session gets its own throwaway copy.',
+	)
+	template_clone_strategy: Literal['auto', 'reflink', 'hardlink', 'copy'] = Field(
+		default='auto',
+		description='How to clone template_user_data_dir: auto tries copy-on-write reflinks, then hardlinks (only for files Chrome never modifies in place, the rest is copied), then a full copy.',
+	)
 
 	# these can be found in BrowserLaunchArgs, BrowserLaunchPersistentContextArgs, BrowserNewContextArgs, BrowserConnectArgs:
 	# save_recording_path: alias of record_video_dir
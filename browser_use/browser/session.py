@@ -9,7 +9,9 @@ import re
 import shutil
 import tempfile
 import time
-from dataclasses import dataclass
+import weakref
+from collections import deque
+from dataclasses import dataclass, replace
 from functools import wraps
 from pathlib import Path
 from typing import Any, Self
@@ -45,11 +47,19 @@ from browser_use.browser.types import (
 	async_patchright,
 	async_playwright,
 )
+from browser_use.browser.user_data_dir import (
+	TEMPLATE_CLONE_PREFIX,
+	clone_template_user_data_dir,
+	remove_user_data_dir_in_background,
+)
 from browser_use.browser.views import (
 	PLACEHOLDER_4PX_SCREENSHOT,
 	BrowserError,
 	BrowserStateSummary,
+	PageChangeSignal,
+	PageFailureType,
 	PageInfo,
+	PageRecoveryIncident,
 	TabInfo,
 	URLNotAllowedError,
 )
@@ -66,6 +76,8 @@ from browser_use.utils import (
 	time_execution_sync,
 )
 
+_USER_DATA_DIR_CLEANUP_TASKS: set[asyncio.Task] = set()  # hold strong refs to background cleanup tasks until they finish
+
 _GLOB_WARNING_SHOWN = False  # used inside _is_url_allowed to avoid spamming the logs with the same warning multiple times
 
 GLOBAL_PLAYWRIGHT_API_OBJECT = None  # never instantiate the playwright API object more than once per thread
@@ -75,6 +87,8 @@ GLOBAL_PATCHRIGHT_EVENT_LOOP = None  # track which event loop the global objects
 
 MAX_SCREENSHOT_HEIGHT = 2000
 MAX_SCREENSHOT_WIDTH = 1920
+# seconds the page watchdog leaves a JS dialog to playwright (or a page.on('dialog') listener) before dismissing it itself
+JAVASCRIPT_DIALOG_GRACE_SECONDS = 2.0
 
 
 def _log_glob_warning(domain: str, glob: str, logger: logging.Logger):
@@ -115,6 +129,10 @@ def require_healthy_browser(usable_page=True, reopen_page=True):
 					# raise RuntimeError('BrowserSession(...).start() must be called first to launch or connect to the browser')
 					await self.start()  # just start it automatically if not already started
 
+				# the page watchdog already told us the page crashed/detached, recover right away instead of waiting for a probe to time out
+				if self.agent_current_page and not self._in_recovery and self.agent_current_page in self._page_failures:
+					await self._recover_from_page_failure(self._page_failures.pop(self.agent_current_page), func.__name__)
+
 				if not self.agent_current_page or self.agent_current_page.is_closed():
 					self.agent_current_page = (
 						self.browser_context.pages[0] if (self.browser_context and len(self.browser_context.pages) > 0) else None
@@ -142,7 +160,7 @@ def require_healthy_browser(usable_page=True, reopen_page=True):
 				# Check page responsiveness if usable_page=True
 				if usable_page:
 					# Skip if already in recovery to prevent infinite recursion
-					if hasattr(self, '_in_recovery') and self._in_recovery:
+					if self._in_recovery:
 						# self.logger.debug('Already in recovery, skipping responsiveness check')
 						return await func(self, *args, **kwargs)
 
@@ -151,13 +169,16 @@ def require_healthy_browser(usable_page=True, reopen_page=True):
 						# self.logger.debug('Skipping responsiveness check for about:blank page')
 						return await func(self, *args, **kwargs)
 
-					# Check if page is responsive
+					# Check if page is responsive (trusting a recent successful check to avoid a JS round trip per call)
 					# self.logger.debug(f'Checking page responsiveness for {func.__name__}...')
-					if await self._is_page_responsive(self.agent_current_page):
-						# self.logger.debug('✅ Confirmed page is responsive')
+					if self._is_page_health_cached(self.agent_current_page):
 						pass
+					elif await self._is_page_responsive(self.agent_current_page):
+						# self.logger.debug('✅ Confirmed page is responsive')
+						self._mark_page_healthy(self.agent_current_page)
 					else:
 						# Page is unresponsive - handle recovery
+						self._invalidate_page_health()
 						if not reopen_page:
 							self.logger.warning(
 								'⚠️ Page unresponsive but @require_healthy_browser(reopen_page=False), attempting to continue anyway...'
@@ -181,6 +202,9 @@ def require_healthy_browser(usable_page=True, reopen_page=True):
 				return await func(self, *args, **kwargs)
 
 			except Exception as e:
+				# any failure (timeouts especially) means we can't keep trusting the last health check
+				self._invalidate_page_health()
+
 				# Check if this is a TargetClosedError or similar connection error
 				if 'TargetClosedError' in str(type(e)) or 'browser has been closed' in str(e):
 					self.logger.warning(
@@ -198,6 +222,27 @@ def require_healthy_browser(usable_page=True, reopen_page=True):
 DEFAULT_BROWSER_PROFILE = BrowserProfile()
 
 
+# Installs (once per document) a MutationObserver counting changes that can add/remove/show/hide interactive elements,
+# and returns the document's random id + the current count + the scroll position (which decides what's in the viewport).
+# Used to skip DOM re-extraction when nothing changed.
+DOM_CHANGE_COUNTER_JS = """() => {
+	let counter = window.__browserUseDomChanges;
+	if (!counter) {
+		counter = window.__browserUseDomChanges = {id: Math.random().toString(36).slice(2), generation: 0};
+		new MutationObserver((records) => { counter.generation += records.length; }).observe(document, {
+			subtree: true,
+			childList: true,
+			attributes: true,
+			attributeFilter: [
+				'class', 'style', 'hidden', 'disabled', 'open', 'type', 'role', 'href', 'tabindex', 'contenteditable',
+				'aria-hidden', 'aria-expanded', 'aria-disabled', 'aria-selected', 'aria-checked',
+			],
+		});
+	}
+	return {id: counter.id, generation: counter.generation, scrollX: Math.round(window.scrollX), scrollY: Math.round(window.scrollY)};
+}"""
+
+
 @dataclass
 class CachedClickableElementHashes:
 	"""
@@ -297,9 +342,19 @@ class BrowserSession(BaseModel):
 	_downloaded_files: list[str] = PrivateAttr(default_factory=list)
 	_original_browser_session: Any = PrivateAttr(default=None)  # Reference to prevent GC of the original session when copied
 	_owns_browser_resources: bool = PrivateAttr(default=True)  # True if this instance owns and should clean up browser resources
+	_owns_browser_context: bool = PrivateAttr(default=False)  # True if this instance created its own context in a shared browser
 	_auto_download_pdfs: bool = PrivateAttr(default=True)  # Auto-download PDFs when detected
 	_subprocess: Any = PrivateAttr(default=None)  # Chrome subprocess reference for error handling
 	_current_page_loading_status: str | None = PrivateAttr(default=None)  # Track loading status for current page
+	_healthy_page: Page | None = PrivateAttr(default=None)  # page that last passed the responsiveness check
+	_healthy_page_checked_at: float = PrivateAttr(default=0.0)  # time.monotonic() of that check
+	_page_health_watched_pages: Any = PrivateAttr(default_factory=weakref.WeakSet)  # pages with invalidation listeners attached
+	_page_watchdog_pages: Any = PrivateAttr(default_factory=weakref.WeakSet)  # pages with a CDP watchdog session attached
+	_page_failures: Any = PrivateAttr(default_factory=weakref.WeakKeyDictionary)  # Page -> PageRecoveryIncident awaiting recovery
+	_page_recovery_incidents: deque[PageRecoveryIncident] = PrivateAttr(default_factory=lambda: deque(maxlen=100))
+	_page_watchdog_tasks: set[asyncio.Task] = PrivateAttr(default_factory=set)
+	_cached_page_change_signal: PageChangeSignal | None = PrivateAttr(default=None)  # page fingerprint at the last DOM extraction
+	_in_recovery: bool = PrivateAttr(default=False)  # True while _recover_unresponsive_page()/_recover_from_page_failure() run
 
 	@model_validator(mode='after')
 	def apply_session_overrides_to_profile(self) -> Self:
@@ -406,6 +461,7 @@ class BrowserSession(BaseModel):
 			setup_results = await asyncio.gather(
 				self._setup_viewports(),
 				self._setup_current_page_change_listeners(),
+				self._setup_page_watchdog(),
 				self._start_context_tracing(),
 				return_exceptions=True,
 			)
@@ -462,6 +518,17 @@ class BrowserSession(BaseModel):
 
 		# Only the owner can actually stop the browser
 		if not self._owns_browser_resources:
+			# but sessions sharing a browser with their own isolated context must still close that context
+			if self._owns_browser_context and self.browser_context:
+				self.logger.info(f'🛑 Closing isolated browser_context in shared browser {_hint} {self.browser_context}')
+				try:
+					await self._close_browser_context()
+				except Exception as e:
+					if 'has been closed' not in str(e):
+						self.logger.warning(f'❌ Error closing isolated browser_context: {type(e).__name__}: {e}')
+				self._owns_browser_context = False
+				self._reset_connection_state()
+				return
 			self.logger.debug(f'🔗 BrowserSession.stop() called on a copy, not closing shared browser resources {_hint}')
 			# Still reset our references though
 			self._reset_connection_state()
@@ -522,9 +589,9 @@ class BrowserSession(BaseModel):
 					self.logger.debug(f'❌ Error terminating subprocess: {type(e).__name__}: {e}')
 				self.browser_pid = None
 
-		# Clean up temporary user data directory
+		# Clean up temporary user data directory (in the background, cloned template profiles can be large)
 		if self.browser_profile.user_data_dir and Path(self.browser_profile.user_data_dir).name.startswith('browseruse-tmp'):
-			shutil.rmtree(self.browser_profile.user_data_dir, ignore_errors=True)
+			self._schedule_user_data_dir_cleanup(self.browser_profile.user_data_dir)
 
 		# Clear CDP/WSS URLs when stopping the browser
 		self.cdp_url = None
@@ -532,6 +599,17 @@ class BrowserSession(BaseModel):
 
 		self._reset_connection_state()
 
+	def _schedule_user_data_dir_cleanup(self, user_data_dir: str | Path) -> None:
+		"""Delete a throwaway user_data_dir without blocking stop(), falls back to deleting it inline if no loop is running"""
+		try:
+			task = asyncio.get_running_loop().create_task(remove_user_data_dir_in_background(user_data_dir))
+		except RuntimeError:
+			shutil.rmtree(user_data_dir, ignore_errors=True)
+			return
+		_USER_DATA_DIR_CLEANUP_TASKS.add(task)
+		task.add_done_callback(_USER_DATA_DIR_CLEANUP_TASKS.discard)
+		self.logger.debug(f'🧹 Removing tmp user_data_dir= {_log_pretty_path(user_data_dir)} in the background')
+
 	async def close(self) -> None:
 		"""Deprecated: Provides backwards-compatibility with old method Browser().close() and playwright BrowserContext.close()"""
 		await self.stop(_hint='(close() called)')
@@ -547,6 +625,42 @@ class BrowserSession(BaseModel):
 		# do not stop self.playwright here as its likely used by other parallel browser_sessions
 		# let it be cleaned up by the garbage collector when no refs use it anymore
 
+	async def new_isolated_session(self, browser_profile: BrowserProfile | None = None, **kwargs) -> BrowserSession:
+		"""Create a new BrowserSession that shares this session's browser process but has its own isolated BrowserContext.
+
+		Each isolated session gets separate cookies/storage/cache and can use its own proxy, viewport, storage_state, etc.
+		(any BrowserProfile fields can be passed as kwargs overrides). Stopping it only closes its own context, the shared
+		browser keeps running until this (parent) session is stopped. Use this to run many parallel agents in one browser:
+
+			browser_session = BrowserSession(keep_alive=True, user_data_dir=None)
+			await browser_session.start()
+			agents = [
+				Agent(task=task, llm=llm, browser_session=await browser_session.new_isolated_session())
+				for task in tasks
+			]
+		"""
+		if not self.initialized or not self.browser or not self.browser.is_connected():
+			await self.start()
+		assert self.browser, 'Cannot create isolated sessions without a Browser object (e.g. connected to a persistent context)'
+
+		# isolated sessions close their context when they're done by default, the parent's keep_alive only protects the browser
+		kwargs.setdefault('keep_alive', False)
+		isolated_session = BrowserSession(
+			browser_profile=browser_profile or self.browser_profile,
+			playwright=self.playwright,
+			browser=self.browser,
+			browser_pid=self.browser_pid,
+			**kwargs,
+		)
+		isolated_session.browser_context = await self.browser.new_context(
+			**isolated_session.browser_profile.kwargs_for_new_context().model_dump(mode='json')
+		)
+		isolated_session._owns_browser_context = True
+		isolated_session._original_browser_session = self  # keep the browser owner alive as long as any isolated session is
+		self.logger.debug(f'🫧 Created isolated browser_context for {isolated_session} in shared browser {self._connection_str}')
+		await isolated_session.start()
+		return isolated_session
+
 	async def new_context(self, **kwargs):
 		"""Deprecated: Provides backwards-compatibility with old class method Browser().new_context()."""
 		# TODO: remove this after >=0.3.0
@@ -583,8 +697,9 @@ class BrowserSession(BaseModel):
 		# Create the copy using the parent class method
 		copy = super().model_copy(**kwargs)
 
-		# The copy doesn't own the browser resources
+		# The copy doesn't own the browser resources (or an isolated context the original created)
 		copy._owns_browser_resources = False
+		copy._owns_browser_context = False
 
 		# Keep a reference to the original to prevent garbage collection
 		copy._original_browser_session = self
@@ -598,6 +713,18 @@ class BrowserSession(BaseModel):
 		copy.human_current_page = self.human_current_page
 		copy.browser_pid = self.browser_pid
 
+		# pydantic copies private attributes shallowly, so give the copy its own page health/watchdog state instead
+		# of sharing (and mutating) the original's sets and maps; it attaches its own listeners to the pages it uses
+		copy._healthy_page = None
+		copy._healthy_page_checked_at = 0.0
+		copy._page_health_watched_pages = weakref.WeakSet()
+		copy._page_watchdog_pages = weakref.WeakSet()
+		copy._page_failures = weakref.WeakKeyDictionary()
+		copy._page_recovery_incidents = deque(maxlen=self._page_recovery_incidents.maxlen)
+		copy._page_watchdog_tasks = set()
+		copy._cached_page_change_signal = None
+		copy._in_recovery = False
+
 		return copy
 
 	def __del__(self):
@@ -1169,8 +1296,14 @@ class BrowserSession(BaseModel):
 				f'user_data_dir= {_log_pretty_path(self.browser_profile.user_data_dir) or "<incognito>"}'
 			)
 
+			# if a template profile is provided, clone it into a fresh throwaway user_data_dir for this browser
+			if self.browser_profile.template_user_data_dir:
+				old_dir = self.browser_profile.user_data_dir
+				await self._clone_template_user_data_dir()
+				if old_dir and Path(old_dir).name.startswith('browseruse-tmp-'):
+					self._schedule_user_data_dir_cleanup(old_dir)
 			# if no user_data_dir is provided, generate a unique one for this temporary browser_context (will be used to uniquely identify the browser_pid later)
-			if not self.browser_profile.user_data_dir:
+			elif not self.browser_profile.user_data_dir:
 				# self.logger.debug('🌎 Launching local browser in incognito mode')
 				# if no user_data_dir is provided, generate a unique one for this temporary browser_context (will be used to uniquely identify the browser_pid later)
 				self.browser_profile.user_data_dir = self.browser_profile.user_data_dir or Path(
@@ -1817,9 +1950,11 @@ class BrowserSession(BaseModel):
 		self.initialized = False
 		self.browser = None
 		self.browser_context = None
+		self._invalidate_page_health()
 		self.agent_current_page = None
 		self.human_current_page = None
 		self._cached_clickable_element_hashes = None
+		self._cached_page_change_signal = None
 		# Reset CDP connection info when browser is stopped
 		self.browser_pid = None
 		self._cached_browser_state_summary = None
@@ -1901,6 +2036,22 @@ class BrowserSession(BaseModel):
 		# because it might be stale. Only actual running processes count as conflicts.
 		return False
 
+	async def _clone_template_user_data_dir(self) -> None:
+		"""Point user_data_dir at a fresh copy-on-write clone of browser_profile.template_user_data_dir"""
+		assert self.browser_profile.template_user_data_dir, 'browser_profile.template_user_data_dir is not set'
+		start_time = time.time()
+		# cloning walks and copies the whole profile, keep it off the event loop
+		clone_dir, strategy = await asyncio.to_thread(
+			clone_template_user_data_dir,
+			self.browser_profile.template_user_data_dir,
+			strategy=self.browser_profile.template_clone_strategy,
+		)
+		self.browser_profile.user_data_dir = clone_dir
+		self.logger.info(
+			f'🐑 Cloned template_user_data_dir= {_log_pretty_path(self.browser_profile.template_user_data_dir)} ➡️ '
+			f'{_log_pretty_path(clone_dir)} via {strategy} in {time.time() - start_time:.2f}s'
+		)
+
 	def _fallback_to_temp_profile(self, reason: str = 'SingletonLock conflict') -> None:
 		"""Fallback to a temporary profile directory when the current one is locked.
 
@@ -1908,7 +2059,10 @@ class BrowserSession(BaseModel):
 			reason: Human-readable reason for the fallback
 		"""
 		old_dir = self.browser_profile.user_data_dir
+		# with a template_user_data_dir the relaunch clones the template again and removes this temp dir
 		self.browser_profile.user_data_dir = Path(tempfile.mkdtemp(prefix='browseruse-tmp-singleton-'))
+		if old_dir and Path(old_dir).name.startswith(TEMPLATE_CLONE_PREFIX):
+			self._schedule_user_data_dir_cleanup(old_dir)  # nothing else would ever remove the abandoned clone
 		self.logger.warning(
 			f'⚠️ {reason} detected. Profile at {_log_pretty_path(old_dir)} is locked. '
 			f'Using temporary profile instead: {_log_pretty_path(self.browser_profile.user_data_dir)}'
@@ -3181,8 +3335,14 @@ class BrowserSession(BaseModel):
 			when screenshots are not needed (e.g., in multi_act element validation).
 		"""
 
+		# read the DOM change counter *before* extracting, so any mutation during/after extraction shows up as a change later
+		page = await self.get_current_page()
+		page_change_signal = await self._read_page_change_signal(page)
+
 		updated_state = await self._get_updated_state(include_screenshot=include_screenshot)
 
+		self._cached_page_change_signal = replace(page_change_signal, url=updated_state.url)
+
 		# Find out which elements are new
 		# Do this only if url has not changed
 		if cache_clickable_elements_hashes:
@@ -3210,6 +3370,41 @@ class BrowserSession(BaseModel):
 
 		return self._cached_browser_state_summary
 
+	@property
+	def page_change_signal(self) -> PageChangeSignal | None:
+		"""Fingerprint of the page taken when the current cached browser state (and selector map) was extracted"""
+		return self._cached_page_change_signal
+
+	@time_execution_async('--get_page_change_signal')
+	async def get_page_change_signal(self, wait_for_page_load: bool = True) -> PageChangeSignal:
+		"""Get a fresh fingerprint of the current page without extracting the DOM (1 JS evaluate instead of a full extraction).
+
+		Compare it to page_change_signal to check whether the cached selector map is still valid for the page:
+			browser_session.page_change_signal.matches(await browser_session.get_page_change_signal())
+		"""
+		if wait_for_page_load:
+			# give any requests/transitions kicked off by the last action a chance to land first, same as a full state capture would
+			await self._wait_for_page_and_frames_load()
+		page = await self.get_current_page()
+		return await self._read_page_change_signal(page)
+
+	async def _read_page_change_signal(self, page: Page) -> PageChangeSignal:
+		"""Read the DOM change counter of the page, document_id/dom_generation are None if it can't be read (= changed)"""
+		unknown = PageChangeSignal(url=page.url, document_id=None, dom_generation=None)
+		if is_new_tab_page(page.url) or page.url.startswith('chrome://'):
+			return unknown  # new tab pages can hang when evaluating scripts
+		try:
+			counter = await asyncio.wait_for(page.evaluate(DOM_CHANGE_COUNTER_JS), timeout=2.0)
+			return PageChangeSignal(
+				url=page.url,
+				document_id=str(counter['id']),
+				dom_generation=int(counter['generation']),
+				scroll_position=(int(counter.get('scrollX', 0)), int(counter.get('scrollY', 0))),
+			)
+		except Exception as e:
+			self.logger.debug(f'Failed to read DOM change counter on {_log_pretty_url(page.url)}: {type(e).__name__}: {e}')
+			return unknown
+
 	@observe_debug(ignore_input=True, ignore_output=True, name='get_minimal_state_summary')
 	@require_healthy_browser(usable_page=True, reopen_page=True)
 	@time_execution_async('--get_minimal_state_summary')
@@ -3465,6 +3660,185 @@ class BrowserSession(BaseModel):
 			raise
 
 	# region - Page Health Check Helpers
+	def _is_page_health_cached(self, page: Page) -> bool:
+		"""Check if the page passed a responsiveness check recently enough (within browser_profile.page_health_check_ttl)"""
+		ttl = self.browser_profile.page_health_check_ttl
+		return bool(ttl > 0 and page is self._healthy_page and time.monotonic() - self._healthy_page_checked_at < ttl)
+
+	def _mark_page_healthy(self, page: Page) -> None:
+		"""Remember a successful responsiveness check, and make sure navigations/crashes on the page invalidate it"""
+		self._healthy_page = page
+		self._healthy_page_checked_at = time.monotonic()
+
+		if page not in self._page_health_watched_pages:
+			self._page_health_watched_pages.add(page)
+
+			def _on_framenavigated(frame) -> None:
+				if frame == page.main_frame and self._healthy_page is page:
+					self._invalidate_page_health()
+
+			def _on_crash_or_close(_page) -> None:
+				if self._healthy_page is page:
+					self._invalidate_page_health()
+
+			page.on('framenavigated', _on_framenavigated)
+			page.on('crash', _on_crash_or_close)  # fired by playwright on CDP Inspector.targetCrashed
+			page.on('close', _on_crash_or_close)
+
+	def _invalidate_page_health(self) -> None:
+		"""Forget the last successful responsiveness check, the next @require_healthy_browser call will probe the page again"""
+		self._healthy_page = None
+		self._healthy_page_checked_at = 0.0
+
+	@property
+	def page_recovery_incidents(self) -> list[PageRecoveryIncident]:
+		"""The most recent (up to 100) page failures and how long each took to recover from"""
+		return list(self._page_recovery_incidents)
+
+	async def _setup_page_watchdog(self) -> None:
+		"""Attach a CDP watchdog to every current and future page in the context (see _attach_page_watchdog)"""
+		if not self.browser_profile.page_watchdog:
+			return
+		assert self.browser_context is not None, 'BrowserContext object is not set'
+		self.browser_context.on('page', self._attach_page_watchdog)
+		await asyncio.gather(*(self._attach_page_watchdog(page) for page in self.browser_context.pages), return_exceptions=True)
+
+	async def _attach_page_watchdog(self, page: Page) -> None:
+		"""Subscribe to CDP events that tell us immediately when a page crashes, detaches, or gets blocked by a JS dialog.
+
+		Without this we only find out once a responsiveness probe or a playwright call has already timed out.
+		"""
+		if page in self._page_watchdog_pages or page.is_closed() or not self.browser_context:
+			return
+		self._page_watchdog_pages.add(page)
+
+		try:
+			cdp_session = await self.browser_context.new_cdp_session(page)  # type: ignore
+		except Exception as e:
+			self.logger.debug(f'🐕 Failed to attach page watchdog to 🅟 {str(id(page))[-2:]}: {type(e).__name__}: {e}')
+			return
+
+		def _on_target_crashed(_params: dict) -> None:
+			self._on_page_failure(page, 'crash', reason='Inspector.targetCrashed')
+
+		def _on_detached(params: dict) -> None:
+			reason = params.get('reason', '')
+			# 'Render process gone.' is a crash, anything else (target_closed, replaced_with_devtools) is a detach
+			self._on_page_failure(page, 'crash' if 'gone' in reason.lower() else 'detached', reason=reason)
+
+		dialog_closed = asyncio.Event()
+
+		def _on_dialog_opening(params: dict) -> None:
+			dialog_closed.clear()
+			task = asyncio.create_task(self._dismiss_javascript_dialog(page, cdp_session, params, dialog_closed))
+			self._page_watchdog_tasks.add(task)
+			task.add_done_callback(self._page_watchdog_tasks.discard)
+
+		def _on_dialog_closed(_params: dict) -> None:
+			dialog_closed.set()
+
+		cdp_session.on('Inspector.targetCrashed', _on_target_crashed)
+		cdp_session.on('Inspector.detached', _on_detached)
+		cdp_session.on('Page.javascriptDialogOpening', _on_dialog_opening)
+		cdp_session.on('Page.javascriptDialogClosed', _on_dialog_closed)
+		try:
+			await asyncio.gather(cdp_session.send('Inspector.enable'), cdp_session.send('Page.enable'))
+		except Exception as e:
+			self.logger.debug(f'🐕 Failed to enable page watchdog events on 🅟 {str(id(page))[-2:]}: {type(e).__name__}: {e}')
+
+	def _on_page_failure(self, page: Page, failure: PageFailureType, reason: str | None = None) -> None:
+		"""Record a failure reported by the page watchdog, it gets recovered from on the next @require_healthy_browser call"""
+		if page is self._healthy_page:
+			self._invalidate_page_health()
+		# deliberate tab closes also detach, only the agent's own page going away needs recovery
+		if page is not self.agent_current_page or self._in_recovery or page in self._page_failures:
+			return
+
+		strategy = {'crash': 'reopen_url', 'detached': 'switch_tab'}[failure]
+		try:
+			url = page.url
+		except Exception:
+			url = 'unknown'
+		self.logger.warning(
+			f'💥 Page watchdog detected {failure} ({reason}) on {_log_pretty_url(url)}, will recover via {strategy}'
+		)
+		self._page_failures[page] = PageRecoveryIncident(
+			failure=failure, url=url, strategy=strategy, detected_at=time.monotonic(), reason=reason
+		)
+
+	async def _dismiss_javascript_dialog(
+		self, page: Page, cdp_session: Any, params: dict, dialog_closed: asyncio.Event | None = None
+	) -> None:
+		"""alert()/confirm()/prompt() block every JS evaluation on the page until handled, so dismiss any left open.
+
+		Playwright dismisses dialogs itself when the page has no 'dialog' listener, and a listener handles them otherwise,
+		so only dismiss a dialog that is still open after JAVASCRIPT_DIALOG_GRACE_SECONDS instead of racing them.
+		"""
+		if dialog_closed is not None:
+			try:
+				await asyncio.wait_for(dialog_closed.wait(), timeout=JAVASCRIPT_DIALOG_GRACE_SECONDS)
+				return  # handled by playwright or the page's dialog listener
+			except TimeoutError:
+				pass
+
+		dialog_type = params.get('type', 'alert')
+		incident = PageRecoveryIncident(
+			failure='dialog',
+			url=params.get('url') or page.url,
+			strategy='accept_dialog' if dialog_type == 'beforeunload' else 'dismiss_dialog',
+			detected_at=time.monotonic(),
+			reason=f'{dialog_type}: {params.get("message", "")[:100]}',
+		)
+		try:
+			# accept beforeunload so navigations/closes proceed, dismiss everything else (same as playwright's default)
+			await cdp_session.send('Page.handleJavaScriptDialog', {'accept': dialog_type == 'beforeunload'})
+			incident.success = True
+		except Exception as e:
+			# it may have been closed in the meantime, either way the page is no longer blocked
+			incident.success = 'No dialog is showing' in str(e)
+		incident.recovered_at = time.monotonic()
+		self._record_page_recovery_incident(incident)
+
+	async def _recover_from_page_failure(self, incident: PageRecoveryIncident, calling_method: str) -> None:
+		"""Run the single recovery strategy picked for a failure the page watchdog reported"""
+		self.logger.warning(
+			f'🚑 Recovering from page {incident.failure} via {incident.strategy} before {calling_method}() on {_log_pretty_url(incident.url)}...'
+		)
+		self._in_recovery = True
+		try:
+			failed_page = self.agent_current_page
+			self.agent_current_page = None
+			if failed_page is self.human_current_page:
+				self.human_current_page = None
+
+			if incident.strategy == 'reopen_url':
+				# the renderer is gone, so there's no point waiting for it: close the tab and load the URL once in a fresh one
+				if failed_page and not failed_page.is_closed():
+					try:
+						await asyncio.wait_for(failed_page.close(), timeout=2.0)
+					except Exception:
+						pass
+				if not await self._try_reopen_url(incident.url):
+					await self._create_blank_fallback_page(incident.url)
+			else:
+				# the tab is already gone, just move over to another open tab (or a new one, see @require_healthy_browser)
+				open_pages = [
+					page for page in (self.browser_context.pages if self.browser_context else []) if not page.is_closed()
+				]
+				self.agent_current_page = open_pages[-1] if open_pages else None
+			incident.success = True
+		finally:
+			self._in_recovery = False
+			incident.recovered_at = time.monotonic()
+			self._record_page_recovery_incident(incident)
+
+	def _record_page_recovery_incident(self, incident: PageRecoveryIncident) -> None:
+		self._page_recovery_incidents.append(incident)
+		status = '✅ Recovered' if incident.success else '❌ Failed to recover'
+		self.logger.info(
+			f'{status} from page {incident.failure} via {incident.strategy} in {incident.recovery_time or 0:.2f}s: {_log_pretty_url(incident.url)}'
+		)
+
 	@observe_debug(ignore_input=True)
 	async def _is_page_responsive(self, page: Page, timeout: float = 5.0) -> bool:
 		"""Check if a page is responsive by trying to evaluate simple JavaScript."""
@@ -3684,6 +4058,14 @@ class BrowserSession(BaseModel):
 
 		# Prevent re-entrance
 		self._in_recovery = True
+		self._invalidate_page_health()
+		incident = PageRecoveryIncident(
+			failure='unresponsive',
+			url=self.agent_current_page.url if self.agent_current_page else 'unknown',
+			strategy='force_close_and_reopen',
+			detected_at=time.monotonic(),
+			reason=f'responsiveness probe timed out in {calling_method}()',
+		)
 		try:
 			# Get current URL before recovery
 			assert self.agent_current_page, 'Agent current page is not set'
@@ -3721,6 +4103,7 @@ class BrowserSession(BaseModel):
 			self.logger.debug('🍼 Page Recovery Step 2/3: Trying to reopen the URL again...')
 			if await self._try_reopen_url(current_url, timeout_ms=timeout_ms):
 				self.logger.debug('✅ Page Recovery Step 3/3: Page loading succeeded after 2nd attempt!')
+				incident.success = True
 				return  # Success!
 
 			# If that failed, fall back to blank page
@@ -3728,10 +4111,13 @@ class BrowserSession(BaseModel):
 				'❌ Page Recovery Step 3/3: Loading the page a 2nd time failed as well, browser seems unable to load this URL without getting stuck, retreating to a safe page...'
 			)
 			await self._create_blank_fallback_page(current_url)
+			incident.success = True
 
 		finally:
 			# Always clear recovery flag
 			self._in_recovery = False
+			incident.recovered_at = time.monotonic()
+			self._record_page_recovery_incident(incident)
 
 	# region - Browser Actions
 	@observe_debug(name='take_screenshot', ignore_output=True)
@@ -0,0 +1,166 @@
+"""
+Helpers for cloning a prepared "template" user_data_dir into a throwaway per-session copy.
+
+Copying a warmed Chrome profile (hundreds of MB of caches, cookies, consents) for every parallel
+browser is slow, so we try the cheapest strategy that the filesystem supports first:
+
+	1. reflink:  whole-tree copy-on-write clone (btrfs, xfs, APFS, zfs w/ block cloning)
+	2. hardlink: hardlink the files Chrome never modifies in place, real copies of everything else
+	3. copy:     plain recursive copy
+
+Clones are always created next to the template (same filesystem) so reflinks/hardlinks are possible.
+"""
+
+import asyncio
+import fnmatch
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Literal
+
+from browser_use.utils import _log_pretty_path
+
+logger = logging.getLogger(__name__)
+
+CloneStrategy = Literal['auto', 'reflink', 'hardlink', 'copy']
+
+TEMPLATE_CLONE_PREFIX = 'browseruse-tmp-template-'
+
+# files that must never be carried over into a clone (they belong to the browser that owns the template)
+SKIPPED_FILE_PATTERNS = ('SingletonLock', 'SingletonSocket', 'SingletonCookie', 'lockfile', 'LOCK', '.browseruse_profile_id')
+
+# the only files a hardlink clone shares with the template: files Chrome never modifies in place once written
+# (it only deletes them or writes a new file). Anything else may be written in place, and a shared inode would let
+# one session corrupt the template for all others, so everything else is copied.
+IMMUTABLE_FILE_PATTERNS = (
+	'*.ldb',  # LevelDB tables (Local Storage, IndexedDB, extension state, ...)
+	'*.sst',
+	'*.bdic',  # spellcheck dictionaries
+)
+# unpacked extensions: updates go into a new version directory (their json metadata is rewritten, so it is copied)
+IMMUTABLE_DIR_NAMES = ('Extensions',)
+
+
+def _is_skipped_file(name: str) -> bool:
+	return any(fnmatch.fnmatchcase(name, pattern) for pattern in SKIPPED_FILE_PATTERNS)
+
+
+def _is_immutable_file(path: Path, template: Path) -> bool:
+	"""Check if Chrome is known to never modify this file in place, so it is safe to share it via a hardlink"""
+	if any(fnmatch.fnmatchcase(path.name, pattern) for pattern in IMMUTABLE_FILE_PATTERNS):
+		return True
+	in_immutable_dir = any(part in IMMUTABLE_DIR_NAMES for part in path.relative_to(template).parent.parts)
+	return in_immutable_dir and not fnmatch.fnmatchcase(path.name, '*.json')
+
+
+def _remove_skipped_files(root: Path) -> None:
+	for dirpath, _dirnames, filenames in os.walk(root):
+		for filename in filenames:
+			if _is_skipped_file(filename):
+				try:
+					os.unlink(os.path.join(dirpath, filename))
+				except OSError:
+					pass
+
+
+def _clone_via_reflink(template: Path, dest: Path) -> None:
+	"""Clone the whole tree with copy-on-write reflinks, raises if the filesystem does not support them"""
+	if sys.platform == 'darwin':
+		cmd = ['cp', '-c', '-R', f'{template}/.', str(dest)]  # clonefile() on APFS
+	elif sys.platform.startswith('linux'):
+		cmd = ['cp', '-a', '--reflink=always', f'{template}/.', str(dest)]
+	else:
+		raise OSError(f'reflink cloning is not supported on {sys.platform}')
+
+	result = subprocess.run(cmd, capture_output=True, text=True)
+	if result.returncode != 0:
+		raise OSError(f'reflink clone failed: {result.stderr.strip()}')
+	_remove_skipped_files(dest)
+
+
+def _clone_via_hardlinks(template: Path, dest: Path) -> None:
+	"""Hardlink the files Chrome never modifies in place (see IMMUTABLE_FILE_PATTERNS), and copy everything else"""
+	for dirpath, dirnames, filenames in os.walk(template):
+		rel_dir = Path(dirpath).relative_to(template)
+		target_dir = dest / rel_dir
+		target_dir.mkdir(parents=True, exist_ok=True)
+
+		for dirname in list(dirnames):
+			src_dir = Path(dirpath) / dirname
+			if src_dir.is_symlink():
+				os.symlink(os.readlink(src_dir), target_dir / dirname)
+				dirnames.remove(dirname)  # don't descend into symlinked dirs
+
+		for filename in filenames:
+			if _is_skipped_file(filename):
+				continue
+			src = Path(dirpath) / filename
+			dst = target_dir / filename
+			if src.is_symlink():
+				os.symlink(os.readlink(src), dst)
+			elif _is_immutable_file(src, template):
+				os.link(src, dst)
+			else:
+				shutil.copy2(src, dst)
+
+
+def _clone_via_copy(template: Path, dest: Path) -> None:
+	shutil.copytree(
+		template,
+		dest,
+		symlinks=True,
+		ignore_dangling_symlinks=True,
+		dirs_exist_ok=True,
+		ignore=lambda _dir, names: [name for name in names if _is_skipped_file(name)],
+	)
+
+
+CLONE_STRATEGIES = {
+	'reflink': _clone_via_reflink,
+	'hardlink': _clone_via_hardlinks,
+	'copy': _clone_via_copy,
+}
+
+
+def clone_template_user_data_dir(
+	template_dir: str | Path, strategy: CloneStrategy = 'auto', parent_dir: str | Path | None = None
+) -> tuple[Path, str]:
+	"""Clone a template user_data_dir into a new unique directory.
+
+	Args:
+		template_dir: Prepared user_data_dir to clone (never modified)
+		strategy: 'auto' tries reflink -> hardlink -> copy, anything else forces that strategy
+		parent_dir: Where to create the clone, defaults to the template's parent so reflinks/hardlinks work
+
+	Returns:
+		(path of the new clone, name of the strategy that was used)
+	"""
+	template = Path(template_dir).expanduser().resolve()
+	if not template.is_dir():
+		raise ValueError(f'template_user_data_dir= {_log_pretty_path(template)} does not exist or is not a directory')
+
+	parent = Path(parent_dir).expanduser().resolve() if parent_dir else template.parent
+	parent.mkdir(parents=True, exist_ok=True)
+
+	strategies = list(CLONE_STRATEGIES) if strategy == 'auto' else [strategy]
+	last_error: Exception | None = None
+	for name in strategies:
+		dest = Path(tempfile.mkdtemp(prefix=TEMPLATE_CLONE_PREFIX, dir=parent))
+		try:
+			CLONE_STRATEGIES[name](template, dest)
+			return dest, name
+		except Exception as e:
+			last_error = e
+			logger.debug(f'Failed to clone {_log_pretty_path(template)} via {name}: {type(e).__name__}: {e}')
+			shutil.rmtree(dest, ignore_errors=True)
+
+	raise OSError(f'Failed to clone template_user_data_dir= {_log_pretty_path(template)} via {strategies}') from last_error
+
+
+async def remove_user_data_dir_in_background(path: str | Path) -> None:
+	"""Delete a throwaway user_data_dir in a worker thread so it doesn't block the event loop"""
+	await asyncio.to_thread(shutil.rmtree, Path(path), ignore_errors=True)
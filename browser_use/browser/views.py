@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel
 
@@ -107,6 +107,42 @@ class BrowserStateHistory:
 		return data
 
 
+@dataclass(frozen=True)
+class PageChangeSignal:
+	"""Cheap fingerprint of the page used to tell whether it changed since the last full DOM extraction"""
+
+	url: str
+	document_id: str | None  # random id assigned per document, changes on every navigation/reload
+	# number of DOM mutations observed in that document so far, covers every change that can affect the selector map
+	dom_generation: int | None
+	scroll_position: tuple[int, int] | None = None  # (x, y), scrolling changes which elements are in the viewport
+
+	def matches(self, other: 'PageChangeSignal | None') -> bool:
+		"""True only if both signals are known and nothing about the page changed between them"""
+		return other is not None and self.document_id is not None and self.dom_generation is not None and self == other
+
+
+PageFailureType = Literal['crash', 'detached', 'dialog', 'unresponsive']
+
+
+@dataclass
+class PageRecoveryIncident:
+	"""A page failure detected by the page watchdog or health check, and how long it took to recover from it"""
+
+	failure: PageFailureType
+	url: str
+	strategy: str  # the single recovery strategy chosen for this failure type
+	detected_at: float  # time.monotonic()
+	recovered_at: float | None = None
+	success: bool = False
+	reason: str | None = None  # extra detail from CDP, e.g. Inspector.detached reason or the dialog type
+
+	@property
+	def recovery_time(self) -> float | None:
+		"""Seconds between detecting the failure and the page being usable again"""
+		return None if self.recovered_at is None else self.recovered_at - self.detected_at
+
+
 class BrowserError(Exception):
 	"""Base class for all browser errors"""
 
@@ -3,16 +3,18 @@ import functools
 import inspect
 import logging
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Collection
+from enum import Enum
 from inspect import Parameter, iscoroutinefunction, signature
 from types import UnionType
-from typing import Any, Generic, Optional, TypeVar, Union, get_args, get_origin
+from typing import Annotated, Any, Generic, Literal, Optional, TypeVar, Union, get_args, get_origin
 
 from pydantic import BaseModel, Field, RootModel, create_model
 
 from browser_use.browser import BrowserSession
 from browser_use.browser.types import Page
 from browser_use.controller.registry.views import (
+	ActionDispatchPlan,
 	ActionModel,
 	ActionRegistry,
 	RegisteredAction,
@@ -29,6 +31,36 @@ Context = TypeVar('Context')
 logger = logging.getLogger(__name__)
 
 
+def _can_hold_string(annotation: Any, _seen: set[type] | None = None) -> bool:
+	"""Whether a value of the given type annotation can contain a string (and so a <secret> placeholder)"""
+	if annotation is None or annotation is type(None):
+		return False
+	origin = get_origin(annotation)
+	if origin is Literal:
+		return False  # fixed values chosen by us, not by the LLM
+	if origin is Annotated:
+		return _can_hold_string(get_args(annotation)[0], _seen)
+	if origin is not None:
+		# containers and unions, e.g. list[str], dict[str, int], int | None
+		args = get_args(annotation)
+		return not args or any(_can_hold_string(arg, _seen) for arg in args)
+	if inspect.isclass(annotation):
+		if issubclass(annotation, Enum):
+			return False
+		if issubclass(annotation, str):
+			return True
+		if issubclass(annotation, (bool, int, float, bytes)):
+			return False
+		if issubclass(annotation, BaseModel):
+			_seen = _seen if _seen is not None else set()
+			if annotation in _seen:
+				return False  # recursive model, its fields are already being checked
+			_seen.add(annotation)
+			return any(_can_hold_string(field.annotation, _seen) for field in annotation.model_fields.values())
+	# str, Any, bare list/dict, custom classes, forward references, ...: assume it can
+	return True
+
+
 class Registry(Generic[Context]):
 	"""Service for registering and managing actions"""
 
@@ -36,6 +68,8 @@ class Registry(Generic[Context]):
 		self.registry = ActionRegistry()
 		self.telemetry = ProductTelemetry()
 		self.exclude_actions = exclude_actions if exclude_actions is not None else []
+		# generated ActionModels keyed by the set of action names they contain, so each distinct action set is only built once
+		self._action_model_cache: dict[frozenset[str], tuple[tuple[RegisteredAction, ...], type[ActionModel]]] = {}
 
 	def _get_special_param_types(self) -> dict[str, type | UnionType | None]:
 		"""Get the expected types for special parameters from SpecialActionParameters"""
@@ -302,6 +336,7 @@ class Registry(Generic[Context]):
 				domains=final_domains,
 				page_filter=page_filter,
 			)
+			action.dispatch_plan = self._build_dispatch_plan(action)
 			self.registry.actions[func.__name__] = action
 
 			# Return the normalized function so it can be called with kwargs
@@ -328,6 +363,9 @@ class Registry(Generic[Context]):
 			raise ValueError(f'Action {action_name} not found')
 
 		action = self.registry.actions[action_name]
+		plan = action.dispatch_plan
+		if plan is None:
+			plan = action.dispatch_plan = self._build_dispatch_plan(action)
 		try:
 			# Create the validated Pydantic model
 			try:
@@ -335,7 +373,10 @@ class Registry(Generic[Context]):
 			except Exception as e:
 				raise ValueError(f'Invalid parameters {params} for action {action_name}: {type(e)}: {e}') from e
 
-			if sensitive_data:
+			# only walk the params if a field that can hold strings actually contains a placeholder
+			if sensitive_data and any(
+				'<secret>' in str(getattr(validated_params, name, '')) for name in plan.secret_param_fields
+			):
 				# Get current URL if browser_session is provided
 				current_url = None
 				if browser_session:
@@ -346,8 +387,8 @@ class Registry(Generic[Context]):
 						current_url = current_page.url if current_page else None
 				validated_params = self._replace_sensitive_data(validated_params, sensitive_data, current_url)
 
-			# Build special context dict
-			special_context = {
+			# Build special context dict, with only the special parameters the action takes
+			special_values = {
 				'context': context,
 				'browser_session': browser_session,
 				'browser': browser_session,  # legacy support
@@ -357,13 +398,11 @@ class Registry(Generic[Context]):
 				'has_sensitive_data': action_name == 'input_text' and bool(sensitive_data),
 				'file_system': file_system,
 			}
+			special_context = {name: special_values[name] for name in plan.special_param_names if name in special_values}
 
 			# Handle async page parameter if needed
-			if browser_session:
-				# Check if function signature includes 'page' parameter
-				sig = signature(action.function)
-				if 'page' in sig.parameters:
-					special_context['page'] = await browser_session.get_current_page()
+			if browser_session and plan.needs_page:
+				special_context['page'] = await browser_session.get_current_page()
 
 			# All functions are now normalized to accept kwargs only
 			# Call with params and unpacked special context
@@ -392,6 +431,18 @@ class Registry(Generic[Context]):
 		except Exception as e:
 			raise RuntimeError(f'Error executing action {action_name}: {str(e)}') from e
 
+	def _build_dispatch_plan(self, action: RegisteredAction) -> ActionDispatchPlan:
+		"""Work out once which special parameters an action needs and which of its params can hold <secret> placeholders"""
+		parameters = signature(action.function).parameters
+		special_param_names = frozenset(name for name in parameters if name in self._get_special_param_types())
+		return ActionDispatchPlan(
+			special_param_names=special_param_names,
+			needs_page='page' in special_param_names,
+			secret_param_fields=frozenset(
+				name for name, field in action.param_model.model_fields.items() if _can_hold_string(field.annotation)
+			),
+		)
+
 	def _log_sensitive_data_usage(self, placeholders_used: set[str], current_url: str | None) -> None:
 		"""Log when sensitive data is being used on a page"""
 		if placeholders_used:
@@ -471,14 +522,19 @@ class Registry(Generic[Context]):
 		return type(params).model_validate(processed_params)
 
 	# @time_execution_sync('--create_action_model')
-	def create_action_model(self, include_actions: list[str] | None = None, page=None) -> type[ActionModel]:
+	def create_action_model(
+		self, include_actions: list[str] | None = None, page=None, exclude_actions: Collection[str] | None = None
+	) -> type[ActionModel]:
 		"""Creates a Union of individual action models from registered actions,
 		used by LLM APIs that support tool calling & enforce a schema.
 
 		Each action model contains only the specific action being used,
 		rather than all actions with most set to None.
+
+		exclude_actions leaves actions out for this call only, e.g. the ones an ActionSubsetPolicy excluded for a step.
+
+		Models are cached per distinct set of available actions, so repeated calls return the same class.
 		"""
-		from typing import Union
 
 		# Filter actions based on page if provided:
 		#   if page is None, only include actions with no filters
@@ -488,6 +544,8 @@ class Registry(Generic[Context]):
 		for name, action in self.registry.actions.items():
 			if include_actions is not None and name not in include_actions:
 				continue
+			if exclude_actions is not None and name in exclude_actions:
+				continue
 
 			# If no page provided, only include actions with no filters
 			if page is None:
@@ -503,6 +561,25 @@ class Registry(Generic[Context]):
 			if domain_is_allowed and page_is_allowed:
 				available_actions[name] = action
 
+		# Most steps end up with the same filtered action set, reuse the model built for it last time.
+		# The cached entry is only valid if every action is still the exact same registered object (actions can be re-registered)
+		cache_key = frozenset(available_actions)
+		cached = self._action_model_cache.get(cache_key)
+		if cached is not None:
+			cached_actions, cached_model = cached
+			if len(cached_actions) == len(available_actions) and all(
+				cached_action is action for cached_action, action in zip(cached_actions, available_actions.values())
+			):
+				return cached_model
+
+		result_model = self._build_action_model(available_actions)
+		self._action_model_cache[cache_key] = (tuple(available_actions.values()), result_model)
+		return result_model
+
+	def _build_action_model(self, available_actions: dict[str, RegisteredAction]) -> type[ActionModel]:
+		"""Build the (Union) ActionModel for exactly the given actions"""
+		from typing import Union
+
 		# Create individual action models for each action
 		individual_action_models: list[type[BaseModel]] = []
 
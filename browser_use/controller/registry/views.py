@@ -1,16 +1,31 @@
+import logging
 from collections.abc import Callable
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, ConfigDict
 
 from browser_use.browser import BrowserSession
 from browser_use.browser.types import Page
+from browser_use.browser.views import BrowserStateSummary
 from browser_use.filesystem.file_system import FileSystem
 from browser_use.llm.base import BaseChatModel
 
 if TYPE_CHECKING:
 	pass
 
+logger = logging.getLogger(__name__)
+
+
+class ActionDispatchPlan(BaseModel):
+	"""What Registry.execute_action() has to prepare for an action, computed once instead of on every call"""
+
+	special_param_names: frozenset[str]  # special parameters the action function takes (injected by the registry)
+	needs_page: bool  # the action takes the current page, which has to be looked up before every call
+	secret_param_fields: frozenset[str]  # param_model fields that can hold strings, i.e. <secret> placeholders
+
+	model_config = ConfigDict(frozen=True)
+
 
 class RegisteredAction(BaseModel):
 	"""Model for a registered action"""
@@ -24,6 +39,8 @@ class RegisteredAction(BaseModel):
 	domains: list[str] | None = None  # e.g. ['*.google.com', 'www.bing.com', 'yahoo.*]
 	page_filter: Callable[[Page], bool] | None = None
 
+	dispatch_plan: ActionDispatchPlan | None = None  # set by Registry.action(), built on first use otherwise
+
 	model_config = ConfigDict(arbitrary_types_allowed=True)
 
 	def prompt_description(self) -> str:
@@ -179,3 +196,66 @@ class SpecialActionParameters(BaseModel):
 	def get_browser_requiring_params(cls) -> set[str]:
 		"""Get parameter names that require browser_session"""
 		return {'browser_session', 'browser', 'browser_context', 'page'}
+
+
+@dataclass
+class ActionSubsetContext:
+	"""What an ActionSubsetPolicy rule knows about the current step"""
+
+	browser_state: BrowserStateSummary
+	available_file_paths: list[str] = field(default_factory=list)
+
+
+def _has_dropdowns(context: ActionSubsetContext) -> bool:
+	"""A native <select> or an ARIA dropdown / menu the dropdown actions can be pointed at"""
+	for element in context.browser_state.selector_map.values():
+		if element.tag_name.lower() == 'select' or 'aria-haspopup' in element.attributes:
+			return True
+		if element.attributes.get('role') in ('listbox', 'combobox', 'menu', 'menubar'):
+			return True
+	return False
+
+
+def _has_multiple_tabs(context: ActionSubsetContext) -> bool:
+	return len(context.browser_state.tabs) > 1
+
+
+def _has_available_files(context: ActionSubsetContext) -> bool:
+	"""upload_file only accepts paths from available_file_paths"""
+	return bool(context.available_file_paths)
+
+
+# action name -> whether the action is useful in the current step
+DEFAULT_ACTION_SUBSET_RULES: dict[str, Callable[[ActionSubsetContext], bool]] = {
+	'get_dropdown_options': _has_dropdowns,
+	'select_dropdown_option': _has_dropdowns,
+	'switch_tab': _has_multiple_tabs,
+	'close_tab': _has_multiple_tabs,
+	'upload_file': _has_available_files,
+}
+
+
+@dataclass
+class ActionSubsetPolicy:
+	"""
+	Per-step rules that leave actions out of the action schema sent to the LLM when the current step cannot use them.
+
+	Complements the static `domains` / `page_filter` of each action (e.g. Google Sheets actions are only offered on
+	docs.google.com) with rules on the browser state, e.g. no dropdown actions on a page without dropdowns.
+	Actions without a rule are always offered. Add rules for custom actions with:
+		ActionSubsetPolicy(rules={**DEFAULT_ACTION_SUBSET_RULES, 'my_action': lambda context: ...})
+	"""
+
+	rules: dict[str, Callable[[ActionSubsetContext], bool]] = field(default_factory=lambda: dict(DEFAULT_ACTION_SUBSET_RULES))
+
+	def get_excluded_actions(self, context: ActionSubsetContext) -> frozenset[str]:
+		"""Names of the actions to leave out of this step's action schema"""
+		excluded = set()
+		for name, rule in self.rules.items():
+			try:
+				if not rule(context):
+					excluded.add(name)
+			except Exception as e:
+				# a broken rule must not take an action away from the agent
+				logger.debug(f'Action subset rule for {name} failed, keeping the action: {type(e).__name__}: {e}')
+		return frozenset(excluded)
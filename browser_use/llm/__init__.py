@@ -14,6 +14,9 @@ from browser_use.llm.messages import (
 	SystemMessage,
 	UserMessage,
 )
+from browser_use.llm.messages import (
+	ContentPartImageBytesParam as ContentImageBytes,
+)
 from browser_use.llm.messages import (
 	ContentPartImageParam as ContentImage,
 )
@@ -30,12 +33,17 @@ if TYPE_CHECKING:
 	from browser_use.llm.aws.chat_anthropic import ChatAnthropicBedrock
 	from browser_use.llm.aws.chat_bedrock import ChatAWSBedrock
 	from browser_use.llm.azure.chat import ChatAzureOpenAI
+	from browser_use.llm.cache import CachedChatModel
 	from browser_use.llm.deepseek.chat import ChatDeepSeek
 	from browser_use.llm.google.chat import ChatGoogle
 	from browser_use.llm.groq.chat import ChatGroq
+	from browser_use.llm.hedge import HedgedChatModel
 	from browser_use.llm.ollama.chat import ChatOllama
 	from browser_use.llm.openai.chat import ChatOpenAI
 	from browser_use.llm.openrouter.chat import ChatOpenRouter
+	from browser_use.llm.rate_limit import RateLimitedChatModel
+	from browser_use.llm.retry import RetryingChatModel
+	from browser_use.llm.routing import RoutingChatModel
 
 # Lazy imports mapping for heavy chat models
 _LAZY_IMPORTS = {
@@ -49,6 +57,11 @@ _LAZY_IMPORTS = {
 	'ChatOllama': ('browser_use.llm.ollama.chat', 'ChatOllama'),
 	'ChatOpenAI': ('browser_use.llm.openai.chat', 'ChatOpenAI'),
 	'ChatOpenRouter': ('browser_use.llm.openrouter.chat', 'ChatOpenRouter'),
+	'CachedChatModel': ('browser_use.llm.cache', 'CachedChatModel'),
+	'RateLimitedChatModel': ('browser_use.llm.rate_limit', 'RateLimitedChatModel'),
+	'RetryingChatModel': ('browser_use.llm.retry', 'RetryingChatModel'),
+	'HedgedChatModel': ('browser_use.llm.hedge', 'HedgedChatModel'),
+	'RoutingChatModel': ('browser_use.llm.routing', 'RoutingChatModel'),
 }
 
 
@@ -80,6 +93,7 @@ __all__ = [
 	'ContentText',
 	'ContentRefusal',
 	'ContentImage',
+	'ContentImageBytes',
 	# Chat models
 	'BaseChatModel',
 	'ChatOpenAI',
@@ -92,4 +106,10 @@ __all__ = [
 	'ChatAzureOpenAI',
 	'ChatOllama',
 	'ChatOpenRouter',
+	# Wrappers
+	'CachedChatModel',
+	'RateLimitedChatModel',
+	'RetryingChatModel',
+	'HedgedChatModel',
+	'RoutingChatModel',
 ]
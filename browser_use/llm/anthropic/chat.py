@@ -9,6 +9,7 @@ from anthropic import (
 	APIConnectionError,
 	APIStatusError,
 	AsyncAnthropic,
+	DefaultAsyncHttpxClient,
 	NotGiven,
 	RateLimitError,
 )
@@ -20,9 +21,10 @@ from httpx import Timeout
 from pydantic import BaseModel
 
 from browser_use.llm.anthropic.serializer import AnthropicMessageSerializer
-from browser_use.llm.base import BaseChatModel
+from browser_use.llm.base import BaseChatModel, ReusableClientMixin
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
 from browser_use.llm.messages import BaseMessage
+from browser_use.llm.retry import parse_retry_after
 from browser_use.llm.schema import SchemaOptimizer
 from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
 
@@ -30,7 +32,7 @@ T = TypeVar('T', bound=BaseModel)
 
 
 @dataclass
-class ChatAnthropic(BaseChatModel):
+class ChatAnthropic(BaseChatModel, ReusableClientMixin):
 	"""
 	A wrapper around Anthropic's chat model.
 	"""
@@ -50,6 +52,7 @@ class ChatAnthropic(BaseChatModel):
 	max_retries: int = 10
 	default_headers: Mapping[str, str] | None = None
 	default_query: Mapping[str, object] | None = None
+	http_client: httpx.AsyncClient | None = None
 
 	# Static
 	@property
@@ -75,6 +78,12 @@ class ChatAnthropic(BaseChatModel):
 			if v is not None and v is not NotGiven():
 				client_params[k] = v
 
+		# Add http_client if provided
+		if self.http_client is not None:
+			client_params['http_client'] = self.http_client
+		elif self.http_pool_limits is not None:
+			client_params['http_client'] = DefaultAsyncHttpxClient(limits=self.http_pool_limits)
+
 		return client_params
 
 	def _get_client_params_for_invoke(self):
@@ -98,13 +107,12 @@ class ChatAnthropic(BaseChatModel):
 
 	def get_client(self) -> AsyncAnthropic:
 		"""
-		Returns an AsyncAnthropic client.
+		Returns an AsyncAnthropic client, built once and reused for every call.
 
 		Returns:
 			AsyncAnthropic: An instance of the AsyncAnthropic client.
 		"""
-		client_params = self._get_client_params()
-		return AsyncAnthropic(**client_params)
+		return self._get_reusable_client(lambda: AsyncAnthropic(**self._get_client_params()))
 
 	@property
 	def name(self) -> str:
@@ -229,8 +237,12 @@ class ChatAnthropic(BaseChatModel):
 		except APIConnectionError as e:
 			raise ModelProviderError(message=e.message, model=self.name) from e
 		except RateLimitError as e:
-			raise ModelRateLimitError(message=e.message, model=self.name) from e
+			raise ModelRateLimitError(
+				message=e.message, model=self.name, retry_after=parse_retry_after(e.response.headers)
+			) from e
 		except APIStatusError as e:
-			raise ModelProviderError(message=e.message, status_code=e.status_code, model=self.name) from e
+			raise ModelProviderError(
+				message=e.message, status_code=e.status_code, model=self.name, retry_after=parse_retry_after(e.response.headers)
+			) from e
 		except Exception as e:
 			raise ModelProviderError(message=str(e), model=self.name) from e
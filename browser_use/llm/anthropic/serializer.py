@@ -14,6 +14,7 @@ from anthropic.types import (
 from browser_use.llm.messages import (
 	AssistantMessage,
 	BaseMessage,
+	ContentPartImageBytesParam,
 	ContentPartImageParam,
 	ContentPartTextParam,
 	SupportedImageMediaType,
@@ -65,8 +66,14 @@ class AnthropicMessageSerializer:
 		)
 
 	@staticmethod
-	def _serialize_content_part_image(part: ContentPartImageParam) -> ImageBlockParam:
+	def _serialize_content_part_image(part: ContentPartImageParam | ContentPartImageBytesParam) -> ImageBlockParam:
 		"""Convert an image content part to Anthropic's ImageBlockParam."""
+		if part.type == 'image_bytes':
+			return ImageBlockParam(
+				source=Base64ImageSourceParam(data=part.to_base64(), media_type=part.media_type, type='base64'),
+				type='image',
+			)
+
 		url = part.image_url.url
 
 		if AnthropicMessageSerializer._is_base64_image(url):
@@ -106,7 +113,7 @@ class AnthropicMessageSerializer:
 
 	@staticmethod
 	def _serialize_content(
-		content: str | list[ContentPartTextParam | ContentPartImageParam],
+		content: str | list[ContentPartTextParam | ContentPartImageParam | ContentPartImageBytesParam],
 		use_cache: bool = False,
 	) -> str | list[TextBlockParam | ImageBlockParam]:
 		"""Serialize content to Anthropic format."""
@@ -116,11 +123,17 @@ class AnthropicMessageSerializer:
 			else:
 				return content
 
+		# one cache breakpoint at the last text part caches the whole prefix, and anthropic allows only 4 per request
+		# (so a message split into many parts, e.g. one per history item, must not put a breakpoint on each of them)
+		last_text_index = max((i for i, part in enumerate(content) if part.type == 'text'), default=-1)
+
 		serialized_blocks: list[TextBlockParam | ImageBlockParam] = []
-		for part in content:
+		for i, part in enumerate(content):
 			if part.type == 'text':
-				serialized_blocks.append(AnthropicMessageSerializer._serialize_content_part_text(part, use_cache))
-			elif part.type == 'image_url':
+				serialized_blocks.append(
+					AnthropicMessageSerializer._serialize_content_part_text(part, use_cache and i == last_text_index)
+				)
+			elif part.type == 'image_url' or part.type == 'image_bytes':
 				serialized_blocks.append(AnthropicMessageSerializer._serialize_content_part_image(part))
 
 		return serialized_blocks
@@ -282,8 +295,6 @@ class AnthropicMessageSerializer:
 		    A tuple of (messages, system_message) where system_message is extracted
 		    from any SystemMessage in the list.
 		"""
-		messages = [m.model_copy(deep=True) for m in messages]
-
 		# Separate system messages from normal messages
 		normal_messages: list[NonSystemMessage] = []
 		system_message: SystemMessage | None = None
@@ -294,19 +305,34 @@ class AnthropicMessageSerializer:
 			else:
 				normal_messages.append(message)
 
-		# Clean cache messages so only the last cache=True message remains cached
-		normal_messages = AnthropicMessageSerializer._clean_cache_messages(normal_messages)
+		# Only the last cache=True message remains cached (like _clean_cache_messages(), but without copying the messages)
+		last_cache_index = max((i for i, message in enumerate(normal_messages) if message.cache), default=-1)
 
-		# Serialize normal messages
-		serialized_messages: list[MessageParam] = []
-		for message in normal_messages:
-			serialized_messages.append(AnthropicMessageSerializer.serialize(message))
+		# Serialize normal messages, memoized on the messages so only the new ones get serialized
+		serialized_messages: list[MessageParam] = [
+			AnthropicMessageSerializer._serialize_memoized(message, use_cache=message.cache and i == last_cache_index)
+			for i, message in enumerate(normal_messages)
+		]
 
 		# Serialize system message
 		serialized_system_message: list[TextBlockParam] | str | None = None
 		if system_message:
-			serialized_system_message = AnthropicMessageSerializer._serialize_content_to_str(
-				system_message.content, use_cache=system_message.cache
+			serialized_system_message = system_message.get_serialized(
+				'anthropic',
+				lambda: AnthropicMessageSerializer._serialize_content_to_str(
+					system_message.content, use_cache=system_message.cache
+				),
 			)
 
 		return serialized_messages, serialized_system_message
+
+	@staticmethod
+	def _serialize_memoized(message: NonSystemMessage, use_cache: bool) -> MessageParam:
+		"""Serialize a message with the given cache setting, reusing the result of earlier calls"""
+
+		def serialize() -> MessageParam:
+			if use_cache == message.cache:
+				return AnthropicMessageSerializer.serialize(message)
+			return AnthropicMessageSerializer.serialize(message.model_copy(update={'cache': use_cache}))
+
+		return message.get_serialized(f'anthropic:cache={use_cache}', serialize)
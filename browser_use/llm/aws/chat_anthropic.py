@@ -8,6 +8,7 @@ from anthropic import (
 	APIConnectionError,
 	APIStatusError,
 	AsyncAnthropicBedrock,
+	DefaultAsyncHttpxClient,
 	RateLimitError,
 )
 from anthropic.types import CacheControlEphemeralParam, Message, ToolParam
@@ -95,6 +96,8 @@ class ChatAnthropicBedrock(ChatAWSBedrock):
 			client_params['default_headers'] = self.default_headers
 		if self.default_query:
 			client_params['default_query'] = self.default_query
+		if self.http_pool_limits is not None:
+			client_params['http_client'] = DefaultAsyncHttpxClient(limits=self.http_pool_limits)
 
 		return client_params
 
@@ -119,13 +122,12 @@ class ChatAnthropicBedrock(ChatAWSBedrock):
 
 	def get_client(self) -> AsyncAnthropicBedrock:
 		"""
-		Returns an AsyncAnthropicBedrock client.
+		Returns an AsyncAnthropicBedrock client, built once and reused for every call.
 
 		Returns:
 			AsyncAnthropicBedrock: An instance of the AsyncAnthropicBedrock client.
 		"""
-		client_params = self._get_client_params()
-		return AsyncAnthropicBedrock(**client_params)
+		return self._get_reusable_client(lambda: AsyncAnthropicBedrock(**self._get_client_params()))
 
 	@property
 	def name(self) -> str:
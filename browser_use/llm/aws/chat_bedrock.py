@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Any, TypeVar, overload
 from pydantic import BaseModel
 
 from browser_use.llm.aws.serializer import AWSBedrockMessageSerializer
-from browser_use.llm.base import BaseChatModel
+from browser_use.llm.base import BaseChatModel, ReusableClientMixin
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
@@ -19,7 +19,7 @@ T = TypeVar('T', bound=BaseModel)
 
 
 @dataclass
-class ChatAWSBedrock(BaseChatModel):
+class ChatAWSBedrock(BaseChatModel, ReusableClientMixin):
 	"""
 	AWS Bedrock chat model supporting multiple providers (Anthropic, Meta, etc.).
 
@@ -6,6 +6,7 @@ from typing import Any, overload
 from browser_use.llm.messages import (
 	AssistantMessage,
 	BaseMessage,
+	ContentPartImageBytesParam,
 	ContentPartImageParam,
 	ContentPartRefusalParam,
 	ContentPartTextParam,
@@ -93,8 +94,11 @@ class AWSBedrockMessageSerializer:
 		return {'text': part.text}
 
 	@staticmethod
-	def _serialize_content_part_image(part: ContentPartImageParam) -> dict[str, Any]:
+	def _serialize_content_part_image(part: ContentPartImageParam | ContentPartImageBytesParam) -> dict[str, Any]:
 		"""Convert an image content part to AWS Bedrock format."""
+		if part.type == 'image_bytes':
+			return {'image': {'format': part.media_type.split('/')[1], 'source': {'bytes': part.data}}}
+
 		url = part.image_url.url
 
 		if AWSBedrockMessageSerializer._is_base64_image(url):
@@ -117,7 +121,7 @@ class AWSBedrockMessageSerializer:
 
 	@staticmethod
 	def _serialize_user_content(
-		content: str | list[ContentPartTextParam | ContentPartImageParam],
+		content: str | list[ContentPartTextParam | ContentPartImageParam | ContentPartImageBytesParam],
 	) -> list[dict[str, Any]]:
 		"""Serialize content for user messages."""
 		if isinstance(content, str):
@@ -127,7 +131,7 @@ class AWSBedrockMessageSerializer:
 		for part in content:
 			if part.type == 'text':
 				content_blocks.append(AWSBedrockMessageSerializer._serialize_content_part_text(part))
-			elif part.type == 'image_url':
+			elif part.type == 'image_url' or part.type == 'image_bytes':
 				content_blocks.append(AWSBedrockMessageSerializer._serialize_content_part_image(part))
 
 		return content_blocks
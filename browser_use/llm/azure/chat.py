@@ -76,6 +76,9 @@ class ChatAzureOpenAI(ChatOpenAILike):
 		if self.client:
 			return self.client
 
+		return self._get_reusable_client(self._build_client)
+
+	def _build_client(self) -> AsyncAzureOpenAIClient:
 		_client_params: dict[str, Any] = self._get_client_params()
 
 		if self.http_client:
@@ -83,9 +86,7 @@ class ChatAzureOpenAI(ChatOpenAILike):
 		else:
 			# Create a new async HTTP client with custom limits
 			_client_params['http_client'] = httpx.AsyncClient(
-				limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
+				limits=self.http_pool_limits or httpx.Limits(max_connections=1000, max_keepalive_connections=100)
 			)
 
-		self.client = AsyncAzureOpenAIClient(**_client_params)
-
-		return self.client
+		return AsyncAzureOpenAIClient(**_client_params)
@@ -4,14 +4,23 @@ We have switched all of our code from langchain to openai.types.chat.chat_comple
 For easier transition we have
 """
 
+import asyncio
+import logging
+import weakref
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from typing import Any, Protocol, TypeVar, overload, runtime_checkable
 
+import httpx
 from pydantic import BaseModel
 
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.views import ChatInvokeCompletion
 
 T = TypeVar('T', bound=BaseModel)
+ClientT = TypeVar('ClientT')
+
+logger = logging.getLogger(__name__)
 
 
 @runtime_checkable
@@ -55,3 +64,55 @@ class BaseChatModel(Protocol):
 
 		# Return a schema that accepts any object for Protocol types
 		return core_schema.any_schema()
+
+
+@dataclass
+class ReusableClientMixin:
+	"""
+	Builds the provider SDK client lazily and reuses it (and its HTTP connection pool) for every call,
+	instead of paying for a new client + TLS handshake on every ainvoke().
+
+	Clients are cached per running event loop, so one chat model object can safely be shared between agents,
+	threads and successive asyncio.run() calls. Call `await llm.aclose()` to close the pooled connections.
+	"""
+
+	# connection pool limits for the HTTP client the SDK client is built with (None = SDK default)
+	http_pool_limits: httpx.Limits | None = field(default=None, kw_only=True)
+
+	def _get_reusable_client(self, build_client: Callable[[], ClientT]) -> ClientT:
+		"""Return the client for the running event loop, calling build_client() the first time"""
+		try:
+			loop = asyncio.get_running_loop()
+		except RuntimeError:
+			return build_client()  # not in an event loop (e.g. sync setup code), nothing to share a pool with
+
+		clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any] = self.__dict__.setdefault(
+			'_reusable_clients', weakref.WeakKeyDictionary()
+		)
+		client = clients.get(loop)
+		if client is None or getattr(client, 'is_closed', lambda: False)():
+			client = clients[loop] = build_client()
+		return client
+
+	async def aclose(self) -> None:
+		"""Close all clients built by this chat model, they are rebuilt on the next call"""
+		clients: weakref.WeakKeyDictionary = self.__dict__.get('_reusable_clients') or weakref.WeakKeyDictionary()
+		for loop, client in list(clients.items()):
+			clients.pop(loop, None)
+			if loop is not asyncio.get_running_loop():
+				continue  # can only be closed from the loop its connections belong to, dropping it is all we can do
+			try:
+				await self._close_client(client)
+			except Exception as e:
+				logger.debug(f'Failed to close {type(client).__name__}: {type(e).__name__}: {e}')
+
+	async def _close_client(self, client: Any) -> None:
+		# SDK clients close the http_client they were given, leave a user-supplied one for its owner to close
+		if getattr(self, 'http_client', None) is None:
+			await client.close()
+
+	def __getstate__(self) -> dict[str, Any]:
+		# live clients are bound to an event loop and can't be pickled, copies rebuild their own
+		state = self.__dict__.copy()
+		state.pop('_reusable_clients', None)
+		return state
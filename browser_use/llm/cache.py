@@ -0,0 +1,220 @@
+"""
+Local record/replay cache for LLM calls.
+
+Wrap any chat model to store its responses on disk, keyed by a stable hash of the model, the serialized messages
+and the output format. Parts of the messages that change on every run (the current date and time of the agent
+state, screenshot data) are left out of the key, see normalize_message_for_cache_key(). Rerunning the same task
+(regression runs, CI, benchmarks) then replays the recorded responses instead of paying for identical LLM calls
+again, and in `replay` mode runs fully offline and deterministic.
+
+	llm = CachedChatModel(ChatOpenAI(model='gpt-4.1-mini'), cache_dir='./llm_cache', mode='record')
+	agent = Agent(task='...', llm=llm)
+	await agent.run()
+	print(llm.hits, llm.misses)
+"""
+
+import hashlib
+import json
+import logging
+import re
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Literal, TypeVar, overload
+
+import anyio
+from pydantic import BaseModel
+
+from browser_use.llm.base import BaseChatModel
+from browser_use.llm.exceptions import ModelCacheMissError
+from browser_use.llm.messages import BaseMessage, ContentPartImageBytesParam, ContentPartImageParam, ContentPartTextParam
+from browser_use.llm.schema import SchemaOptimizer
+from browser_use.llm.views import ChatInvokeCompletion
+
+T = TypeVar('T', bound=BaseModel)
+
+logger = logging.getLogger(__name__)
+
+CacheMode = Literal['record', 'replay', 'passthrough']
+"""
+- record: replay cached responses, call the wrapped model on a miss and store its response
+- replay: only replay cached responses, a miss raises ModelCacheMissError (never calls the wrapped model)
+- passthrough: always call the wrapped model, the cache is neither read nor written
+"""
+
+# the agent state line written by AgentMessagePrompt, changes every minute
+_CURRENT_TIME_RE = re.compile(r'Current date and time: \d{4}-\d{2}-\d{2} \d{2}:\d{2}')
+
+
+def _normalize_text(text: str) -> str:
+	return _CURRENT_TIME_RE.sub('Current date and time: <now>', text)
+
+
+def _normalize_content_part(part: Any) -> Any:
+	if isinstance(part, ContentPartImageBytesParam):
+		return {'type': part.type, 'media_type': part.media_type, 'detail': part.detail}
+	if isinstance(part, ContentPartImageParam) and part.image_url.url.startswith('data:'):
+		return {'type': part.type, 'media_type': part.image_url.media_type, 'detail': part.image_url.detail}
+	data = part.model_dump(mode='json')
+	if isinstance(part, ContentPartTextParam):
+		data['text'] = _normalize_text(part.text)
+	return data
+
+
+def normalize_message_for_cache_key(message: BaseMessage) -> dict[str, Any]:
+	"""
+	Default cache key form of a message: its JSON dump without the parts that differ between otherwise identical runs.
+
+	The current date and time in the agent state is replaced by a placeholder, and inline images (screenshots) are
+	keyed by their media type and detail only, their pixels are never the same twice. Image URLs are kept.
+	"""
+	data = message.model_dump(mode='json', exclude={'content'})
+	content = message.content
+	if isinstance(content, str):
+		data['content'] = _normalize_text(content)
+	elif isinstance(content, list):
+		data['content'] = [_normalize_content_part(part) for part in content]
+	else:
+		data['content'] = content
+	return data
+
+
+@dataclass
+class CachedChatModel(BaseChatModel):
+	"""
+	A chat model that wraps another chat model and records/replays its responses from a local on-disk cache.
+
+	Every response is stored as one JSON file named after the cache key in `cache_dir`.
+	Replayed responses have `usage=None`, so they are not counted as spent tokens/cost by the TokenCost service.
+	`normalize_message` turns each message into the JSON data hashed into the key, pass e.g.
+	`lambda message: message.model_dump(mode='json')` to key on the exact messages instead.
+	"""
+
+	llm: BaseChatModel
+	cache_dir: str | Path
+	mode: CacheMode = 'record'
+	normalize_message: Callable[[BaseMessage], Any] = normalize_message_for_cache_key
+
+	# hit/miss counters (passthrough calls count as neither)
+	hits: int = field(default=0, init=False)
+	misses: int = field(default=0, init=False)
+
+	def __post_init__(self) -> None:
+		self.model = self.llm.model
+		self.cache_dir = Path(self.cache_dir).expanduser()
+		# offer streaming only if the wrapped model streams, the agent checks hasattr(llm, 'ainvoke_streaming')
+		if hasattr(self.llm, 'ainvoke_streaming'):
+			self.ainvoke_streaming = self._ainvoke_streaming
+
+	@property
+	def provider(self) -> str:
+		return self.llm.provider
+
+	@property
+	def name(self) -> str:
+		return self.llm.name
+
+	def get_cache_key(self, messages: list[BaseMessage], output_format: type[BaseModel] | None = None) -> str:
+		"""Stable hash of everything that determines the response: model, normalized messages and output format"""
+		payload = {
+			'provider': self.llm.provider,
+			'model': self.llm.model,
+			'messages': [self.normalize_message(message) for message in messages],
+			'output_format': None
+			if output_format is None
+			else [output_format.__name__, SchemaOptimizer.create_optimized_json_schema_str(output_format)],
+		}
+		return hashlib.sha256(json.dumps(payload, sort_keys=True, separators=(',', ':')).encode()).hexdigest()
+
+	def _get_cache_path(self, key: str) -> Path:
+		return Path(self.cache_dir) / f'{key}.json'
+
+	@overload
+	async def ainvoke(self, messages: list[BaseMessage], output_format: None = None) -> ChatInvokeCompletion[str]: ...
+
+	@overload
+	async def ainvoke(self, messages: list[BaseMessage], output_format: type[T]) -> ChatInvokeCompletion[T]: ...
+
+	async def ainvoke(
+		self, messages: list[BaseMessage], output_format: type[T] | None = None
+	) -> ChatInvokeCompletion[T] | ChatInvokeCompletion[str]:
+		return await self._call(messages, output_format, lambda: self.llm.ainvoke(messages, output_format))
+
+	async def _ainvoke_streaming(
+		self, messages: list[BaseMessage], output_format: type[T], on_text: Callable[[str], Any]
+	) -> ChatInvokeCompletion[T]:
+		def on_hit(cached: ChatInvokeCompletion[Any]) -> None:
+			on_text(cached.completion.model_dump_json())  # a replayed response "streams" in one chunk
+
+		return await self._call(
+			messages,
+			output_format,
+			lambda: self.llm.ainvoke_streaming(messages, output_format, on_text),  # type: ignore[attr-defined]
+			on_hit=on_hit,
+		)
+
+	async def _call(
+		self,
+		messages: list[BaseMessage],
+		output_format: type[T] | None,
+		invoke: Callable[[], Awaitable[ChatInvokeCompletion[Any]]],
+		on_hit: Callable[[ChatInvokeCompletion[Any]], None] | None = None,
+	) -> ChatInvokeCompletion[Any]:
+		if self.mode == 'passthrough':
+			return await invoke()
+
+		key = self.get_cache_key(messages, output_format)
+		cache_path = anyio.Path(self._get_cache_path(key))
+
+		if await cache_path.exists():
+			try:
+				cached = await self._load(cache_path, output_format)
+			except Exception as e:
+				logger.warning(f'⚠️ Ignoring unreadable LLM cache entry {cache_path}: {type(e).__name__}: {e}')
+			else:
+				self.hits += 1
+				logger.debug(f'💾 LLM cache hit for {self.llm.model}: {key[:12]}')
+				if on_hit:
+					on_hit(cached)
+				return cached
+
+		self.misses += 1
+		if self.mode == 'replay':
+			raise ModelCacheMissError(
+				f'No cached response for {self.llm.model} (cache key {key}) in {self.cache_dir}', model=self.model
+			)
+
+		logger.debug(f'💾 LLM cache miss for {self.llm.model}: {key[:12]}, recording response')
+		response = await invoke()
+		await self._store(cache_path, response)
+		return response
+
+	@staticmethod
+	async def _load(cache_path: anyio.Path, output_format: type[T] | None) -> ChatInvokeCompletion[Any]:
+		data = json.loads(await cache_path.read_text(encoding='utf-8'))
+		completion = data['completion'] if output_format is None else output_format.model_validate(data['completion'])
+		return ChatInvokeCompletion(
+			completion=completion,
+			thinking=data.get('thinking'),
+			redacted_thinking=data.get('redacted_thinking'),
+			usage=None,  # nothing was spent on a replayed response
+		)
+
+	async def _store(self, cache_path: anyio.Path, response: ChatInvokeCompletion[Any]) -> None:
+		completion = response.completion
+		data = {
+			'provider': self.llm.provider,
+			'model': self.llm.model,
+			'completion': completion.model_dump(mode='json') if isinstance(completion, BaseModel) else completion,
+			'thinking': response.thinking,
+			'redacted_thinking': response.redacted_thinking,
+			'usage': response.usage.model_dump(mode='json') if response.usage else None,
+		}
+		try:
+			await cache_path.parent.mkdir(parents=True, exist_ok=True)
+			# write + rename so concurrent runs never read a half-written entry
+			tmp_path = cache_path.with_suffix(f'.{id(response)}.tmp')
+			await tmp_path.write_text(json.dumps(data, indent=1), encoding='utf-8')
+			await tmp_path.replace(cache_path)
+		except OSError as e:
+			logger.warning(f'⚠️ Failed to write LLM cache entry {cache_path}: {type(e).__name__}: {e}')
@@ -11,11 +11,12 @@ from openai import (
 	APIStatusError,
 	APITimeoutError,
 	AsyncOpenAI,
+	DefaultAsyncHttpxClient,
 	RateLimitError,
 )
 from pydantic import BaseModel
 
-from browser_use.llm.base import BaseChatModel
+from browser_use.llm.base import BaseChatModel, ReusableClientMixin
 from browser_use.llm.deepseek.serializer import DeepSeekMessageSerializer
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
 from browser_use.llm.messages import BaseMessage
@@ -26,7 +27,7 @@ T = TypeVar('T', bound=BaseModel)
 
 
 @dataclass
-class ChatDeepSeek(BaseChatModel):
+class ChatDeepSeek(BaseChatModel, ReusableClientMixin):
 	"""DeepSeek /chat/completions 封装（OpenAI-compatible）。"""
 
 	model: str = 'deepseek-chat'
@@ -48,11 +49,14 @@ class ChatDeepSeek(BaseChatModel):
 		return 'deepseek'
 
 	def _client(self) -> AsyncOpenAI:
-		return AsyncOpenAI(
-			api_key=self.api_key,
-			base_url=self.base_url,
-			timeout=self.timeout,
-			**(self.client_params or {}),
+		return self._get_reusable_client(
+			lambda: AsyncOpenAI(
+				api_key=self.api_key,
+				base_url=self.base_url,
+				timeout=self.timeout,
+				**({'http_client': DefaultAsyncHttpxClient(limits=self.http_pool_limits)} if self.http_pool_limits else {}),
+				**(self.client_params or {}),
+			)
 		)
 
 	@property
@@ -6,6 +6,7 @@ from typing import Any, overload
 from browser_use.llm.messages import (
 	AssistantMessage,
 	BaseMessage,
+	ContentPartImageBytesParam,
 	ContentPartImageParam,
 	ContentPartTextParam,
 	SystemMessage,
@@ -25,7 +26,9 @@ class DeepSeekMessageSerializer:
 		return part.text
 
 	@staticmethod
-	def _serialize_image_part(part: ContentPartImageParam) -> dict[str, Any]:
+	def _serialize_image_part(part: ContentPartImageParam | ContentPartImageBytesParam) -> dict[str, Any]:
+		if part.type == 'image_bytes':
+			return {'type': 'image_url', 'image_url': {'url': part.to_data_url()}}
 		url = part.image_url.url
 		if url.startswith('data:'):
 			return {'type': 'image_url', 'image_url': {'url': url}}
@@ -41,7 +44,7 @@ class DeepSeekMessageSerializer:
 		for part in content:
 			if part.type == 'text':
 				serialized.append({'type': 'text', 'text': DeepSeekMessageSerializer._serialize_text_part(part)})
-			elif part.type == 'image_url':
+			elif part.type == 'image_url' or part.type == 'image_bytes':
 				serialized.append(DeepSeekMessageSerializer._serialize_image_part(part))
 			elif part.type == 'refusal':
 				serialized.append({'type': 'text', 'text': f'[Refusal] {part.refusal}'})
@@ -10,9 +10,12 @@ class ModelProviderError(ModelError):
 		message: str,
 		status_code: int = 502,
 		model: str | None = None,
+		retry_after: float | None = None,
 	):
 		super().__init__(message, status_code)
+		self.status_code = status_code
 		self.model = model
+		self.retry_after = retry_after  # seconds the provider asked us to wait before retrying (Retry-After header)
 
 
 class ModelRateLimitError(ModelProviderError):
@@ -23,5 +26,28 @@ class ModelRateLimitError(ModelProviderError):
 		message: str,
 		status_code: int = 429,
 		model: str | None = None,
+		retry_after: float | None = None,
 	):
-		super().__init__(message, status_code, model)
+		super().__init__(message, status_code, model, retry_after)
+
+
+class ModelCacheMissError(ModelError):
+	"""Exception raised when a replay-only LLM cache has no recorded response for a request."""
+
+	def __init__(self, message: str, model: str | None = None):
+		super().__init__(message)
+		self.model = model
+
+
+class ModelCircuitOpenError(ModelProviderError):
+	"""Exception raised without calling the provider while its circuit breaker is open after too many errors."""
+
+	def __init__(self, message: str, model: str | None = None, retry_after: float | None = None):
+		super().__init__(message, status_code=503, model=model, retry_after=retry_after)
+
+
+class ModelOutputParseError(ModelProviderError):
+	"""Exception raised when the model answered, but its response does not parse into the requested output format."""
+
+	def __init__(self, message: str, model: str | None = None):
+		super().__init__(message, status_code=422, model=model)
@@ -8,7 +8,7 @@ from google.genai import types
 from google.genai.types import MediaModality
 from pydantic import BaseModel
 
-from browser_use.llm.base import BaseChatModel
+from browser_use.llm.base import BaseChatModel, ReusableClientMixin
 from browser_use.llm.exceptions import ModelProviderError
 from browser_use.llm.google.serializer import GoogleMessageSerializer
 from browser_use.llm.messages import BaseMessage
@@ -41,7 +41,7 @@ def _is_retryable_error(exception):
 
 
 @dataclass
-class ChatGoogle(BaseChatModel):
+class ChatGoogle(BaseChatModel, ReusableClientMixin):
 	"""
 	A wrapper around Google's Gemini chat model using the genai client.
 
@@ -111,13 +111,18 @@ class ChatGoogle(BaseChatModel):
 
 	def get_client(self) -> genai.Client:
 		"""
-		Returns a genai.Client instance.
+		Returns a genai.Client instance, built once and reused for every call.
+		(genai picks its own HTTP transport, so http_pool_limits is not applied, use http_options to tune it)
 
 		Returns:
 			genai.Client: An instance of the Google genai client.
 		"""
-		client_params = self._get_client_params()
-		return genai.Client(**client_params)
+		return self._get_reusable_client(lambda: genai.Client(**self._get_client_params()))
+
+	async def _close_client(self, client: genai.Client) -> None:
+		aclose = getattr(client.aio, 'aclose', None)  # only available in newer google-genai versions
+		if aclose is not None:
+			await aclose()
 
 	@property
 	def name(self) -> str:
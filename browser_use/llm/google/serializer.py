@@ -1,4 +1,5 @@
 import base64
+from functools import partial
 
 from google.genai.types import Content, ContentListUnion, Part
 
@@ -31,8 +32,6 @@ class GoogleMessageSerializer:
 		    - system_message: System instruction string or None
 		"""
 
-		messages = [m.model_copy(deep=True) for m in messages]
-
 		formatted_messages: ContentListUnion = []
 		system_message: str | None = None
 
@@ -53,46 +52,57 @@ class GoogleMessageSerializer:
 					system_message = '\n'.join(parts)
 				continue
 
-			# Determine the role for non-system messages
-			if isinstance(message, UserMessage):
-				role = 'user'
-			elif isinstance(message, AssistantMessage):
-				role = 'model'
-			else:
-				# Default to user for any unknown message types
-				role = 'user'
-
-			# Initialize message parts
-			message_parts: list[Part] = []
-
-			# Extract content and create parts
-			if isinstance(message.content, str):
-				# Regular text content
-				message_parts = [Part.from_text(text=message.content)]
-			elif message.content is not None:
-				# Handle Iterable of content parts
-				for part in message.content:
-					if part.type == 'text':
-						message_parts.append(Part.from_text(text=part.text))
-					elif part.type == 'refusal':
-						message_parts.append(Part.from_text(text=f'[Refusal] {part.refusal}'))
-					elif part.type == 'image_url':
-						# Handle images
-						url = part.image_url.url
-
-						# Format: data:image/png;base64,<data>
-						header, data = url.split(',', 1)
-						# Decode base64 to bytes
-						image_bytes = base64.b64decode(data)
-
-						# Add image part
-						image_part = Part.from_bytes(data=image_bytes, mime_type='image/png')
-
-						message_parts.append(image_part)
-
-			# Create the Content object
-			if message_parts:
-				final_message = Content(role=role, parts=message_parts)
-				formatted_messages.append(final_message)
+			# memoized on the message, so only the messages that are new since the last call get serialized
+			# (and their images base64-decoded)
+			content = message.get_serialized('google', partial(GoogleMessageSerializer._serialize_message, message))
+			if content is not None:
+				formatted_messages.append(content)
 
 		return formatted_messages, system_message
+
+	@staticmethod
+	def _serialize_message(message: UserMessage | AssistantMessage) -> Content | None:
+		"""Convert a non-system message to a Content object, None if it has no content"""
+		# Determine the role for non-system messages
+		if isinstance(message, UserMessage):
+			role = 'user'
+		elif isinstance(message, AssistantMessage):
+			role = 'model'
+		else:
+			# Default to user for any unknown message types
+			role = 'user'
+
+		# Initialize message parts
+		message_parts: list[Part] = []
+
+		# Extract content and create parts
+		if isinstance(message.content, str):
+			# Regular text content
+			message_parts = [Part.from_text(text=message.content)]
+		elif message.content is not None:
+			# Handle Iterable of content parts
+			for part in message.content:
+				if part.type == 'text':
+					message_parts.append(Part.from_text(text=part.text))
+				elif part.type == 'refusal':
+					message_parts.append(Part.from_text(text=f'[Refusal] {part.refusal}'))
+				elif part.type == 'image_bytes':
+					message_parts.append(Part.from_bytes(data=part.data, mime_type=part.media_type))
+				elif part.type == 'image_url':
+					# Handle images
+					url = part.image_url.url
+
+					# Format: data:image/png;base64,<data>
+					header, data = url.split(',', 1)
+					# Decode base64 to bytes
+					image_bytes = base64.b64decode(data)
+
+					# Add image part
+					image_part = Part.from_bytes(data=image_bytes, mime_type='image/png')
+
+					message_parts.append(image_part)
+
+		# Create the Content object
+		if message_parts:
+			return Content(role=role, parts=message_parts)
+		return None
@@ -7,6 +7,7 @@ from groq import (
 	APIResponseValidationError,
 	APIStatusError,
 	AsyncGroq,
+	DefaultAsyncHttpxClient,
 	NotGiven,
 	RateLimitError,
 	Timeout,
@@ -19,11 +20,12 @@ from groq.types.chat.completion_create_params import (
 from httpx import URL
 from pydantic import BaseModel
 
-from browser_use.llm.base import BaseChatModel, ChatInvokeCompletion
+from browser_use.llm.base import BaseChatModel, ChatInvokeCompletion, ReusableClientMixin
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
 from browser_use.llm.groq.parser import try_parse_groq_failed_generation
 from browser_use.llm.groq.serializer import GroqMessageSerializer
 from browser_use.llm.messages import BaseMessage
+from browser_use.llm.retry import parse_retry_after
 from browser_use.llm.schema import SchemaOptimizer
 from browser_use.llm.views import ChatInvokeUsage
 
@@ -49,7 +51,7 @@ logger = logging.getLogger(__name__)
 
 
 @dataclass
-class ChatGroq(BaseChatModel):
+class ChatGroq(BaseChatModel, ReusableClientMixin):
 	"""
 	A wrapper around AsyncGroq that implements the BaseLLM protocol.
 	"""
@@ -70,7 +72,15 @@ class ChatGroq(BaseChatModel):
 	max_retries: int = 10  # Increase default retries for automation reliability
 
 	def get_client(self) -> AsyncGroq:
-		return AsyncGroq(api_key=self.api_key, base_url=self.base_url, timeout=self.timeout, max_retries=self.max_retries)
+		return self._get_reusable_client(
+			lambda: AsyncGroq(
+				api_key=self.api_key,
+				base_url=self.base_url,
+				timeout=self.timeout,
+				max_retries=self.max_retries,
+				http_client=DefaultAsyncHttpxClient(limits=self.http_pool_limits) if self.http_pool_limits else None,
+			)
+		)
 
 	@property
 	def provider(self) -> str:
@@ -113,7 +123,12 @@ class ChatGroq(BaseChatModel):
 				return await self._invoke_structured_output(groq_messages, output_format)
 
 		except RateLimitError as e:
-			raise ModelRateLimitError(message=e.response.text, status_code=e.response.status_code, model=self.name) from e
+			raise ModelRateLimitError(
+				message=e.response.text,
+				status_code=e.response.status_code,
+				model=self.name,
+				retry_after=parse_retry_after(e.response.headers),
+			) from e
 
 		except APIResponseValidationError as e:
 			raise ModelProviderError(message=e.response.text, status_code=e.response.status_code, model=self.name) from e
@@ -1,3 +1,4 @@
+from functools import partial
 from typing import overload
 
 from groq.types.chat import (
@@ -15,6 +16,7 @@ from groq.types.chat.chat_completion_message_tool_call_param import Function
 from browser_use.llm.messages import (
 	AssistantMessage,
 	BaseMessage,
+	ContentPartImageBytesParam,
 	ContentPartImageParam,
 	ContentPartRefusalParam,
 	ContentPartTextParam,
@@ -32,7 +34,14 @@ class GroqMessageSerializer:
 		return ChatCompletionContentPartTextParam(text=part.text, type='text')
 
 	@staticmethod
-	def _serialize_content_part_image(part: ContentPartImageParam) -> ChatCompletionContentPartImageParam:
+	def _serialize_content_part_image(
+		part: ContentPartImageParam | ContentPartImageBytesParam,
+	) -> ChatCompletionContentPartImageParam:
+		if part.type == 'image_bytes':
+			return ChatCompletionContentPartImageParam(
+				image_url=ImageURL(url=part.to_data_url(), detail=part.detail),
+				type='image_url',
+			)
 		return ChatCompletionContentPartImageParam(
 			image_url=ImageURL(url=part.image_url.url, detail=part.image_url.detail),
 			type='image_url',
@@ -40,7 +49,7 @@ class GroqMessageSerializer:
 
 	@staticmethod
 	def _serialize_user_content(
-		content: str | list[ContentPartTextParam | ContentPartImageParam],
+		content: str | list[ContentPartTextParam | ContentPartImageParam | ContentPartImageBytesParam],
 	) -> str | list[ChatCompletionContentPartTextParam | ChatCompletionContentPartImageParam]:
 		"""Serialize content for user messages (text and images allowed)."""
 		if isinstance(content, str):
@@ -50,7 +59,7 @@ class GroqMessageSerializer:
 		for part in content:
 			if part.type == 'text':
 				serialized_parts.append(GroqMessageSerializer._serialize_content_part_text(part))
-			elif part.type == 'image_url':
+			elif part.type == 'image_url' or part.type == 'image_bytes':
 				serialized_parts.append(GroqMessageSerializer._serialize_content_part_image(part))
 		return serialized_parts
 
@@ -156,4 +165,5 @@ class GroqMessageSerializer:
 
 	@staticmethod
 	def serialize_messages(messages: list[BaseMessage]) -> list[ChatCompletionMessageParam]:
-		return [GroqMessageSerializer.serialize(m) for m in messages]
+		# memoized on the messages, so only the messages that are new since the last call get serialized
+		return [m.get_serialized('groq', partial(GroqMessageSerializer.serialize, m)) for m in messages]
@@ -0,0 +1,133 @@
+"""
+Hedged LLM requests, to cut the tail latency of chat completions.
+
+Wrap two chat models (the same model twice, or a model and a cheaper fallback). When the primary has not
+answered within a threshold derived from its observed latencies (the p95 by default), the same request is
+also sent to the secondary and whichever returns a valid result first wins, the other call is cancelled.
+
+	llm = HedgedChatModel(ChatOpenAI(model='gpt-4.1'), secondary=ChatOpenAI(model='gpt-4.1-mini'))
+	agent = Agent(task='...', llm=llm)
+	...
+	print(f'hedged {llm.hedged_calls}/{llm.calls} calls, secondary won {llm.secondary_wins}')
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, TypeVar, overload
+
+from pydantic import BaseModel
+
+from browser_use.llm.base import BaseChatModel
+from browser_use.llm.messages import BaseMessage
+from browser_use.llm.views import ChatInvokeCompletion
+
+T = TypeVar('T', bound=BaseModel)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HedgedChatModel(BaseChatModel):
+	"""
+	A chat model that sends a duplicate request to `secondary` when `primary` is slower than usual.
+
+	The hedge delay is the `hedge_percentile` of the primary's last `window_size` latencies (never below
+	`min_hedge_delay`), or `initial_hedge_delay` until `min_samples` latencies were observed.
+	Only the winner's usage is returned, the tokens spent on a cancelled loser are not reported.
+	Streaming (ainvoke_streaming) is not offered, two racing streams can't feed one consumer, so an agent with
+	stream_actions=True makes regular calls through this model.
+	"""
+
+	primary: BaseChatModel
+	secondary: BaseChatModel | None = None  # None = hedge with a second request to the primary
+	hedge_percentile: float = 0.95
+	initial_hedge_delay: float = 10.0
+	min_hedge_delay: float = 1.0
+	min_samples: int = 10
+	window_size: int = 100
+
+	# counters: calls made, calls where the hedge request was sent, hedged calls won by the secondary
+	calls: int = field(default=0, init=False)
+	hedged_calls: int = field(default=0, init=False)
+	secondary_wins: int = field(default=0, init=False)
+	_latencies: deque[float] = field(init=False, repr=False)
+
+	def __post_init__(self) -> None:
+		self.model = self.primary.model
+		self._latencies = deque(maxlen=self.window_size)
+
+	@property
+	def provider(self) -> str:
+		return self.primary.provider
+
+	@property
+	def name(self) -> str:
+		return self.primary.name
+
+	@property
+	def hedge_rate(self) -> float:
+		"""Share of calls where the hedge request was sent"""
+		return self.hedged_calls / self.calls if self.calls else 0.0
+
+	def get_hedge_delay(self) -> float:
+		"""Seconds to wait for the primary before sending the hedge request"""
+		if len(self._latencies) < self.min_samples:
+			return self.initial_hedge_delay
+		latencies = sorted(self._latencies)
+		index = min(len(latencies) - 1, max(0, math.ceil(self.hedge_percentile * len(latencies)) - 1))
+		return max(self.min_hedge_delay, latencies[index])
+
+	def _record_latency(self, task: asyncio.Task[Any], start_time: float) -> None:
+		# a cancelled primary lost the race, it would have taken at least this long, so its time is kept as a lower
+		# bound (dropping it would lose the slow tail and ratchet the hedge delay down). A failed primary is no latency.
+		if task.cancelled() or task.exception() is None:
+			self._latencies.append(time.monotonic() - start_time)
+
+	@overload
+	async def ainvoke(self, messages: list[BaseMessage], output_format: None = None) -> ChatInvokeCompletion[str]: ...
+
+	@overload
+	async def ainvoke(self, messages: list[BaseMessage], output_format: type[T]) -> ChatInvokeCompletion[T]: ...
+
+	async def ainvoke(
+		self, messages: list[BaseMessage], output_format: type[T] | None = None
+	) -> ChatInvokeCompletion[T] | ChatInvokeCompletion[str]:
+		self.calls += 1
+		hedge_delay = self.get_hedge_delay()
+		start_time = time.monotonic()
+
+		primary_task = asyncio.create_task(self.primary.ainvoke(messages, output_format))
+		primary_task.add_done_callback(lambda task: self._record_latency(task, start_time))
+		tasks: dict[asyncio.Task[Any], BaseChatModel] = {primary_task: self.primary}
+		try:
+			done, _ = await asyncio.wait({primary_task}, timeout=hedge_delay)
+			if done:
+				return primary_task.result()
+
+			secondary = self.secondary or self.primary
+			self.hedged_calls += 1
+			logger.debug(f'🏁 {self.primary.model} did not answer within {hedge_delay:.1f}s, hedging with {secondary.model}')
+			tasks[asyncio.create_task(secondary.ainvoke(messages, output_format))] = secondary
+
+			pending = set(tasks)
+			first_error: BaseException | None = None
+			while pending:
+				done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+				for task in done:
+					if task.exception() is None:
+						if task is not primary_task:
+							self.secondary_wins += 1
+						return task.result()
+					# a failed request only loses the race, the other one may still answer
+					logger.debug(f'🏁 Hedged request to {tasks[task].model} failed: {type(task.exception()).__name__}')
+					first_error = first_error or task.exception()
+			assert first_error is not None
+			raise first_error
+		finally:
+			for task in tasks:
+				if not task.done():
+					task.cancel()
@@ -3,9 +3,15 @@ This implementation is based on the OpenAI types, while removing all the parts t
 """
 
 # region - Content parts
-from typing import Literal, Union
+import base64
+from collections.abc import Callable
+from typing import Any, Literal, TypeVar, Union
 
 from openai import BaseModel
+from pydantic import ConfigDict, SerializationInfo, SerializerFunctionWrapHandler, field_serializer
+from typing_extensions import Self
+
+T = TypeVar('T')
 
 
 def _truncate(text: str, max_length: int = 50) -> str:
@@ -83,6 +89,106 @@ class ContentPartImageParam(BaseModel):
 		return f'ContentPartImageParam(image_url={repr(self.image_url)})'
 
 
+class _Base64ImageData(str):
+	"""Image data kept in its base64 form until ContentPartImageBytesParam.data is read"""
+
+
+class _LazyImageData:
+	"""
+	Descriptor in front of the `data` field of ContentPartImageBytesParam, decoding base64 data on first access.
+
+	Pydantic stores field values in the instance __dict__, a data descriptor on the class is looked up first.
+	"""
+
+	def __get__(self, instance: Any, owner: type | None = None) -> Any:
+		if instance is None:
+			return self
+		data = instance.__dict__['data']
+		if isinstance(data, _Base64ImageData):
+			object.__setattr__(instance, '_base64', str(data))
+			data = instance.__dict__['data'] = base64.b64decode(data)
+		return data
+
+	def __set__(self, instance: Any, value: Any) -> None:
+		instance.__dict__['data'] = value
+
+
+class ContentPartImageBytesParam(BaseModel):
+	"""
+	An image as raw bytes + MIME type, e.g. a screenshot.
+
+	Each provider serializer encodes it once into the format its API needs (raw bytes for Google/Bedrock/Ollama,
+	base64 for Anthropic, a base64 data URL for OpenAI-like APIs), instead of building a data URL that the
+	serializers split and decode again.
+	"""
+
+	data: bytes
+	media_type: SupportedImageMediaType = 'image/png'
+	detail: Literal['auto', 'low', 'high'] = 'auto'
+	"""Only used by OpenAI-like APIs, see ImageURL.detail"""
+	type: Literal['image_bytes'] = 'image_bytes'
+
+	model_config = ConfigDict(ser_json_bytes='base64', val_json_bytes='base64')
+
+	# the base64 form, computed at most once (or kept from from_base64()). A slot, so it is ignored by == and dumps.
+	__slots__ = ('_base64',)
+
+	@classmethod
+	def from_base64(
+		cls,
+		data: str,
+		media_type: SupportedImageMediaType = 'image/png',
+		detail: Literal['auto', 'low', 'high'] = 'auto',
+	) -> Self:
+		"""
+		Build from base64 data (e.g. a CDP screenshot). Only the string is kept, it is decoded the first time
+		`.data` is read, so providers that take base64 never decode it and it never has to be encoded again.
+		"""
+		part = cls(data=b'', media_type=media_type, detail=detail)
+		part.__dict__['data'] = _Base64ImageData(data)
+		return part
+
+	@field_serializer('data', mode='wrap')
+	def _serialize_data(self, value: Any, handler: SerializerFunctionWrapHandler, info: SerializationInfo) -> Any:
+		if isinstance(value, _Base64ImageData):
+			return str(value) if info.mode_is_json() else self.data
+		return handler(value)
+
+	def to_base64(self) -> str:
+		data = self.__dict__['data']
+		if isinstance(data, _Base64ImageData):
+			return str(data)
+		try:
+			return self._base64
+		except AttributeError:
+			encoded = base64.b64encode(data).decode('ascii')
+			object.__setattr__(self, '_base64', encoded)
+			return encoded
+
+	def to_data_url(self) -> str:
+		return f'data:{self.media_type};base64,{self.to_base64()}'
+
+	def _byte_length(self) -> int:
+		data = self.__dict__['data']
+		if isinstance(data, _Base64ImageData):
+			return len(data) * 3 // 4 - data.count('=', -2)
+		return len(data)
+
+	def __eq__(self, other: Any) -> bool:
+		if isinstance(other, ContentPartImageBytesParam):
+			_ = self.data, other.data  # decode both sides, == compares the stored field values
+		return super().__eq__(other)
+
+	def __str__(self) -> str:
+		return f'🖼️  Image[{self.media_type}, detail={self.detail}]: <{self._byte_length()} bytes>'
+
+	def __repr__(self) -> str:
+		return f'ContentPartImageBytesParam(data=<{self._byte_length()} bytes>, media_type={repr(self.media_type)})'
+
+
+ContentPartImageBytesParam.data = _LazyImageData()  # type: ignore[assignment]
+
+
 class Function(BaseModel):
 	arguments: str
 	"""
@@ -131,12 +237,36 @@ class _MessageBase(BaseModel):
 	"""Whether to cache this message. This is only applicable when using Anthropic models.
 	"""
 
+	# provider specific serializations of this message, see get_serialized(). A slot and not a (private) field,
+	# so it is ignored by ==, model_dump() and copies.
+	__slots__ = ('_serialized',)
+
+	def get_serialized(self, key: str, serialize: Callable[[], T]) -> T:
+		"""
+		Return the serialization of this message for `key` (provider + options), calling serialize() only the first time.
+
+		Messages are sent again on every step, this way only new messages are serialized (and their images re-encoded).
+		Assigning a field clears the cache, so messages must not be mutated in place (e.g. content.append()) once sent.
+		"""
+		try:
+			serialized: dict[str, Any] = self._serialized
+		except AttributeError:
+			serialized = {}
+			object.__setattr__(self, '_serialized', serialized)
+		if key not in serialized:
+			serialized[key] = serialize()
+		return serialized[key]
+
+	def __setattr__(self, name: str, value: Any) -> None:
+		super().__setattr__(name, value)
+		object.__setattr__(self, '_serialized', {})
+
 
 class UserMessage(_MessageBase):
 	role: Literal['user'] = 'user'
 	"""The role of the messages author, in this case `user`."""
 
-	content: str | list[ContentPartTextParam | ContentPartImageParam]
+	content: str | list[ContentPartTextParam | ContentPartImageParam | ContentPartImageBytesParam]
 	"""The contents of the user message."""
 
 	name: str | None = None
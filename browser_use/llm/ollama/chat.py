@@ -5,7 +5,7 @@ import httpx
 from ollama import AsyncClient as OllamaAsyncClient
 from pydantic import BaseModel
 
-from browser_use.llm.base import BaseChatModel
+from browser_use.llm.base import BaseChatModel, ReusableClientMixin
 from browser_use.llm.exceptions import ModelProviderError
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.ollama.serializer import OllamaMessageSerializer
@@ -15,7 +15,7 @@ T = TypeVar('T', bound=BaseModel)
 
 
 @dataclass
-class ChatOllama(BaseChatModel):
+class ChatOllama(BaseChatModel, ReusableClientMixin):
 	"""
 	A wrapper around Ollama's chat model.
 	"""
@@ -46,9 +46,16 @@ class ChatOllama(BaseChatModel):
 
 	def get_client(self) -> OllamaAsyncClient:
 		"""
-		Returns an OllamaAsyncClient client.
+		Returns an OllamaAsyncClient client, built once and reused for every call.
 		"""
-		return OllamaAsyncClient(host=self.host, timeout=self.timeout, **self.client_params or {})
+		return self._get_reusable_client(
+			lambda: OllamaAsyncClient(
+				host=self.host,
+				timeout=self.timeout,
+				**({'limits': self.http_pool_limits} if self.http_pool_limits else {}),
+				**self.client_params or {},
+			)
+		)
 
 	@property
 	def name(self) -> str:
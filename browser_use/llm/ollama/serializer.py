@@ -43,7 +43,9 @@ class OllamaMessageSerializer:
 
 		images: list[Image] = []
 		for part in content:
-			if hasattr(part, 'type') and part.type == 'image_url':
+			if hasattr(part, 'type') and part.type == 'image_bytes':
+				images.append(Image(value=part.data))
+			elif hasattr(part, 'type') and part.type == 'image_url':
 				url = part.image_url.url
 				if url.startswith('data:'):
 					# Handle base64 encoded images
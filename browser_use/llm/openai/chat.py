@@ -1,19 +1,21 @@
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from typing import Any, Literal, TypeVar, overload
 
 import httpx
-from openai import APIConnectionError, APIStatusError, AsyncOpenAI, RateLimitError
+from openai import APIConnectionError, APIStatusError, AsyncOpenAI, DefaultAsyncHttpxClient, RateLimitError
 from openai.types.chat.chat_completion import ChatCompletion
+from openai.types.chat.chat_completion_chunk import ChatCompletionChunk
 from openai.types.shared.chat_model import ChatModel
 from openai.types.shared_params.reasoning_effort import ReasoningEffort
 from openai.types.shared_params.response_format_json_schema import JSONSchema, ResponseFormatJSONSchema
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
-from browser_use.llm.base import BaseChatModel
-from browser_use.llm.exceptions import ModelProviderError
+from browser_use.llm.base import BaseChatModel, ReusableClientMixin
+from browser_use.llm.exceptions import ModelOutputParseError, ModelProviderError, ModelRateLimitError
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.openai.serializer import OpenAIMessageSerializer
+from browser_use.llm.retry import parse_retry_after
 from browser_use.llm.schema import SchemaOptimizer
 from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
 
@@ -23,7 +25,7 @@ ReasoningModels: list[ChatModel | str] = ['o4-mini', 'o3', 'o3-mini', 'o1', 'o1-
 
 
 @dataclass
-class ChatOpenAI(BaseChatModel):
+class ChatOpenAI(BaseChatModel, ReusableClientMixin):
 	"""
 	A wrapper around AsyncOpenAI that implements the BaseLLM protocol.
 
@@ -83,24 +85,25 @@ class ChatOpenAI(BaseChatModel):
 		# Add http_client if provided
 		if self.http_client is not None:
 			client_params['http_client'] = self.http_client
+		elif self.http_pool_limits is not None:
+			client_params['http_client'] = DefaultAsyncHttpxClient(limits=self.http_pool_limits)
 
 		return client_params
 
 	def get_client(self) -> AsyncOpenAI:
 		"""
-		Returns an AsyncOpenAI client.
+		Returns an AsyncOpenAI client, built once and reused for every call.
 
 		Returns:
 			AsyncOpenAI: An instance of the AsyncOpenAI client.
 		"""
-		client_params = self._get_client_params()
-		return AsyncOpenAI(**client_params)
+		return self._get_reusable_client(lambda: AsyncOpenAI(**self._get_client_params()))
 
 	@property
 	def name(self) -> str:
 		return str(self.model)
 
-	def _get_usage(self, response: ChatCompletion) -> ChatInvokeUsage | None:
+	def _get_usage(self, response: ChatCompletion | ChatCompletionChunk) -> ChatInvokeUsage | None:
 		if response.usage is not None:
 			completion_tokens = response.usage.completion_tokens
 			completion_token_details = response.usage.completion_tokens_details
@@ -148,30 +151,7 @@ class ChatOpenAI(BaseChatModel):
 		openai_messages = OpenAIMessageSerializer.serialize_messages(messages)
 
 		try:
-			model_params: dict[str, Any] = {}
-
-			if self.temperature is not None:
-				model_params['temperature'] = self.temperature
-
-			if self.frequency_penalty is not None:
-				model_params['frequency_penalty'] = self.frequency_penalty
-
-			if self.max_completion_tokens is not None:
-				model_params['max_completion_tokens'] = self.max_completion_tokens
-
-			if self.top_p is not None:
-				model_params['top_p'] = self.top_p
-
-			if self.seed is not None:
-				model_params['seed'] = self.seed
-
-			if self.service_tier is not None:
-				model_params['service_tier'] = self.service_tier
-
-			if self.model in ReasoningModels:
-				model_params['reasoning_effort'] = self.reasoning_effort
-				model_params['temperature'] = 1
-				model_params['frequency_penalty'] = 0
+			model_params = self._get_model_params()
 
 			if output_format is None:
 				# Return string response
@@ -188,24 +168,17 @@ class ChatOpenAI(BaseChatModel):
 				)
 
 			else:
-				response_format: JSONSchema = {
-					'name': 'agent_output',
-					'strict': True,
-					'schema': SchemaOptimizer.create_optimized_json_schema(output_format),
-				}
-
 				# Return structured response
 				response = await self.get_client().chat.completions.create(
 					model=self.model,
 					messages=openai_messages,
-					response_format=ResponseFormatJSONSchema(json_schema=response_format, type='json_schema'),
+					response_format=self._get_response_format(output_format),
 					**model_params,
 				)
 
 				if response.choices[0].message.content is None:
-					raise ModelProviderError(
+					raise ModelOutputParseError(
 						message='Failed to parse structured output from model response',
-						status_code=500,
 						model=self.name,
 					)
 
@@ -218,21 +191,113 @@ class ChatOpenAI(BaseChatModel):
 					usage=usage,
 				)
 
-		except RateLimitError as e:
+		except ModelProviderError:
+			raise
+		except Exception as e:
+			raise self._to_model_provider_error(e) from e
+
+	async def ainvoke_streaming(
+		self, messages: list[BaseMessage], output_format: type[T], on_text: Callable[[str], Any]
+	) -> ChatInvokeCompletion[T]:
+		"""
+		Same as ainvoke() with structured output, but streams the response and calls on_text()
+		with each chunk of the JSON as soon as it arrives (e.g. to parse the first actions early).
+		"""
+		openai_messages = OpenAIMessageSerializer.serialize_messages(messages)
+
+		try:
+			stream = await self.get_client().chat.completions.create(
+				model=self.model,
+				messages=openai_messages,
+				response_format=self._get_response_format(output_format),
+				stream=True,
+				stream_options={'include_usage': True},
+				**self._get_model_params(),
+			)
+
+			content_parts: list[str] = []
+			usage = None
+			async for chunk in stream:
+				if chunk.usage is not None:
+					usage = self._get_usage(chunk)
+				if chunk.choices and chunk.choices[0].delta.content:
+					content_parts.append(chunk.choices[0].delta.content)
+					on_text(chunk.choices[0].delta.content)
+
+			if not content_parts:
+				raise ModelOutputParseError(
+					message='Failed to parse structured output from model response',
+					model=self.name,
+				)
+
+			return ChatInvokeCompletion(
+				completion=output_format.model_validate_json(''.join(content_parts)),
+				usage=usage,
+			)
+
+		except ModelProviderError:
+			raise
+		except Exception as e:
+			raise self._to_model_provider_error(e) from e
+
+	def _get_model_params(self) -> dict[str, Any]:
+		model_params: dict[str, Any] = {}
+
+		if self.temperature is not None:
+			model_params['temperature'] = self.temperature
+
+		if self.frequency_penalty is not None:
+			model_params['frequency_penalty'] = self.frequency_penalty
+
+		if self.max_completion_tokens is not None:
+			model_params['max_completion_tokens'] = self.max_completion_tokens
+
+		if self.top_p is not None:
+			model_params['top_p'] = self.top_p
+
+		if self.seed is not None:
+			model_params['seed'] = self.seed
+
+		if self.service_tier is not None:
+			model_params['service_tier'] = self.service_tier
+
+		if self.model in ReasoningModels:
+			model_params['reasoning_effort'] = self.reasoning_effort
+			model_params['temperature'] = 1
+			model_params['frequency_penalty'] = 0
+
+		return model_params
+
+	def _get_response_format(self, output_format: type[BaseModel]) -> ResponseFormatJSONSchema:
+		response_format: JSONSchema = {
+			'name': 'agent_output',
+			'strict': True,
+			'schema': SchemaOptimizer.create_optimized_json_schema(output_format),
+		}
+		return ResponseFormatJSONSchema(json_schema=response_format, type='json_schema')
+
+	def _to_model_provider_error(self, e: Exception) -> ModelProviderError:
+		"""Convert any error raised by the SDK into a ModelProviderError"""
+		if isinstance(e, ValidationError):
+			# the model answered, just not in the requested format: no provider failure to retry or to count against its circuit
+			return ModelOutputParseError(message=f'Failed to parse structured output: {e}', model=self.name)
+
+		if isinstance(e, RateLimitError):
 			error_message = e.response.json().get('error', {})
 			error_message = (
 				error_message.get('message', 'Unknown model error') if isinstance(error_message, dict) else error_message
 			)
-			raise ModelProviderError(
+			return ModelRateLimitError(
 				message=error_message,
 				status_code=e.response.status_code,
 				model=self.name,
-			) from e
+				retry_after=parse_retry_after(e.response.headers),
+			)
 
-		except APIConnectionError as e:
-			raise ModelProviderError(message=str(e), model=self.name) from e
+		if isinstance(e, APIConnectionError):
+			return ModelProviderError(message=str(e), model=self.name)
 
-		except APIStatusError as e:
+		if isinstance(e, APIStatusError):
 			try:
 				error_message = e.response.json().get('error', {})
 			except Exception:
@@ -240,11 +305,11 @@ class ChatOpenAI(BaseChatModel):
 			error_message = (
 				error_message.get('message', 'Unknown model error') if isinstance(error_message, dict) else error_message
 			)
-			raise ModelProviderError(
+			return ModelProviderError(
 				message=error_message,
 				status_code=e.response.status_code,
 				model=self.name,
-			) from e
+				retry_after=parse_retry_after(e.response.headers),
+			)
 
-		except Exception as e:
-			raise ModelProviderError(message=str(e), model=self.name) from e
+		return ModelProviderError(message=str(e), model=self.name)
@@ -1,3 +1,4 @@
+from functools import partial
 from typing import overload
 
 from openai.types.chat import (
@@ -16,6 +17,7 @@ from openai.types.chat.chat_completion_message_tool_call_param import Function
 from browser_use.llm.messages import (
 	AssistantMessage,
 	BaseMessage,
+	ContentPartImageBytesParam,
 	ContentPartImageParam,
 	ContentPartRefusalParam,
 	ContentPartTextParam,
@@ -33,7 +35,14 @@ class OpenAIMessageSerializer:
 		return ChatCompletionContentPartTextParam(text=part.text, type='text')
 
 	@staticmethod
-	def _serialize_content_part_image(part: ContentPartImageParam) -> ChatCompletionContentPartImageParam:
+	def _serialize_content_part_image(
+		part: ContentPartImageParam | ContentPartImageBytesParam,
+	) -> ChatCompletionContentPartImageParam:
+		if part.type == 'image_bytes':
+			return ChatCompletionContentPartImageParam(
+				image_url=ImageURL(url=part.to_data_url(), detail=part.detail),
+				type='image_url',
+			)
 		return ChatCompletionContentPartImageParam(
 			image_url=ImageURL(url=part.image_url.url, detail=part.image_url.detail),
 			type='image_url',
@@ -45,7 +54,7 @@ class OpenAIMessageSerializer:
 
 	@staticmethod
 	def _serialize_user_content(
-		content: str | list[ContentPartTextParam | ContentPartImageParam],
+		content: str | list[ContentPartTextParam | ContentPartImageParam | ContentPartImageBytesParam],
 	) -> str | list[ChatCompletionContentPartTextParam | ChatCompletionContentPartImageParam]:
 		"""Serialize content for user messages (text and images allowed)."""
 		if isinstance(content, str):
@@ -55,7 +64,7 @@ class OpenAIMessageSerializer:
 		for part in content:
 			if part.type == 'text':
 				serialized_parts.append(OpenAIMessageSerializer._serialize_content_part_text(part))
-			elif part.type == 'image_url':
+			elif part.type == 'image_url' or part.type == 'image_bytes':
 				serialized_parts.append(OpenAIMessageSerializer._serialize_content_part_image(part))
 		return serialized_parts
 
@@ -162,4 +171,5 @@ class OpenAIMessageSerializer:
 
 	@staticmethod
 	def serialize_messages(messages: list[BaseMessage]) -> list[ChatCompletionMessageParam]:
-		return [OpenAIMessageSerializer.serialize(m) for m in messages]
+		# memoized on the messages, so only the messages that are new since the last call get serialized
+		return [m.get_serialized('openai', partial(OpenAIMessageSerializer.serialize, m)) for m in messages]
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import Any, TypeVar, overload
 
 import httpx
-from openai import APIConnectionError, APIStatusError, AsyncOpenAI, RateLimitError
+from openai import APIConnectionError, APIStatusError, AsyncOpenAI, DefaultAsyncHttpxClient, RateLimitError
 from openai.types.chat.chat_completion import ChatCompletion
 from openai.types.shared_params.response_format_json_schema import (
 	JSONSchema,
@@ -11,7 +11,7 @@ from openai.types.shared_params.response_format_json_schema import (
 )
 from pydantic import BaseModel
 
-from browser_use.llm.base import BaseChatModel
+from browser_use.llm.base import BaseChatModel, ReusableClientMixin
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.openrouter.serializer import OpenRouterMessageSerializer
@@ -22,7 +22,7 @@ T = TypeVar('T', bound=BaseModel)
 
 
 @dataclass
-class ChatOpenRouter(BaseChatModel):
+class ChatOpenRouter(BaseChatModel, ReusableClientMixin):
 	"""
 	A wrapper around OpenRouter's chat API, which provides access to various LLM models
 	through a unified OpenAI-compatible interface.
@@ -75,6 +75,8 @@ class ChatOpenRouter(BaseChatModel):
 		# Add http_client if provided
 		if self.http_client is not None:
 			client_params['http_client'] = self.http_client
+		elif self.http_pool_limits is not None:
+			client_params['http_client'] = DefaultAsyncHttpxClient(limits=self.http_pool_limits)
 
 		return client_params
 
@@ -85,10 +87,7 @@ class ChatOpenRouter(BaseChatModel):
 		Returns:
 		    AsyncOpenAI: An instance of the AsyncOpenAI client with OpenRouter base URL.
 		"""
-		if not hasattr(self, '_client'):
-			client_params = self._get_client_params()
-			self._client = AsyncOpenAI(**client_params)
-		return self._client
+		return self._get_reusable_client(lambda: AsyncOpenAI(**self._get_client_params()))
 
 	@property
 	def name(self) -> str:
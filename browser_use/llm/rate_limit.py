@@ -0,0 +1,243 @@
+"""
+Process-wide rate limiting for LLM calls.
+
+Wrap a chat model to make its calls wait for free capacity in a requests-per-minute (RPM) and a
+tokens-per-minute (TPM) token bucket before they are sent. The buckets are shared by every wrapper of the
+same provider + model in the process, so any number of agents running in parallel together stay within the
+provider quota instead of running into 429 storms and sleeping them off.
+
+	llm = RateLimitedChatModel(ChatOpenAI(model='gpt-4.1-mini'), requests_per_minute=500, tokens_per_minute=200_000)
+	agents = [Agent(task=task, llm=llm) for task in tasks]
+	await asyncio.gather(*(agent.run() for agent in agents))
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar, overload
+
+from pydantic import BaseModel
+
+from browser_use.llm.base import BaseChatModel
+from browser_use.llm.exceptions import ModelRateLimitError
+from browser_use.llm.messages import BaseMessage, ContentPartImageBytesParam, ContentPartImageParam
+from browser_use.llm.views import ChatInvokeCompletion
+
+T = TypeVar('T', bound=BaseModel)
+
+logger = logging.getLogger(__name__)
+
+# rough estimates used to reserve tokens before the request is sent, corrected with the real usage afterwards
+CHARS_PER_TOKEN = 4
+IMAGE_TOKENS_ESTIMATE = 1_000
+
+
+def estimate_prompt_tokens(messages: list[BaseMessage]) -> int:
+	"""Cheap estimate of the prompt tokens of a request, without a provider specific tokenizer"""
+	tokens = 0
+	for message in messages:
+		tokens += len(message.text) // CHARS_PER_TOKEN + 4  # + per message overhead
+		if isinstance(message.content, list):
+			tokens += IMAGE_TOKENS_ESTIMATE * sum(
+				isinstance(part, (ContentPartImageParam, ContentPartImageBytesParam)) for part in message.content
+			)
+	return tokens
+
+
+@dataclass
+class TokenBucket:
+	"""
+	A token bucket refilled continuously at `capacity` per minute.
+
+	Reservations are granted in call order and may take the level below zero: the caller then waits until the
+	bucket has refilled the debt. Later callers queue up behind the debt, which keeps the waiting queue FIFO-fair.
+	"""
+
+	capacity: float
+	level: float
+	updated_at: float = field(default_factory=time.monotonic)
+
+	def _refill(self, now: float) -> None:
+		self.level = min(self.capacity, self.level + (now - self.updated_at) * self.capacity / 60)
+		self.updated_at = now
+
+	def reserve(self, amount: float, now: float) -> tuple[float, float]:
+		"""
+		Take `amount` out of the bucket, return the seconds to wait until the reservation is covered and the amount
+		actually taken, which is what has to be given back (a request larger than the bucket only takes a full one).
+		"""
+		self._refill(now)
+		debited = min(amount, self.capacity)
+		self.level -= debited
+		return max(0.0, -self.level * 60 / self.capacity), debited
+
+	def adjust(self, amount: float, now: float) -> None:
+		"""Give back (positive) or take (negative) tokens after the fact, e.g. when the real usage is known"""
+		self._refill(now)
+		self.level = min(self.capacity, self.level + amount)
+
+	def drain(self, now: float) -> None:
+		"""Empty the bucket, e.g. after the provider reported a rate limit we did not see coming"""
+		self._refill(now)
+		self.level = min(self.level, 0)
+
+
+class LLMRateLimiter:
+	"""RPM + TPM limiter for one provider + model, shared by all agents (and threads) of the process"""
+
+	def __init__(self, requests_per_minute: int | None = None, tokens_per_minute: int | None = None):
+		self._lock = threading.Lock()
+		self.requests: TokenBucket | None = None
+		self.tokens: TokenBucket | None = None
+		self.configure(requests_per_minute, tokens_per_minute)
+
+	def configure(self, requests_per_minute: int | None, tokens_per_minute: int | None) -> None:
+		"""Set the limits, None leaves a limit as it is. Queued reservations keep their place."""
+		with self._lock:
+			if requests_per_minute is not None:
+				self.requests = self._resize(self.requests, requests_per_minute)
+			if tokens_per_minute is not None:
+				self.tokens = self._resize(self.tokens, tokens_per_minute)
+
+	@staticmethod
+	def _resize(bucket: TokenBucket | None, capacity: int) -> TokenBucket:
+		if capacity <= 0:
+			raise ValueError(f'Rate limits must be positive, got {capacity}')
+		if bucket is None:
+			return TokenBucket(capacity=capacity, level=capacity)
+		bucket.capacity = capacity
+		bucket.level = min(bucket.level, capacity)
+		return bucket
+
+	async def acquire(self, estimated_tokens: int) -> tuple[float, float]:
+		"""
+		Wait until the request fits in both buckets, return the number of seconds waited and the tokens reserved
+		(at most the TPM capacity), to pass to release() or record_usage()
+		"""
+		with self._lock:
+			now = time.monotonic()
+			request_wait = self.requests.reserve(1, now)[0] if self.requests else 0.0
+			token_wait, reserved_tokens = self.tokens.reserve(estimated_tokens, now) if self.tokens else (0.0, 0.0)
+			wait = max(request_wait, token_wait)
+		if wait > 0:
+			try:
+				await asyncio.sleep(wait)
+			except asyncio.CancelledError:
+				# the request is never sent, hand the reservation to the requests queued behind it
+				self.release(reserved_tokens)
+				raise
+		return wait, reserved_tokens
+
+	def release(self, reserved_tokens: float) -> None:
+		"""Give back a reservation for a request that was not sent"""
+		with self._lock:
+			now = time.monotonic()
+			if self.requests:
+				self.requests.adjust(1, now)
+			if self.tokens:
+				self.tokens.adjust(reserved_tokens, now)
+
+	def record_usage(self, reserved_tokens: float, actual_tokens: int) -> None:
+		"""Correct the token reservation of a finished request with the usage reported by the provider"""
+		with self._lock:
+			if self.tokens:
+				self.tokens.adjust(reserved_tokens - actual_tokens, time.monotonic())
+
+	def record_rate_limited(self) -> None:
+		"""The provider rejected a request: our view of the quota is off, let the buckets refill before the next one"""
+		with self._lock:
+			now = time.monotonic()
+			if self.requests:
+				self.requests.drain(now)
+			if self.tokens:
+				self.tokens.drain(now)
+
+
+_rate_limiters: dict[tuple[str, str], LLMRateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+	provider: str, model: str, requests_per_minute: int | None = None, tokens_per_minute: int | None = None
+) -> LLMRateLimiter:
+	"""Get the process-wide limiter for a provider + model, updating its limits if any are given"""
+	with _rate_limiters_lock:
+		limiter = _rate_limiters.get((provider, model))
+		if limiter is None:
+			limiter = _rate_limiters[(provider, model)] = LLMRateLimiter(requests_per_minute, tokens_per_minute)
+			return limiter
+	limiter.configure(requests_per_minute, tokens_per_minute)
+	return limiter
+
+
+@dataclass
+class RateLimitedChatModel(BaseChatModel):
+	"""
+	A chat model that wraps another chat model and sends its calls through the process-wide RPM/TPM limiter
+	of its provider + model.
+
+	Each call reserves its estimated prompt tokens + `estimated_completion_tokens` up front, and the reservation
+	is corrected with the real `ChatInvokeUsage` once the response arrives.
+	"""
+
+	llm: BaseChatModel
+	requests_per_minute: int | None = None
+	tokens_per_minute: int | None = None
+	estimated_completion_tokens: int = 1_000
+
+	# seconds spent waiting for the limiter by calls through this wrapper
+	total_wait_seconds: float = field(default=0.0, init=False)
+	limiter: LLMRateLimiter = field(init=False, repr=False)
+
+	def __post_init__(self) -> None:
+		self.model = self.llm.model
+		self.limiter = get_rate_limiter(self.llm.provider, self.llm.model, self.requests_per_minute, self.tokens_per_minute)
+		# offer streaming only if the wrapped model streams, the agent checks hasattr(llm, 'ainvoke_streaming')
+		if hasattr(self.llm, 'ainvoke_streaming'):
+			self.ainvoke_streaming = self._ainvoke_streaming
+
+	@property
+	def provider(self) -> str:
+		return self.llm.provider
+
+	@property
+	def name(self) -> str:
+		return self.llm.name
+
+	@overload
+	async def ainvoke(self, messages: list[BaseMessage], output_format: None = None) -> ChatInvokeCompletion[str]: ...
+
+	@overload
+	async def ainvoke(self, messages: list[BaseMessage], output_format: type[T]) -> ChatInvokeCompletion[T]: ...
+
+	async def ainvoke(
+		self, messages: list[BaseMessage], output_format: type[T] | None = None
+	) -> ChatInvokeCompletion[T] | ChatInvokeCompletion[str]:
+		return await self._call(messages, lambda: self.llm.ainvoke(messages, output_format))
+
+	async def _ainvoke_streaming(
+		self, messages: list[BaseMessage], output_format: type[T], on_text: Callable[[str], Any]
+	) -> ChatInvokeCompletion[T]:
+		return await self._call(messages, lambda: self.llm.ainvoke_streaming(messages, output_format, on_text))  # type: ignore[attr-defined]
+
+	async def _call(
+		self, messages: list[BaseMessage], invoke: Callable[[], Awaitable[ChatInvokeCompletion[Any]]]
+	) -> ChatInvokeCompletion[Any]:
+		estimated_tokens = estimate_prompt_tokens(messages) + self.estimated_completion_tokens
+		waited, reserved_tokens = await self.limiter.acquire(estimated_tokens)
+		if waited > 0:
+			self.total_wait_seconds += waited
+			logger.debug(f'⏳ Waited {waited:.1f}s for the {self.llm.provider}/{self.llm.model} rate limit')
+
+		try:
+			response = await invoke()
+		except ModelRateLimitError:
+			self.limiter.record_rate_limited()
+			raise
+
+		if response.usage:
+			self.limiter.record_usage(reserved_tokens, response.usage.total_tokens)
+		return response
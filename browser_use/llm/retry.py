@@ -0,0 +1,303 @@
+"""
+One retry policy for LLM calls, whatever the provider.
+
+Wrap a chat model to retry transient provider errors (429, 5xx, connection errors) with exponential backoff
+and full jitter, honouring the provider's Retry-After, within a cap on the total time spent waiting per call.
+A circuit breaker shared by every wrapper of the same provider + model stops sending requests to a provider
+whose error rate crossed a threshold: calls then fail fast, or go to a fallback model, until a trial request
+after the cooldown succeeds again.
+
+	llm = RetryingChatModel(ChatOpenAI(model='gpt-4.1'), fallback_llm=ChatAnthropic(model='claude-sonnet-4-0'))
+	agent = Agent(task='...', llm=llm)
+"""
+
+import asyncio
+import json
+import logging
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field, fields, is_dataclass, replace
+from email.utils import parsedate_to_datetime
+from typing import Any, Literal, TypeVar, overload
+
+from pydantic import BaseModel, ValidationError
+
+from browser_use.llm.base import BaseChatModel
+from browser_use.llm.exceptions import ModelCircuitOpenError, ModelOutputParseError, ModelProviderError
+from browser_use.llm.messages import BaseMessage
+from browser_use.llm.views import ChatInvokeCompletion
+
+T = TypeVar('T', bound=BaseModel)
+
+logger = logging.getLogger(__name__)
+
+
+def parse_retry_after(headers: Mapping[str, str] | None) -> float | None:
+	"""Seconds to wait according to the retry-after-ms / Retry-After headers of a response, None if not given"""
+	if not headers:
+		return None
+	try:
+		if retry_after_ms := headers.get('retry-after-ms'):
+			return max(0.0, float(retry_after_ms) / 1000)
+		if retry_after := headers.get('retry-after'):
+			try:
+				return max(0.0, float(retry_after))
+			except ValueError:
+				# HTTP date, e.g. "Wed, 21 Oct 2015 07:28:00 GMT"
+				return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+	except (TypeError, ValueError):
+		pass
+	return None
+
+
+def is_output_parse_error(error: BaseException) -> bool:
+	"""The model answered, but its response did not parse into the output format (chat models wrap it as a 502)"""
+	return isinstance(error, ModelOutputParseError) or isinstance(error.__cause__, (ValidationError, json.JSONDecodeError))
+
+
+def is_provider_failure(error: BaseException) -> bool:
+	"""Errors that tell the provider is down or overloaded: transport errors, 5xx and 429 responses"""
+	if isinstance(error, ModelCircuitOpenError) or is_output_parse_error(error):
+		return False
+	if isinstance(error, ModelProviderError):
+		return error.status_code >= 500 or error.status_code == 429
+	return isinstance(error, (TimeoutError, ConnectionError))
+
+
+@dataclass
+class RetryPolicy:
+	"""When and how long to wait before retrying a failed LLM call"""
+
+	max_attempts: int = 3  # calls in total, including the first one
+	base_delay: float = 1.0  # seconds, doubled on every attempt
+	max_delay: float = 30.0  # cap on a single backoff delay
+	max_total_delay: float = 60.0  # cap on the total time one call may spend waiting for retries
+	retryable_status_codes: frozenset[int] = frozenset({408, 409, 429, 500, 502, 503, 504, 529})
+
+	def is_retryable(self, error: BaseException) -> bool:
+		if isinstance(error, ModelCircuitOpenError) or is_output_parse_error(error):
+			return False
+		if isinstance(error, ModelProviderError):
+			return error.status_code in self.retryable_status_codes
+		return isinstance(error, (TimeoutError, ConnectionError))
+
+	def get_delay(self, attempt: int, error: BaseException) -> float:
+		"""Delay before the next attempt: the provider's Retry-After if given, otherwise jittered exponential backoff"""
+		retry_after = getattr(error, 'retry_after', None)
+		if retry_after is not None:
+			return retry_after
+		return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+class CircuitBreaker:
+	"""
+	Tracks the error rate of one provider + model over its last `window_size` calls.
+
+	closed: requests go through. Once at least `min_calls` were made and the share of failures reaches
+	`failure_rate_threshold`, the circuit opens: requests are refused for `cooldown_seconds`. After that it is
+	half-open: a single trial request goes through, and its outcome closes or re-opens the circuit. A trial that
+	was cancelled re-opens the circuit, and one that has not finished after `trial_timeout_seconds` is given up
+	on so the next caller makes a new trial.
+	"""
+
+	def __init__(
+		self,
+		failure_rate_threshold: float = 0.5,
+		window_size: int = 20,
+		min_calls: int = 5,
+		cooldown_seconds: float = 30.0,
+		trial_timeout_seconds: float = 120.0,
+	):
+		self.failure_rate_threshold = failure_rate_threshold
+		self.min_calls = min_calls
+		self.cooldown_seconds = cooldown_seconds
+		self.trial_timeout_seconds = trial_timeout_seconds
+		self.state: Literal['closed', 'open', 'half_open'] = 'closed'
+		self._outcomes: deque[bool] = deque(maxlen=window_size)  # True = failure
+		self._opened_at = 0.0
+		self._trial_started_at = 0.0
+		self._lock = threading.Lock()
+
+	def allow_request(self) -> bool:
+		with self._lock:
+			if self.state == 'closed':
+				return True
+			now = time.monotonic()
+			if (self.state == 'open' and now - self._opened_at >= self.cooldown_seconds) or (
+				self.state == 'half_open' and now - self._trial_started_at >= self.trial_timeout_seconds
+			):
+				self.state = 'half_open'
+				self._trial_started_at = now
+				return True  # this caller makes the trial request
+			return False
+
+	@property
+	def seconds_until_retry(self) -> float:
+		"""Seconds until the circuit lets a trial request through (0 when closed)"""
+		if self.state == 'closed':
+			return 0.0
+		if self.state == 'half_open':
+			return max(0.0, self.trial_timeout_seconds - (time.monotonic() - self._trial_started_at))
+		return max(0.0, self.cooldown_seconds - (time.monotonic() - self._opened_at))
+
+	def record_success(self) -> None:
+		with self._lock:
+			if self.state == 'half_open':
+				self.state = 'closed'
+				self._outcomes.clear()
+			self._outcomes.append(False)
+
+	def record_failure(self) -> None:
+		with self._lock:
+			self._outcomes.append(True)
+			if self.state == 'half_open' or (
+				len(self._outcomes) >= self.min_calls and sum(self._outcomes) / len(self._outcomes) >= self.failure_rate_threshold
+			):
+				self.state = 'open'
+				self._opened_at = time.monotonic()
+
+	def record_cancelled(self) -> None:
+		"""A cancelled call says nothing about the provider, unless it was the trial: then nobody would ever finish it"""
+		with self._lock:
+			if self.state == 'half_open':
+				self.state = 'open'
+				self._opened_at = time.monotonic()
+
+
+_circuit_breakers: dict[tuple[str, str], CircuitBreaker] = {}
+_circuit_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(provider: str, model: str) -> CircuitBreaker:
+	"""Get the process-wide circuit breaker for a provider + model"""
+	with _circuit_breakers_lock:
+		breaker = _circuit_breakers.get((provider, model))
+		if breaker is None:
+			breaker = _circuit_breakers[(provider, model)] = CircuitBreaker()
+		return breaker
+
+
+@dataclass
+class RetryingChatModel(BaseChatModel):
+	"""
+	A chat model that wraps another chat model and retries its transient errors according to a RetryPolicy,
+	behind the process-wide circuit breaker of its provider + model.
+
+	The SDK's own retries are turned off (calls go to a copy of the wrapped model with `max_retries=0`) so a failing
+	call is retried by this policy only, instead of up to max_retries SDK retries for each of our attempts.
+	"""
+
+	llm: BaseChatModel
+	policy: RetryPolicy = field(default_factory=RetryPolicy)
+	# model to send calls to while the circuit of `llm` is open, None = fail fast with ModelCircuitOpenError
+	fallback_llm: BaseChatModel | None = None
+	use_circuit_breaker: bool = True
+	disable_sdk_retries: bool = True
+
+	circuit_breaker: CircuitBreaker | None = field(default=None, init=False, repr=False)
+
+	def __post_init__(self) -> None:
+		self.model = self.llm.model
+		if self.use_circuit_breaker:
+			self.circuit_breaker = get_circuit_breaker(self.llm.provider, self.llm.model)
+		if self.disable_sdk_retries and getattr(self.llm, 'max_retries', 0):
+			if is_dataclass(self.llm) and 'max_retries' in {f.name for f in fields(self.llm) if f.init}:
+				# a copy builds its own SDK client with max_retries=0, the caller's model (and its client) is left alone
+				self.llm = replace(self.llm, max_retries=0)  # type: ignore[type-var]
+			else:
+				logger.debug(
+					f'Cannot turn off the SDK retries of {type(self.llm).__name__}, they add to the retries of this policy'
+				)
+		# offer streaming only if the wrapped model streams, the agent checks hasattr(llm, 'ainvoke_streaming')
+		if hasattr(self.llm, 'ainvoke_streaming'):
+			self.ainvoke_streaming = self._ainvoke_streaming
+
+	@property
+	def provider(self) -> str:
+		return self.llm.provider
+
+	@property
+	def name(self) -> str:
+		return self.llm.name
+
+	@overload
+	async def ainvoke(self, messages: list[BaseMessage], output_format: None = None) -> ChatInvokeCompletion[str]: ...
+
+	@overload
+	async def ainvoke(self, messages: list[BaseMessage], output_format: type[T]) -> ChatInvokeCompletion[T]: ...
+
+	async def ainvoke(
+		self, messages: list[BaseMessage], output_format: type[T] | None = None
+	) -> ChatInvokeCompletion[T] | ChatInvokeCompletion[str]:
+		return await self._call(lambda llm: llm.ainvoke(messages, output_format))
+
+	async def _ainvoke_streaming(
+		self, messages: list[BaseMessage], output_format: type[T], on_text: Callable[[str], Any]
+	) -> ChatInvokeCompletion[T]:
+		streamed = False
+
+		def track_text(chunk: str) -> None:
+			nonlocal streamed
+			streamed = True
+			on_text(chunk)
+
+		def invoke(llm: BaseChatModel) -> Awaitable[ChatInvokeCompletion[Any]]:
+			if hasattr(llm, 'ainvoke_streaming'):
+				return llm.ainvoke_streaming(messages, output_format, track_text)  # type: ignore[attr-defined]
+			return llm.ainvoke(messages, output_format)  # e.g. a fallback_llm that does not stream
+
+		# once text was handed to on_text a retry would stream it a second time, only retry before the first chunk
+		return await self._call(invoke, can_retry=lambda: not streamed)
+
+	async def _call(
+		self,
+		invoke: Callable[[BaseChatModel], Awaitable[ChatInvokeCompletion[Any]]],
+		can_retry: Callable[[], bool] = lambda: True,
+	) -> ChatInvokeCompletion[Any]:
+		total_delay = 0.0
+		attempt = 0
+		while True:
+			attempt += 1
+			if self.circuit_breaker and not self.circuit_breaker.allow_request():
+				if self.fallback_llm is not None:
+					logger.warning(f'🔀 {self.llm.provider}/{self.llm.model} circuit is open, using {self.fallback_llm.model}')
+					return await invoke(self.fallback_llm)
+				raise ModelCircuitOpenError(
+					f'{self.llm.provider}/{self.llm.model} is failing too often, not sending requests for now',
+					model=self.llm.model,
+					retry_after=self.circuit_breaker.seconds_until_retry,
+				)
+
+			try:
+				response = await invoke(self.llm)
+			except asyncio.CancelledError:
+				# e.g. the agent's llm_timeout, re-open a half-open circuit instead of waiting for a trial that never ends
+				if self.circuit_breaker:
+					self.circuit_breaker.record_cancelled()
+				raise
+			except Exception as e:
+				if self.circuit_breaker:
+					if is_provider_failure(e):
+						self.circuit_breaker.record_failure()
+					else:
+						self.circuit_breaker.record_success()  # the provider is up, the request or the response was wrong
+				if not self.policy.is_retryable(e):
+					raise
+
+				delay = self.policy.get_delay(attempt, e)
+				if not can_retry() or attempt >= self.policy.max_attempts or total_delay + delay > self.policy.max_total_delay:
+					raise
+				logger.warning(
+					f'⏳ {self.llm.provider}/{self.llm.model} call failed ({type(e).__name__}: {e}), '
+					f'retry {attempt}/{self.policy.max_attempts - 1} in {delay:.1f}s'
+				)
+				await asyncio.sleep(delay)
+				total_delay += delay
+				continue
+
+			if self.circuit_breaker:
+				self.circuit_breaker.record_success()
+			return response
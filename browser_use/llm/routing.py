@@ -0,0 +1,217 @@
+"""
+Route each LLM call to a cheap/fast model or a strong model.
+
+Most agent steps (click the search box, accept the cookie banner) do not need the strongest model. The router
+sends steps to the cheap model and escalates to the strong model when the agent struggles: consecutive failures,
+actions that returned an error, a page that stopped changing, or a prompt too large for the cheap model. After
+a few successful steps on the strong model it goes back to the cheap one.
+
+	llm = RoutingChatModel(cheap=ChatOpenAI(model='gpt-4.1-mini'), strong=ChatOpenAI(model='gpt-4.1'))
+	agent = Agent(task='...', llm=llm)
+	...
+	print(f'{llm.strong_calls}/{llm.cheap_calls + llm.strong_calls} calls used the strong model')
+
+The Agent passes its per-step signals to the router before every step, so use one router per Agent. Only the
+step calls are routed: unless a page_extraction_llm is given, the Agent extracts page content with the cheap model.
+"""
+
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Literal, TypeVar, overload
+
+from pydantic import BaseModel
+
+from browser_use.llm.base import BaseChatModel
+from browser_use.llm.messages import BaseMessage
+from browser_use.llm.rate_limit import estimate_prompt_tokens
+from browser_use.llm.views import ChatInvokeCompletion
+
+T = TypeVar('T', bound=BaseModel)
+
+logger = logging.getLogger(__name__)
+
+ModelTier = Literal['cheap', 'strong']
+
+
+@dataclass
+class RoutingSignals:
+	"""What the agent knows about the step a routed call is made for"""
+
+	step_number: int | None = None
+	consecutive_failures: int = 0  # failed steps in a row, AgentState.consecutive_failures
+	last_step_errors: int = 0  # action results of the previous step that returned an error
+	page_changed: bool | None = None  # whether the previous step changed the page, None = unknown
+
+
+@dataclass
+class RoutingDecision:
+	"""Which model a call was routed to and why"""
+
+	step_number: int | None
+	tier: ModelTier
+	model: str
+	reason: str
+	estimated_prompt_tokens: int
+	latency: float | None = None  # seconds, None until the call finished successfully
+	succeeded: bool | None = None
+
+
+@dataclass
+class RoutingChatModel(BaseChatModel):
+	"""
+	A chat model that sends each call to `cheap` or `strong` based on how the agent is doing.
+
+	Escalates to `strong` after `escalate_after_failures` consecutive failures, after a step whose actions
+	returned an error, after `escalate_after_unchanged_steps` steps that did not change the page, and for prompts
+	over `max_cheap_prompt_tokens`. Goes back to `cheap` after `deescalate_after_successes` successful steps.
+	A call that fails on `cheap` is retried on `strong` right away.
+	"""
+
+	cheap: BaseChatModel
+	strong: BaseChatModel
+	escalate_after_failures: int = 1
+	escalate_after_unchanged_steps: int = 3
+	deescalate_after_successes: int = 2
+	max_cheap_prompt_tokens: int | None = None  # None = no limit
+	max_decisions: int = 100  # routing decisions kept in `decisions`
+
+	cheap_calls: int = field(default=0, init=False)
+	strong_calls: int = field(default=0, init=False)
+	decisions: deque[RoutingDecision] = field(init=False, repr=False)
+	_signals: RoutingSignals | None = field(default=None, init=False, repr=False)
+	_escalated: bool = field(default=False, init=False, repr=False)
+	_successful_steps: int = field(default=0, init=False, repr=False)
+	_unchanged_steps: int = field(default=0, init=False, repr=False)
+	_failed_calls: int = field(default=0, init=False, repr=False)
+	_tier: ModelTier = field(default='cheap', init=False, repr=False)
+
+	def __post_init__(self) -> None:
+		# the model of the last routed call, so token usage is attributed to the model that actually answered
+		self.model = self.cheap.model
+		self.decisions = deque(maxlen=self.max_decisions)
+
+	@property
+	def provider(self) -> str:
+		return self.cheap.provider
+
+	@property
+	def name(self) -> str:
+		return self.cheap.name
+
+	def set_step_signals(self, signals: RoutingSignals) -> None:
+		"""Called by the agent before each step with the outcome of the previous one"""
+		if signals.page_changed is False:
+			self._unchanged_steps += 1
+		elif signals.page_changed is True:
+			self._unchanged_steps = 0
+		if self._escalated:
+			if signals.consecutive_failures or signals.last_step_errors:
+				self._successful_steps = 0
+			else:
+				self._successful_steps += 1
+		self._signals = signals
+
+	def route(self, messages: list[BaseMessage]) -> RoutingDecision:
+		"""Pick the model for the next call and update the escalation state"""
+		signals = self._signals or RoutingSignals()
+		estimated_prompt_tokens = estimate_prompt_tokens(messages)
+		failures = max(signals.consecutive_failures, self._failed_calls)
+
+		escalation_reason = None
+		if failures >= self.escalate_after_failures:
+			escalation_reason = f'{failures} consecutive failures'
+		elif signals.last_step_errors:
+			escalation_reason = f'{signals.last_step_errors} actions of the last step failed'
+		elif self._unchanged_steps >= self.escalate_after_unchanged_steps:
+			escalation_reason = f'page unchanged for {self._unchanged_steps} steps'
+
+		tier: ModelTier
+		if escalation_reason:
+			tier, reason = 'strong', escalation_reason
+			self._escalated = True
+			self._successful_steps = 0
+		elif self._escalated and self._successful_steps < self.deescalate_after_successes:
+			tier, reason = (
+				'strong',
+				f'{self._successful_steps}/{self.deescalate_after_successes} successful steps since escalating',
+			)
+		elif self._escalated:
+			tier, reason = 'cheap', f'{self._successful_steps} successful steps since escalating'
+			self._escalated = False
+		else:
+			tier, reason = 'cheap', 'no sign of trouble'
+
+		# a large prompt goes to the strong model for this call only
+		if (
+			tier == 'cheap'
+			and self.max_cheap_prompt_tokens is not None
+			and estimated_prompt_tokens > self.max_cheap_prompt_tokens
+		):
+			tier, reason = 'strong', f'~{estimated_prompt_tokens} prompt tokens'
+
+		llm = self.strong if tier == 'strong' else self.cheap
+		return RoutingDecision(
+			step_number=signals.step_number,
+			tier=tier,
+			model=llm.model,
+			reason=reason,
+			estimated_prompt_tokens=estimated_prompt_tokens,
+		)
+
+	def _record(self, decision: RoutingDecision) -> None:
+		self.decisions.append(decision)
+		step = f'Step {decision.step_number}: ' if decision.step_number is not None else ''
+		message = f'🔀 {step}{decision.tier} model {decision.model} ({decision.reason})'
+		if decision.tier != self._tier:
+			logger.info(message)
+		else:
+			logger.debug(message)
+		self._tier = decision.tier
+		self.model = decision.model
+		if decision.tier == 'strong':
+			self.strong_calls += 1
+		else:
+			self.cheap_calls += 1
+
+	@overload
+	async def ainvoke(self, messages: list[BaseMessage], output_format: None = None) -> ChatInvokeCompletion[str]: ...
+
+	@overload
+	async def ainvoke(self, messages: list[BaseMessage], output_format: type[T]) -> ChatInvokeCompletion[T]: ...
+
+	async def ainvoke(
+		self, messages: list[BaseMessage], output_format: type[T] | None = None
+	) -> ChatInvokeCompletion[T] | ChatInvokeCompletion[str]:
+		decision = self.route(messages)
+		self._record(decision)
+		start_time = time.monotonic()
+		try:
+			response = await (self.strong if decision.tier == 'strong' else self.cheap).ainvoke(messages, output_format)
+		except Exception as e:
+			decision.succeeded = False
+			self._failed_calls += 1
+			if decision.tier == 'strong':
+				raise
+			escalation = RoutingDecision(
+				step_number=decision.step_number,
+				tier='strong',
+				model=self.strong.model,
+				reason=f'cheap model failed: {type(e).__name__}',
+				estimated_prompt_tokens=decision.estimated_prompt_tokens,
+			)
+			self._escalated = True
+			self._successful_steps = 0
+			self._record(escalation)
+			decision, start_time = escalation, time.monotonic()
+			try:
+				response = await self.strong.ainvoke(messages, output_format)
+			except Exception:
+				escalation.succeeded = False
+				raise
+
+		decision.latency = time.monotonic() - start_time
+		decision.succeeded = True
+		self._failed_calls = 0
+		return response
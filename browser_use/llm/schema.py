@@ -2,10 +2,16 @@
 Utilities for creating optimized Pydantic schemas for LLM usage.
 """
 
+import json
+import weakref
 from typing import Any
 
 from pydantic import BaseModel
 
+# optimized schemas are pure functions of the model class, so they're built once per class and kept as compact JSON
+# (weak keys: the dynamically created AgentOutput/ActionModel types are dropped from the cache along with the class)
+_optimized_json_schema_cache: 'weakref.WeakKeyDictionary[type[BaseModel], str]' = weakref.WeakKeyDictionary()
+
 
 class SchemaOptimizer:
 	@staticmethod
@@ -14,12 +20,33 @@ class SchemaOptimizer:
 		Create the most optimized schema by flattening all $ref/$defs while preserving
 		FULL descriptions and ALL action definitions. Also ensures OpenAI strict mode compatibility.
 
+		The schema is only generated once per model class, every call returns a fresh copy that callers may modify.
+
 		Args:
 			model: The Pydantic model to optimize
 
 		Returns:
 			Optimized schema with all $refs resolved and strict mode compatibility
 		"""
+		return json.loads(SchemaOptimizer.create_optimized_json_schema_str(model))
+
+	@staticmethod
+	def create_optimized_json_schema_str(model: type[BaseModel]) -> str:
+		"""Same as create_optimized_json_schema() but as a cached compact JSON string, for sending the schema verbatim"""
+		schema_json = _optimized_json_schema_cache.get(model)
+		if schema_json is None:
+			schema_json = json.dumps(SchemaOptimizer._build_optimized_json_schema(model), separators=(',', ':'))
+			_optimized_json_schema_cache[model] = schema_json
+		return schema_json
+
+	@staticmethod
+	def estimate_tokens(model: type[BaseModel]) -> int:
+		"""Rough number of prompt tokens the optimized schema takes (~4 characters per token, no provider tokenizer)"""
+		return len(SchemaOptimizer.create_optimized_json_schema_str(model)) // 4
+
+	@staticmethod
+	def _build_optimized_json_schema(model: type[BaseModel]) -> dict[str, Any]:
+		"""Generate the optimized schema from scratch (uncached)"""
 		# Generate original schema
 		original_schema = model.model_json_schema()
 
@@ -0,0 +1,82 @@
+"""
+Incremental parsing of structured output while it is still streaming in.
+
+Our AgentOutput JSON usually starts with long `thinking`/`memory` fields and ends with the `action` list,
+so by parsing the stream incrementally we can validate (and start) the first action before the response is complete.
+"""
+
+import json
+from typing import Any
+
+
+class IncrementalJSONArrayParser:
+	"""
+	Feed chunks of a JSON object as they stream in and get back each item of one of its top-level array fields
+	as soon as that item is complete.
+
+		parser = IncrementalJSONArrayParser('action')
+		parser.feed('{"memory": "...", "action": [{"click_element_by_index": {"ind')  # -> []
+		parser.feed('ex": 5}}, {"done"')  # -> [{'click_element_by_index': {'index': 5}}]
+	"""
+
+	def __init__(self, array_key: str):
+		self.array_key = array_key
+		self.text = ''
+		self.items: list[Any] = []
+
+		self._pos = 0
+		self._depth = 0
+		self._in_string = False
+		self._escaped = False
+		self._string_start = -1
+		self._last_key: str | None = None
+		self._last_string: str | None = None
+		self._in_array = False  # currently inside the top-level array we're looking for
+		self._array_done = False
+		self._item_start = -1
+
+	def feed(self, chunk: str) -> list[Any]:
+		"""Add the next chunk of text, returns the array items that were completed by it (in order)"""
+		self.text += chunk
+		new_items: list[Any] = []
+		text = self.text
+
+		while self._pos < len(text) and not self._array_done:
+			char = text[self._pos]
+
+			if self._in_string:
+				if self._escaped:
+					self._escaped = False
+				elif char == '\\':
+					self._escaped = True
+				elif char == '"':
+					self._in_string = False
+					if self._depth == 1:
+						self._last_string = json.loads(text[self._string_start : self._pos + 1])
+			elif char == '"':
+				self._in_string = True
+				self._string_start = self._pos
+			elif char == ':' and self._depth == 1:
+				self._last_key = self._last_string
+			elif char in '{[':
+				self._depth += 1
+				if self._depth == 2 and char == '[' and self._last_key == self.array_key:
+					self._in_array = True
+				elif self._depth == 3 and self._in_array:
+					self._item_start = self._pos
+			elif char in '}]':
+				self._depth -= 1
+				if self._in_array and self._depth == 2 and self._item_start >= 0:
+					item = json.loads(text[self._item_start : self._pos + 1])
+					self.items.append(item)
+					new_items.append(item)
+					self._item_start = -1
+				elif self._in_array and self._depth == 1:
+					self._in_array = False
+					self._array_done = True
+			elif self._depth == 1 and char == ',':
+				self._last_key = None
+
+			self._pos += 1
+
+		return new_items
@@ -1,13 +1,20 @@
 """
 Token cost service that tracks LLM token usage and costs.
 
-Fetches pricing data from LiteLLM repository and caches it for 1 day.
+Pricing comes from a snapshot of the LiteLLM pricing table bundled with the package, overridden per model by an
+optional local pricing file (BROWSER_USE_PRICING_FILE). Fetching the latest table from the LiteLLM repository is
+opt-in (BROWSER_USE_REFRESH_PRICING=true): it runs in the background and is cached for 1 day, so cost tracking
+never waits for the network. Model names without an exact entry are looked up without their provider prefix,
+Bedrock region/version or date suffix, see get_pricing_lookup_names().
 Automatically tracks token usage when LLMs are registered and invoked.
 """
 
 import asyncio
+import json
 import logging
 import os
+import re
+from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -23,8 +30,10 @@ from browser_use.tokens.views import (
 	ModelPricing,
 	ModelUsageStats,
 	ModelUsageTokens,
+	ModelUsageTotals,
 	TokenCostCalculated,
 	TokenUsageEntry,
+	TokenUsageSnapshot,
 	UsageSummary,
 )
 
@@ -36,6 +45,35 @@ logger = logging.getLogger(__name__)
 cost_logger = logging.getLogger('cost')
 
 
+# Bedrock model ids: [region.]vendor.model[-vN[:M]], e.g. us.anthropic.claude-sonnet-4-20250514-v1:0
+_BEDROCK_REGION_RE = re.compile(r'^(?:us|eu|apac|us-gov)\.')
+_BEDROCK_MODEL_RE = re.compile(r'^(?:anthropic|meta|amazon|mistral|cohere|ai21|deepseek)\.(?P<name>.+?)(?:-v\d+(?::\d+)?)?$')
+# dated OpenAI snapshots, e.g. gpt-4o-mini-2024-07-18
+_DATE_SUFFIX_RE = re.compile(r'-\d{4}-\d{2}-\d{2}$')
+
+
+def get_pricing_lookup_names(model_name: str) -> list[str]:
+	"""
+	Names to look up the pricing of a model by, most specific first.
+
+	As given, lowercased, without provider prefixes (openrouter/openai/gpt-4o -> openai/gpt-4o -> gpt-4o), without
+	the Bedrock region (us.meta.llama4-...-v1:0 -> meta.llama4-...-v1:0), as the model a Bedrock id refers to
+	(anthropic.claude-3-5-sonnet-20240620-v1:0 -> claude-3-5-sonnet-20240620) and, as a last resort, without a date
+	suffix (a dated snapshot without its own entry is priced as its alias, which may not share its price).
+	"""
+	names = [model_name, model_name.lower()]
+	name = names[-1]
+	while '/' in name:
+		name = name.split('/', 1)[1]
+		names.append(name)
+	name = _BEDROCK_REGION_RE.sub('', name)
+	names.append(name)
+	if match := _BEDROCK_MODEL_RE.match(name):
+		names.append(match['name'])
+	names.extend(_DATE_SUFFIX_RE.sub('', name) for name in list(names) if _DATE_SUFFIX_RE.search(name))
+	return list(dict.fromkeys(names))
+
+
 def xdg_cache_home() -> Path:
 	default = Path.home() / '.cache'
 	if CONFIG.XDG_CACHE_HOME and (path := Path(CONFIG.XDG_CACHE_HOME)).is_absolute():
@@ -49,16 +87,46 @@ class TokenCost:
 	CACHE_DIR_NAME = 'browser_use/token_cost'
 	CACHE_DURATION = timedelta(days=1)
 	PRICING_URL = 'https://raw.githubusercontent.com/BerriAI/litellm/main/model_prices_and_context_window.json'
-
-	def __init__(self, include_cost: bool = False):
+	BUNDLED_PRICING_FILE = Path(__file__).parent / 'pricing.json'
+
+	def __init__(
+		self,
+		include_cost: bool = False,
+		pricing_file: str | Path | None = None,
+		refresh_pricing: bool | None = None,
+		max_history_entries: int = 1000,
+	):
 		self.include_cost = include_cost or os.getenv('BROWSER_USE_CALCULATE_COST', 'false').lower() == 'true'
-
-		self.usage_history: list[TokenUsageEntry] = []
+		# LiteLLM formatted JSON whose entries override the pricing of the same models
+		pricing_file = pricing_file or os.getenv('BROWSER_USE_PRICING_FILE')
+		self.pricing_file = Path(pricing_file).expanduser() if pricing_file else None
+		# fetch the latest pricing from the LiteLLM repository in the background
+		if refresh_pricing is None:
+			refresh_pricing = os.getenv('BROWSER_USE_REFRESH_PRICING', 'false').lower() == 'true'
+		self.refresh_pricing = refresh_pricing
+
+		# the most recent raw entries only, summaries are computed from the running per-model totals
+		self._usage_history: deque[TokenUsageEntry] = deque(maxlen=max_history_entries)
+		self._dropped_history_until: datetime | None = None  # timestamp of the newest entry dropped from the history
+		self.usage_totals: dict[str, ModelUsageTotals] = {}
 		self.registered_llms: dict[str, BaseChatModel] = {}
 		self._pricing_data: dict[str, Any] | None = None
+		self._bundled_pricing_data: dict[str, Any] = {}
+		self._remote_pricing_data: dict[str, Any] = {}
+		self._local_pricing_data: dict[str, Any] = {}
+		# pricing key by model name without its provider prefix (grok-4 -> xai/grok-4), for ids like x-ai/grok-4
+		self._pricing_keys_without_provider: dict[str, str] = {}
+		self._resolved_pricing_keys: dict[str, str | None] = {}
+		self._unpriced_models: set[str] = set()  # models already warned about
+		self._refresh_task: asyncio.Task | None = None
 		self._initialized = False
 		self._cache_dir = xdg_cache_home() / self.CACHE_DIR_NAME
 
+	@property
+	def usage_history(self) -> list[TokenUsageEntry]:
+		"""The most recent usage entries (at most max_history_entries), oldest first"""
+		return list(self._usage_history)
+
 	async def initialize(self) -> None:
 		"""Initialize the service by loading pricing data"""
 		if not self._initialized:
@@ -67,14 +135,67 @@ class TokenCost:
 			self._initialized = True
 
 	async def _load_pricing_data(self) -> None:
-		"""Load pricing data from cache or fetch from GitHub"""
-		# Try to find a valid cache file
-		cache_file = await self._find_valid_cache()
+		"""Load the bundled pricing, the cached remote pricing and the local pricing file, never waiting for the network"""
+		self._bundled_pricing_data = await self._read_pricing_file(self.BUNDLED_PRICING_FILE)
+		if self.pricing_file:
+			self._local_pricing_data = await self._read_pricing_file(self.pricing_file)
+
+		if self.refresh_pricing:
+			cache_file = await self._find_valid_cache()
+			if cache_file:
+				await self._load_from_cache(cache_file)
+			else:
+				self._start_background_refresh()
 
-		if cache_file:
-			await self._load_from_cache(cache_file)
-		else:
-			await self._fetch_and_cache_pricing_data()
+		self._merge_pricing_data()
+
+	def _start_background_refresh(self) -> None:
+		"""Fetch the latest pricing without blocking the caller, the pricing already loaded is used meanwhile"""
+		if self._refresh_task is None or self._refresh_task.done():
+			self._refresh_task = asyncio.create_task(self._fetch_and_cache_pricing_data())
+
+	async def _read_pricing_file(self, pricing_file: Path) -> dict[str, Any]:
+		"""Read a LiteLLM formatted pricing file, empty if it is missing or invalid"""
+		try:
+			async with aiofiles.open(pricing_file, 'r') as f:
+				data = json.loads(await f.read())
+			if not isinstance(data, dict):
+				raise ValueError('expected a JSON object of model name -> pricing')
+			return data
+		except Exception as e:
+			logger.warning(f'💲 Could not load pricing data from {pricing_file}: {e}')
+			return {}
+
+	def _merge_pricing_data(self) -> None:
+		"""Bundled < remote < local pricing, merged per model so a local entry can override a single price"""
+		merged = {**self._bundled_pricing_data, **self._remote_pricing_data}
+		for model_name, data in self._local_pricing_data.items():
+			merged[model_name] = {**merged.get(model_name, {}), **data}
+		self._pricing_data = merged
+		self._pricing_keys_without_provider = {}
+		for key in merged:
+			if '/' in key:
+				self._pricing_keys_without_provider.setdefault(key.rsplit('/', 1)[1].lower(), key)
+		self._resolved_pricing_keys = {}
+
+	def _resolve_pricing_key(self, model_name: str) -> str | None:
+		"""The key of the pricing entry of a model, trying the names from get_pricing_lookup_names() in order"""
+		if model_name not in self._resolved_pricing_keys:
+			pricing_data = self._pricing_data or {}
+			key = None
+			for name in get_pricing_lookup_names(model_name):
+				key = name if name in pricing_data else self._pricing_keys_without_provider.get(name)
+				if key:
+					break
+			if key and _DATE_SUFFIX_RE.search(model_name) and not _DATE_SUFFIX_RE.search(name):
+				logger.warning(
+					f'💲 No pricing data for snapshot {model_name}, pricing it as {key} which may not match its actual price. '
+					'Add it to a local pricing file (BROWSER_USE_PRICING_FILE) or set BROWSER_USE_REFRESH_PRICING=true'
+				)
+			elif key and key != model_name:
+				logger.debug(f'💲 Pricing {model_name} as {key}')
+			self._resolved_pricing_keys[model_name] = key
+		return self._resolved_pricing_keys[model_name]
 
 	async def _find_valid_cache(self) -> Path | None:
 		"""Find the most recent valid cache file"""
@@ -128,11 +249,10 @@ class TokenCost:
 			async with aiofiles.open(cache_file, 'r') as f:
 				content = await f.read()
 				cached = CachedPricingData.model_validate_json(content)
-				self._pricing_data = cached.data
+				self._remote_pricing_data = cached.data
 		except Exception as e:
-			print(f'Error loading cached pricing data from {cache_file}: {e}')
-			# Fall back to fetching
-			await self._fetch_and_cache_pricing_data()
+			logger.debug(f'Error loading cached pricing data from {cache_file}: {e}')
+			self._start_background_refresh()
 
 	async def _fetch_and_cache_pricing_data(self) -> None:
 		"""Fetch pricing data from LiteLLM GitHub and cache it with timestamp"""
@@ -141,10 +261,11 @@ class TokenCost:
 				response = await client.get(self.PRICING_URL, timeout=30)
 				response.raise_for_status()
 
-				self._pricing_data = response.json()
+				self._remote_pricing_data = response.json()
+			self._merge_pricing_data()
 
 			# Create cache object with timestamp
-			cached = CachedPricingData(timestamp=datetime.now(), data=self._pricing_data or {})
+			cached = CachedPricingData(timestamp=datetime.now(), data=self._remote_pricing_data)
 
 			# Ensure cache directory exists
 			self._cache_dir.mkdir(parents=True, exist_ok=True)
@@ -157,9 +278,8 @@ class TokenCost:
 				await f.write(cached.model_dump_json(indent=2))
 
 		except Exception as e:
-			print(f'Error fetching pricing data: {e}')
-			# Fall back to empty pricing data
-			self._pricing_data = {}
+			# Keep using the bundled and local pricing
+			logger.debug(f'Error fetching pricing data: {e}')
 
 	async def get_model_pricing(self, model_name: str) -> ModelPricing | None:
 		"""Get pricing information for a specific model"""
@@ -167,10 +287,18 @@ class TokenCost:
 		if not self._initialized:
 			await self.initialize()
 
-		if not self._pricing_data or model_name not in self._pricing_data:
+		key = self._resolve_pricing_key(model_name) if self._pricing_data else None
+		if key is None:
+			if model_name not in self._unpriced_models:
+				self._unpriced_models.add(model_name)
+				logger.warning(
+					f'💲 No pricing data for model {model_name}, its cost is not counted. '
+					'Add it to a local pricing file (BROWSER_USE_PRICING_FILE) or set BROWSER_USE_REFRESH_PRICING=true'
+				)
 			return None
 
-		data = self._pricing_data[model_name]
+		assert self._pricing_data is not None
+		data = self._pricing_data[key]
 		return ModelPricing(
 			model=model_name,
 			input_cost_per_token=data.get('input_cost_per_token'),
@@ -211,14 +339,19 @@ class TokenCost:
 		)
 
 	def add_usage(self, model: str, usage: ChatInvokeUsage) -> TokenUsageEntry:
-		"""Add token usage entry to history (without calculating cost)"""
+		"""Add token usage entry to history and to the totals of its model (without calculating cost)"""
 		entry = TokenUsageEntry(
 			model=model,
 			timestamp=datetime.now(),
 			usage=usage,
 		)
 
-		self.usage_history.append(entry)
+		if len(self._usage_history) == self._usage_history.maxlen:
+			self._dropped_history_until = self._usage_history[0].timestamp
+		self._usage_history.append(entry)
+		if model not in self.usage_totals:
+			self.usage_totals[model] = ModelUsageTotals(model=model)
+		self.usage_totals[model].add(usage)
 
 		return entry
 
@@ -321,11 +454,7 @@ class TokenCost:
 		# Store reference to self for use in the closure
 		token_cost_service = self
 
-		# Create a wrapped version that tracks usage
-		async def tracked_ainvoke(messages, output_format=None):
-			# Call the original method
-			result = await original_ainvoke(messages, output_format)
-
+		def track_usage(result) -> None:
 			# Track usage if available (no await needed since add_usage is now sync)
 			if result.usage:
 				usage = token_cost_service.add_usage(llm.model, result.usage)
@@ -337,96 +466,118 @@ class TokenCost:
 			# else:
 			# 	await token_cost_service._log_non_usage_llm(llm)
 
+		# Create a wrapped version that tracks usage
+		async def tracked_ainvoke(messages, output_format=None):
+			# Call the original method
+			result = await original_ainvoke(messages, output_format)
+			track_usage(result)
 			return result
 
 		# Replace the method with our tracked version
 		# Using setattr to avoid type checking issues with overloaded methods
 		setattr(llm, 'ainvoke', tracked_ainvoke)
 
+		# models that support streaming structured output get the same tracking
+		original_ainvoke_streaming = getattr(llm, 'ainvoke_streaming', None)
+		if original_ainvoke_streaming is not None:
+
+			async def tracked_ainvoke_streaming(messages, output_format, on_text):
+				result = await original_ainvoke_streaming(messages, output_format, on_text)
+				track_usage(result)
+				return result
+
+			setattr(llm, 'ainvoke_streaming', tracked_ainvoke_streaming)
+
 		return llm
 
 	def get_usage_tokens_for_model(self, model: str) -> ModelUsageTokens:
 		"""Get usage tokens for a specific model"""
-		filtered_usage = [u for u in self.usage_history if u.model == model]
+		totals = self.usage_totals.get(model) or ModelUsageTotals(model=model)
 
 		return ModelUsageTokens(
 			model=model,
-			prompt_tokens=sum(u.usage.prompt_tokens for u in filtered_usage),
-			prompt_cached_tokens=sum(u.usage.prompt_cached_tokens or 0 for u in filtered_usage),
-			completion_tokens=sum(u.usage.completion_tokens for u in filtered_usage),
-			total_tokens=sum(u.usage.prompt_tokens + u.usage.completion_tokens for u in filtered_usage),
+			prompt_tokens=totals.prompt_tokens,
+			prompt_cached_tokens=totals.prompt_cached_tokens,
+			completion_tokens=totals.completion_tokens,
+			total_tokens=totals.prompt_tokens + totals.completion_tokens,
 		)
 
-	async def get_usage_summary(self, model: str | None = None, since: datetime | None = None) -> UsageSummary:
-		"""Get summary of token usage and costs (costs calculated on-the-fly)"""
-		filtered_usage = self.usage_history
-
-		if model:
-			filtered_usage = [u for u in filtered_usage if u.model == model]
-
-		if since:
-			filtered_usage = [u for u in filtered_usage if u.timestamp >= since]
-
-		if not filtered_usage:
-			return UsageSummary(
-				total_prompt_tokens=0,
-				total_prompt_cost=0.0,
-				total_prompt_cached_tokens=0,
-				total_prompt_cached_cost=0.0,
-				total_completion_tokens=0,
-				total_completion_cost=0.0,
-				total_tokens=0,
-				total_cost=0.0,
-				entry_count=0,
-			)
-
-		# Calculate totals
-		total_prompt = sum(u.usage.prompt_tokens for u in filtered_usage)
-		total_completion = sum(u.usage.completion_tokens for u in filtered_usage)
-		total_tokens = total_prompt + total_completion
-		total_prompt_cached = sum(u.usage.prompt_cached_tokens or 0 for u in filtered_usage)
-		models = list({u.model for u in filtered_usage})
+	def snapshot(self) -> TokenUsageSnapshot:
+		"""Copy of the current totals, pass it as `since` to get_usage_summary to get the usage of a single task"""
+		return TokenUsageSnapshot(
+			timestamp=datetime.now(),
+			by_model={model: totals.model_copy() for model, totals in self.usage_totals.items()},
+		)
 
-		# Calculate per-model stats with record-by-record cost calculation
+	def _get_usage_totals(self, since: datetime | TokenUsageSnapshot | None) -> list[ModelUsageTotals]:
+		"""Per-model totals, since a snapshot or since a point in time (only covers the entries still in usage_history)"""
+		if since is None:
+			return list(self.usage_totals.values())
+
+		if isinstance(since, TokenUsageSnapshot):
+			totals = [
+				current.subtract(since.by_model[model]) if model in since.by_model else current
+				for model, current in self.usage_totals.items()
+			]
+			return [t for t in totals if t.invocations > 0]
+
+		if self._dropped_history_until is not None and since <= self._dropped_history_until:
+			logger.warning(
+				f'💲 Usage since {since.isoformat()} is incomplete, entries until {self._dropped_history_until.isoformat()} '
+				'were dropped from the history (raise max_history_entries or pass a snapshot() as since)'
+			)
+		totals_by_model: dict[str, ModelUsageTotals] = {}
+		for entry in self._usage_history:
+			if entry.timestamp >= since:
+				if entry.model not in totals_by_model:
+					totals_by_model[entry.model] = ModelUsageTotals(model=entry.model)
+				totals_by_model[entry.model].add(entry.usage)
+		return list(totals_by_model.values())
+
+	async def get_usage_summary(
+		self, model: str | None = None, since: datetime | TokenUsageSnapshot | None = None
+	) -> UsageSummary:
+		"""Get summary of token usage and costs (costs calculated on-the-fly from the per-model totals)"""
+		usage_totals = [t for t in self._get_usage_totals(since) if model is None or t.model == model]
+
+		# Calculate per-model stats, pricing each model's totals at once
 		model_stats: dict[str, ModelUsageStats] = {}
 		total_prompt_cost = 0.0
 		total_completion_cost = 0.0
 		total_prompt_cached_cost = 0.0
 
-		for entry in filtered_usage:
-			if entry.model not in model_stats:
-				model_stats[entry.model] = ModelUsageStats(model=entry.model)
-
-			stats = model_stats[entry.model]
-			stats.prompt_tokens += entry.usage.prompt_tokens
-			stats.completion_tokens += entry.usage.completion_tokens
-			stats.total_tokens += entry.usage.prompt_tokens + entry.usage.completion_tokens
-			stats.invocations += 1
+		for totals in usage_totals:
+			stats = model_stats[totals.model] = ModelUsageStats(
+				model=totals.model,
+				prompt_tokens=totals.prompt_tokens,
+				completion_tokens=totals.completion_tokens,
+				total_tokens=totals.prompt_tokens + totals.completion_tokens,
+				invocations=totals.invocations,
+			)
+			if stats.invocations > 0:
+				stats.average_tokens_per_invocation = stats.total_tokens / stats.invocations
 
 			if self.include_cost:
-				# Calculate cost record by record using the updated calculate_cost function
-				cost = await self.calculate_cost(entry.model, entry.usage)
+				cost = await self.calculate_cost(totals.model, totals.to_usage())
 				if cost:
-					stats.cost += cost.total_cost
+					stats.cost = cost.total_cost
 					total_prompt_cost += cost.prompt_cost
 					total_completion_cost += cost.completion_cost
 					total_prompt_cached_cost += cost.prompt_read_cached_cost or 0
 
-		# Calculate averages
-		for stats in model_stats.values():
-			if stats.invocations > 0:
-				stats.average_tokens_per_invocation = stats.total_tokens / stats.invocations
+		total_prompt = sum(t.prompt_tokens for t in usage_totals)
+		total_completion = sum(t.completion_tokens for t in usage_totals)
 
 		return UsageSummary(
 			total_prompt_tokens=total_prompt,
 			total_prompt_cost=total_prompt_cost,
-			total_prompt_cached_tokens=total_prompt_cached,
+			total_prompt_cached_tokens=sum(t.prompt_cached_tokens for t in usage_totals),
 			total_prompt_cached_cost=total_prompt_cached_cost,
 			total_completion_tokens=total_completion,
 			total_completion_cost=total_completion_cost,
-			total_tokens=total_tokens,
+			total_tokens=total_prompt + total_completion,
 			total_cost=total_prompt_cost + total_completion_cost + total_prompt_cached_cost,
-			entry_count=len(filtered_usage),
+			entry_count=sum(t.invocations for t in usage_totals),
 			by_model=model_stats,
 		)
 
@@ -442,7 +593,7 @@ class TokenCost:
 
 	async def log_usage_summary(self) -> None:
 		"""Log a comprehensive usage summary per model with colors and nice formatting"""
-		if not self.usage_history:
+		if not self.usage_totals:
 			return
 
 		summary = await self.get_usage_summary()
@@ -493,18 +644,9 @@ class TokenCost:
 			# Format cost display (only if cost tracking is enabled)
 			if self.include_cost:
 				# Calculate per-model costs on-the-fly
-				total_model_cost = 0.0
-				model_prompt_cost = 0.0
-				model_completion_cost = 0.0
-
-				# Calculate costs for this model
-				for entry in self.usage_history:
-					if entry.model == model:
-						cost = await self.calculate_cost(entry.model, entry.usage)
-						if cost:
-							model_prompt_cost += cost.prompt_cost
-							model_completion_cost += cost.completion_cost
-
+				cost = await self.calculate_cost(model, self.usage_totals[model].to_usage())
+				model_prompt_cost = cost.prompt_cost if cost else 0.0
+				model_completion_cost = cost.completion_cost if cost else 0.0
 				total_model_cost = model_prompt_cost + model_completion_cost
 
 				if total_model_cost > 0:
@@ -532,12 +674,22 @@ class TokenCost:
 		return summary.by_model
 
 	def clear_history(self) -> None:
-		"""Clear usage history"""
-		self.usage_history = []
+		"""Clear usage history and totals, e.g. between tasks of a long-lived process that reuses this service"""
+		self._usage_history.clear()
+		self._dropped_history_until = None
+		self.usage_totals.clear()
+
+	def reset(self) -> TokenUsageSnapshot:
+		"""Clear usage history and totals, returning the totals accumulated until now"""
+		snapshot = self.snapshot()
+		self.clear_history()
+		return snapshot
 
 	async def refresh_pricing_data(self) -> None:
 		"""Force refresh of pricing data from GitHub"""
 		if self.include_cost:
+			if not self._initialized:
+				await self.initialize()
 			await self._fetch_and_cache_pricing_data()
 
 	async def clean_old_caches(self, keep_count: int = 3) -> None:
@@ -80,6 +80,53 @@ class ModelUsageStats(BaseModel):
 	average_tokens_per_invocation: float = 0.0
 
 
+class ModelUsageTotals(BaseModel):
+	"""Running token totals of a single model, updated on every invocation"""
+
+	model: str
+	prompt_tokens: int = 0
+	prompt_cached_tokens: int = 0
+	prompt_cache_creation_tokens: int = 0
+	completion_tokens: int = 0
+	invocations: int = 0
+
+	def add(self, usage: ChatInvokeUsage) -> None:
+		self.prompt_tokens += usage.prompt_tokens
+		self.prompt_cached_tokens += usage.prompt_cached_tokens or 0
+		self.prompt_cache_creation_tokens += usage.prompt_cache_creation_tokens or 0
+		self.completion_tokens += usage.completion_tokens
+		self.invocations += 1
+
+	def subtract(self, other: 'ModelUsageTotals') -> 'ModelUsageTotals':
+		"""The usage since `other`, an earlier copy of these totals"""
+		return ModelUsageTotals(
+			model=self.model,
+			prompt_tokens=self.prompt_tokens - other.prompt_tokens,
+			prompt_cached_tokens=self.prompt_cached_tokens - other.prompt_cached_tokens,
+			prompt_cache_creation_tokens=self.prompt_cache_creation_tokens - other.prompt_cache_creation_tokens,
+			completion_tokens=self.completion_tokens - other.completion_tokens,
+			invocations=self.invocations - other.invocations,
+		)
+
+	def to_usage(self) -> ChatInvokeUsage:
+		"""The totals as a single usage, to price them at once (costs are linear in the token counts)"""
+		return ChatInvokeUsage(
+			prompt_tokens=self.prompt_tokens,
+			prompt_cached_tokens=self.prompt_cached_tokens or None,
+			prompt_cache_creation_tokens=self.prompt_cache_creation_tokens or None,
+			prompt_image_tokens=None,
+			completion_tokens=self.completion_tokens,
+			total_tokens=self.prompt_tokens + self.completion_tokens,
+		)
+
+
+class TokenUsageSnapshot(BaseModel):
+	"""Copy of the per-model usage totals at a point in time, to account for the usage of a single task"""
+
+	timestamp: datetime
+	by_model: dict[str, ModelUsageTotals] = Field(default_factory=dict)
+
+
 class ModelUsageTokens(BaseModel):
 	"""Usage tokens for a single model"""
 
@@ -4,9 +4,11 @@ Pytest configuration for browser-use CI tests.
 Sets up environment variables to ensure tests never connect to production services.
 """
 
+import asyncio
 import os
 import socketserver
 import tempfile
+from typing import Any
 from unittest.mock import AsyncMock
 
 import pytest
@@ -153,6 +155,48 @@ def create_mock_llm(actions: list[str] | None = None) -> BaseChatModel:
 	return llm
 
 
+def create_named_mock_llm(model: str, side_effect: Any = None) -> BaseChatModel:
+	"""Create a mock LLM that answers with its model name, for tests of the LLM wrappers (routing, retry, ...).
+
+	Args:
+		model: Model name of the mock, also the completion it answers with.
+		side_effect: Optional ainvoke side effect to use instead: an exception to raise on every call,
+			a list of completions/exceptions to return/raise in sequence, or an async function.
+	"""
+	llm = create_mock_llm()
+	llm.model = model
+
+	async def ainvoke(messages, output_format=None):
+		return ChatInvokeCompletion(completion=model, usage=None)
+
+	llm.ainvoke.side_effect = side_effect if side_effect is not None else ainvoke  # type: ignore[attr-defined]
+	return llm
+
+
+def create_slow_mock_llm(model: str, delays: list[float], error: Exception | None = None) -> BaseChatModel:
+	"""Create a mock LLM that answers with its model name (or raises `error`) after the next delay of the list.
+
+	The last delay is reused once the others are used up, cancelled calls are counted in `llm.cancelled`.
+	"""
+	llm = create_mock_llm()
+	llm.model = model
+	llm.cancelled = 0  # type: ignore[attr-defined]
+	delays = list(delays)
+
+	async def ainvoke(messages, output_format=None):
+		try:
+			await asyncio.sleep(delays.pop(0) if len(delays) > 1 else delays[0])
+		except asyncio.CancelledError:
+			llm.cancelled += 1  # type: ignore[attr-defined]
+			raise
+		if error:
+			raise error
+		return ChatInvokeCompletion(completion=model, usage=None)
+
+	llm.ainvoke.side_effect = ainvoke  # type: ignore[attr-defined]
+	return llm
+
+
 @pytest.fixture(scope='module')
 async def browser_session():
 	"""Create a real browser session for testing"""
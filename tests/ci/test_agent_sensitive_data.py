@@ -269,3 +269,34 @@ def test_is_new_tab_page():
 	assert is_new_tab_page('http://google.com') is False
 	assert is_new_tab_page('') is False
 	assert is_new_tab_page('chrome://settings') is False
+
+
+def test_filter_sensitive_data_single_pass(message_manager):
+	"""Test that redaction uses one compiled matcher that is only rebuilt when sensitive_data changes"""
+	message_manager.sensitive_data = {
+		'example.com': {'password': 'secret123', 'pin': '1234'},
+		'google.com': {'password': 'google_pass'},
+		'secret': 'secret',  # a value that also appears in the <secret> tags themselves
+	}
+
+	result = message_manager._filter_sensitive_data(UserMessage(content='pw secret123, pin 1234, other pw google_pass'))
+	# longest match wins, the tags inserted for one value are never redacted again, and values of all domains are redacted
+	assert result.content == 'pw <secret>password</secret>, pin <secret>pin</secret>, other pw <secret>password</secret>'
+
+	matcher = message_manager._get_sensitive_data_matcher()
+	message_manager._filter_sensitive_data(UserMessage(content='another message'))
+	assert message_manager._get_sensitive_data_matcher() is matcher
+
+	message_manager.sensitive_data['google.com']['password'] = 'new_google_pass'
+	assert message_manager._get_sensitive_data_matcher() is not matcher
+	result = message_manager._filter_sensitive_data(UserMessage(content='new_google_pass'))
+	assert result.content == '<secret>password</secret>'
+
+
+def test_filter_sensitive_data_many_credentials(message_manager):
+	"""Test redaction with many credentials in a large DOM-sized message"""
+	message_manager.sensitive_data = {f'site{i}.com': {f'key_{i}': f'value-{i:04d}-x'} for i in range(500)}
+	text = ('<div>lorem ipsum</div>' * 2000) + 'value-0042-x and value-0499-x'
+
+	result = message_manager._filter_sensitive_data(UserMessage(content=text))
+	assert result.content.endswith('<secret>key_42</secret> and <secret>key_499</secret>')
@@ -0,0 +1,93 @@
+"""
+Test the TTL cache in front of the @require_healthy_browser responsiveness check.
+"""
+
+import time
+
+from browser_use import BrowserProfile, BrowserSession
+
+
+class FakePage:
+	"""Minimal stand-in for a playwright Page that records event listeners so tests can fire them"""
+
+	def __init__(self):
+		self.main_frame = object()
+		self.listeners: dict[str, list] = {}
+
+	def on(self, event: str, callback) -> None:
+		self.listeners.setdefault(event, []).append(callback)
+
+	def emit(self, event: str, arg) -> None:
+		for callback in self.listeners.get(event, []):
+			callback(arg)
+
+
+class TestPageHealthCheckCache:
+	"""Test that successful health checks are trusted for a TTL and invalidated by page events."""
+
+	def test_cached_within_ttl(self):
+		session = BrowserSession(browser_profile=BrowserProfile(page_health_check_ttl=60))
+		page = FakePage()
+
+		assert not session._is_page_health_cached(page)  # type: ignore
+		session._mark_page_healthy(page)  # type: ignore
+		assert session._is_page_health_cached(page)  # type: ignore
+		# the cache is per page, a different tab must be probed
+		assert not session._is_page_health_cached(FakePage())  # type: ignore
+
+	def test_expires_after_ttl_and_disabled_with_zero(self):
+		session = BrowserSession(browser_profile=BrowserProfile(page_health_check_ttl=0.05))
+		page = FakePage()
+		session._mark_page_healthy(page)  # type: ignore
+		time.sleep(0.1)
+		assert not session._is_page_health_cached(page)  # type: ignore
+
+		session = BrowserSession(browser_profile=BrowserProfile(page_health_check_ttl=0))
+		session._mark_page_healthy(page)  # type: ignore
+		assert not session._is_page_health_cached(page)  # type: ignore
+
+	def test_invalidated_by_navigation_crash_and_close(self):
+		session = BrowserSession(browser_profile=BrowserProfile(page_health_check_ttl=60))
+		page = FakePage()
+
+		session._mark_page_healthy(page)  # type: ignore
+		page.emit('framenavigated', object())  # subframe navigation doesn't matter
+		assert session._is_page_health_cached(page)  # type: ignore
+		page.emit('framenavigated', page.main_frame)
+		assert not session._is_page_health_cached(page)  # type: ignore
+
+		for event in ('crash', 'close'):
+			session._mark_page_healthy(page)  # type: ignore
+			page.emit(event, page)
+			assert not session._is_page_health_cached(page)  # type: ignore
+
+		# listeners are only attached once per page no matter how often it's marked healthy
+		assert len(page.listeners['framenavigated']) == 1
+
+	def test_invalidated_on_connection_reset(self):
+		session = BrowserSession(browser_profile=BrowserProfile(page_health_check_ttl=60))
+		page = FakePage()
+		session._mark_page_healthy(page)  # type: ignore
+		session._reset_connection_state()
+		assert not session._is_page_health_cached(page)  # type: ignore
+
+	def test_model_copy_gets_its_own_health_state(self):
+		original = BrowserSession(browser_profile=BrowserProfile(page_health_check_ttl=60))
+		page = FakePage()
+		original._mark_page_healthy(page)  # type: ignore
+		original._page_recovery_incidents.append(object())  # type: ignore
+
+		copy = original.model_copy()
+		assert not copy._is_page_health_cached(page)  # type: ignore
+		assert copy._page_health_watched_pages is not original._page_health_watched_pages
+		assert copy._page_watchdog_pages is not original._page_watchdog_pages
+		assert copy._page_failures is not original._page_failures
+		assert copy._page_watchdog_tasks is not original._page_watchdog_tasks
+		assert not copy._page_recovery_incidents
+
+		# the copy attaches its own invalidation listeners, and page events reach both sessions
+		copy._mark_page_healthy(page)  # type: ignore
+		assert len(page.listeners['framenavigated']) == 2
+		page.emit('framenavigated', page.main_frame)
+		assert not original._is_page_health_cached(page)  # type: ignore
+		assert not copy._is_page_health_cached(page)  # type: ignore
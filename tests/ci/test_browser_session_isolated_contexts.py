@@ -0,0 +1,70 @@
+"""
+Test running several BrowserSessions with isolated contexts inside one shared browser process.
+"""
+
+import asyncio
+
+from browser_use import Agent, BrowserProfile, BrowserSession
+from tests.ci.conftest import create_mock_llm
+
+
+class TestIsolatedBrowserSessions:
+	"""Test new_isolated_session() isolation and ownership."""
+
+	async def test_isolated_sessions_share_browser_not_state(self, httpserver):
+		httpserver.expect_request('/set-cookie').respond_with_data(
+			'<html><body>cookie set</body></html>', headers={'Set-Cookie': 'session=one; Path=/'}
+		)
+
+		shared = BrowserSession(browser_profile=BrowserProfile(headless=True, user_data_dir=None, keep_alive=True))
+		await shared.start()
+		try:
+			first, second = await asyncio.gather(
+				shared.new_isolated_session(),
+				shared.new_isolated_session(viewport={'width': 800, 'height': 600}),
+			)
+
+			# one browser process, separate contexts
+			assert first.browser is shared.browser and second.browser is shared.browser
+			assert first.browser_context is not second.browser_context
+			assert first.browser_context is not shared.browser_context
+			assert second.browser_profile.viewport == {'width': 800, 'height': 600}
+
+			await first.navigate(httpserver.url_for('/set-cookie'))
+			assert any(cookie['name'] == 'session' for cookie in await first.get_cookies())
+			assert not any(cookie['name'] == 'session' for cookie in await second.get_cookies())
+
+			# stopping an isolated session closes only its own context
+			first_context = first.browser_context
+			await first.stop()
+			assert first.browser_context is None
+			assert first_context not in shared.browser.contexts  # type: ignore
+			assert shared.browser and shared.browser.is_connected()
+			assert second.browser_context in shared.browser.contexts
+
+			await second.stop()
+			assert shared.browser.is_connected()
+		finally:
+			await shared.kill()
+
+	async def test_agents_use_isolated_sessions_directly(self):
+		shared = BrowserSession(browser_profile=BrowserProfile(headless=True, user_data_dir=None, keep_alive=True))
+		await shared.start()
+		try:
+			isolated = await shared.new_isolated_session()
+			assert isolated._owns_browser_resources is False
+			assert isolated._owns_browser_context is True
+
+			agent = Agent(task='test', llm=create_mock_llm(), browser_session=isolated)
+			assert agent.browser_session is isolated
+
+			# copies must never close the isolated context they didn't create
+			copy = isolated.model_copy()
+			assert copy._owns_browser_context is False
+			await copy.stop()
+			assert isolated.browser_context in shared.browser.contexts  # type: ignore
+
+			await agent.close()
+			assert shared.browser and shared.browser.is_connected()
+		finally:
+			await shared.kill()
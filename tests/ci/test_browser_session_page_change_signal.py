@@ -0,0 +1,149 @@
+"""
+Test the cheap page-change fingerprint used to skip DOM re-extraction between actions in multi_act
+and to validate browser state prefetched while the agent finishes a step.
+"""
+
+from browser_use import Agent, BrowserProfile, BrowserSession
+from browser_use.agent.views import ActionResult
+from browser_use.browser.views import PageChangeSignal
+from tests.ci.conftest import create_mock_llm
+
+
+class FakePage:
+	"""Minimal stand-in for a playwright Page that returns a fixed DOM change counter"""
+
+	def __init__(self, url: str, counter: dict | None = None, error: Exception | None = None):
+		self.url = url
+		self.counter = counter
+		self.error = error
+		self.evaluated = 0
+
+	async def evaluate(self, script: str):
+		self.evaluated += 1
+		if self.error:
+			raise self.error
+		return self.counter
+
+
+class TestPageChangeSignal:
+	"""Test PageChangeSignal comparisons and how BrowserSession builds them."""
+
+	def test_matches_only_when_fully_known_and_equal(self):
+		signal = PageChangeSignal(url='https://example.com', document_id='abc', dom_generation=3)
+
+		assert signal.matches(PageChangeSignal(url='https://example.com', document_id='abc', dom_generation=3))
+		assert not signal.matches(None)
+		assert not signal.matches(PageChangeSignal(url='https://example.com', document_id='abc', dom_generation=4))
+		assert not signal.matches(PageChangeSignal(url='https://example.com', document_id='new', dom_generation=3))
+		assert not signal.matches(PageChangeSignal(url='https://example.com/2', document_id='abc', dom_generation=3))
+		assert not signal.matches(
+			PageChangeSignal(url='https://example.com', document_id='abc', dom_generation=3, scroll_position=(0, 500))
+		)
+
+		# an unreadable counter must never be treated as "unchanged"
+		unknown = PageChangeSignal(url='https://example.com', document_id=None, dom_generation=None)
+		assert not unknown.matches(unknown)
+
+	async def test_read_page_change_signal(self):
+		session = BrowserSession(browser_profile=BrowserProfile())
+
+		page = FakePage('https://example.com', counter={'id': 'abc', 'generation': 5, 'scrollX': 0, 'scrollY': 300})
+		signal = await session._read_page_change_signal(page)  # type: ignore
+		assert (signal.document_id, signal.dom_generation, signal.scroll_position) == ('abc', 5, (0, 300))
+
+		# new tab pages are never evaluated, and errors mean "unknown" rather than raising
+		new_tab = FakePage('about:blank', counter={'id': 'abc', 'generation': 0})
+		assert (await session._read_page_change_signal(new_tab)).document_id is None  # type: ignore
+		assert new_tab.evaluated == 0
+		failing = FakePage('https://example.com', error=RuntimeError('Execution context was destroyed'))
+		assert (await session._read_page_change_signal(failing)).dom_generation is None  # type: ignore
+
+	async def test_signal_tracks_dom_mutations(self, httpserver):
+		httpserver.expect_request('/').respond_with_data(
+			'<html><body><button id="a">A</button><div id="out"></div></body></html>', content_type='text/html'
+		)
+
+		session = BrowserSession(browser_profile=BrowserProfile(headless=True, user_data_dir=None, keep_alive=False))
+		await session.start()
+		try:
+			await session.navigate(httpserver.url_for('/'))
+			await session.get_state_summary(cache_clickable_elements_hashes=True)
+			cached = session.page_change_signal
+			assert cached is not None
+
+			assert cached.matches(await session.get_page_change_signal())
+
+			page = await session.get_current_page()
+			await page.evaluate("() => { document.getElementById('out').innerHTML = '<button>B</button>'; }")
+			assert not cached.matches(await session.get_page_change_signal())
+
+			await page.reload()
+			assert not cached.matches(await session.get_page_change_signal())
+		finally:
+			await session.kill()
+
+
+class FakePrefetchSession:
+	"""Stand-in for the agent's BrowserSession that counts state captures and reports a configurable page signal"""
+
+	def __init__(self):
+		self.id = 'fake-session'
+		self.agent_current_page = None
+		self.signal = PageChangeSignal(url='https://example.com', document_id='abc', dom_generation=1)
+		self.page_change_signal: PageChangeSignal | None = None
+		self._cached_clickable_element_hashes = 'hashes before prefetch'
+		self.captures = 0
+
+	async def get_browser_state_with_recovery(self, cache_clickable_elements_hashes: bool, include_screenshot: bool):
+		self.captures += 1
+		self.page_change_signal = self.signal
+		self._cached_clickable_element_hashes = f'hashes after capture {self.captures}'
+		return f'state {self.captures}'
+
+	async def get_page_change_signal(self, wait_for_page_load: bool = True):
+		return self.signal
+
+
+class TestAgentBrowserStatePrefetch:
+	"""Test that the agent reuses a prefetched browser state only while the page is unchanged."""
+
+	def make_agent(self) -> tuple[Agent, FakePrefetchSession]:
+		agent = Agent(task='test', llm=create_mock_llm(), prefetch_browser_state=True)
+		session = FakePrefetchSession()
+		agent.browser_session = session  # type: ignore[assignment]
+		return agent, session
+
+	async def test_prefetched_state_used_when_page_unchanged(self):
+		agent, session = self.make_agent()
+
+		agent._start_browser_state_prefetch()
+		assert await agent._get_prefetched_browser_state() == 'state 1'
+		assert session.captures == 1
+		assert session._cached_clickable_element_hashes == 'hashes after capture 1'
+
+		# nothing prefetched -> caller captures the state itself
+		assert await agent._get_prefetched_browser_state() is None
+
+	async def test_prefetched_state_discarded_when_page_changed(self):
+		agent, session = self.make_agent()
+
+		agent._start_browser_state_prefetch()
+		assert agent._prefetched_browser_state_task is not None
+		await agent._prefetched_browser_state_task
+		session.signal = PageChangeSignal(url='https://example.com', document_id='abc', dom_generation=2)
+
+		assert await agent._get_prefetched_browser_state() is None
+		# the discarded capture must not count towards the "new element" markers of the real one
+		assert session._cached_clickable_element_hashes == 'hashes before prefetch'
+
+	async def test_no_prefetch_after_done_or_when_disabled(self):
+		agent, session = self.make_agent()
+		agent.state.last_result = [ActionResult(is_done=True, success=True, extracted_content='done')]
+		agent._start_browser_state_prefetch()
+		assert agent._prefetched_browser_state_task is None
+
+		agent.settings.prefetch_browser_state = False
+		agent.state.last_result = []
+		agent._start_browser_state_prefetch()
+		assert agent._prefetched_browser_state_task is None
+		assert session.captures == 0
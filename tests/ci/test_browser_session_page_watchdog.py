@@ -0,0 +1,111 @@
+"""
+Test the CDP page watchdog that detects crashed/detached/dialog-blocked pages and records recovery incidents.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+from browser_use import BrowserProfile, BrowserSession
+
+
+class FakePage:
+	"""Minimal stand-in for a playwright Page"""
+
+	def __init__(self, url: str = 'https://example.com/'):
+		self.url = url
+		self.closed = False
+
+	def is_closed(self) -> bool:
+		return self.closed
+
+
+class FakeCDPSession:
+	"""Records the CDP commands sent to it"""
+
+	def __init__(self, error: Exception | None = None):
+		self.sent: list[tuple[str, dict]] = []
+		self.error = error
+
+	async def send(self, method: str, params: dict | None = None):
+		self.sent.append((method, params or {}))
+		if self.error:
+			raise self.error
+		return {}
+
+
+class TestPageWatchdog:
+	"""Test failure classification, recovery strategy selection and recovery-time metrics."""
+
+	def test_failures_classified_per_type(self):
+		session = BrowserSession(browser_profile=BrowserProfile())
+		crashed, detached = FakePage(), FakePage()
+
+		session.agent_current_page = crashed  # type: ignore
+		session._on_page_failure(crashed, 'crash', reason='Inspector.targetCrashed')  # type: ignore
+		assert session._page_failures[crashed].strategy == 'reopen_url'
+
+		session.agent_current_page = detached  # type: ignore
+		session._on_page_failure(detached, 'detached', reason='target_closed')  # type: ignore
+		assert session._page_failures[detached].strategy == 'switch_tab'
+
+	def test_failures_on_other_tabs_are_ignored(self):
+		session = BrowserSession(browser_profile=BrowserProfile())
+		session.agent_current_page = FakePage()  # type: ignore
+		background_tab = FakePage()
+		session._on_page_failure(background_tab, 'detached', reason='target_closed')  # type: ignore
+		assert background_tab not in session._page_failures
+
+	async def test_detached_page_recovery_is_recorded(self):
+		session = BrowserSession(browser_profile=BrowserProfile())
+		page = FakePage()
+		page.closed = True
+		session.agent_current_page = page  # type: ignore
+		session._on_page_failure(page, 'detached', reason='target_closed')  # type: ignore
+
+		await session._recover_from_page_failure(session._page_failures.pop(page), 'test')
+
+		assert session.agent_current_page is None  # @require_healthy_browser opens a new tab from here
+		assert session._in_recovery is False
+		[incident] = session.page_recovery_incidents
+		assert incident.failure == 'detached'
+		assert incident.success
+		assert incident.recovery_time is not None and incident.recovery_time >= 0
+
+	async def test_javascript_dialogs_are_dismissed(self):
+		session = BrowserSession(browser_profile=BrowserProfile())
+		page = FakePage()
+
+		cdp_session = FakeCDPSession()
+		await session._dismiss_javascript_dialog(page, cdp_session, {'type': 'confirm', 'message': 'Are you sure?'})  # type: ignore
+		assert cdp_session.sent == [('Page.handleJavaScriptDialog', {'accept': False})]
+
+		cdp_session = FakeCDPSession()
+		await session._dismiss_javascript_dialog(page, cdp_session, {'type': 'beforeunload', 'message': ''})  # type: ignore
+		assert cdp_session.sent == [('Page.handleJavaScriptDialog', {'accept': True})]
+
+		# closed in the meantime counts as recovered too
+		cdp_session = FakeCDPSession(error=Exception('Protocol error: No dialog is showing'))
+		await session._dismiss_javascript_dialog(page, cdp_session, {'type': 'alert', 'message': 'hi'})  # type: ignore
+
+		incidents = session.page_recovery_incidents
+		assert [incident.strategy for incident in incidents] == ['dismiss_dialog', 'accept_dialog', 'dismiss_dialog']
+		assert all(incident.failure == 'dialog' and incident.success for incident in incidents)
+
+	async def test_dialogs_handled_by_playwright_are_left_alone(self):
+		session = BrowserSession(browser_profile=BrowserProfile())
+		page = FakePage()
+
+		# a page.on('dialog') listener (or playwright's auto-dismiss) closes it within the grace period
+		dialog_closed = asyncio.Event()
+		asyncio.get_running_loop().call_later(0.01, dialog_closed.set)
+		cdp_session = FakeCDPSession()
+		await session._dismiss_javascript_dialog(page, cdp_session, {'type': 'alert', 'message': 'hi'}, dialog_closed)  # type: ignore
+		assert cdp_session.sent == []
+		assert session.page_recovery_incidents == []
+
+		# nobody handled it, so the watchdog dismisses it after the grace period
+		with patch('browser_use.browser.session.JAVASCRIPT_DIALOG_GRACE_SECONDS', 0.01):
+			await session._dismiss_javascript_dialog(page, cdp_session, {'type': 'alert', 'message': 'hi'}, asyncio.Event())  # type: ignore
+		assert cdp_session.sent == [('Page.handleJavaScriptDialog', {'accept': False})]
+		[incident] = session.page_recovery_incidents
+		assert incident.strategy == 'dismiss_dialog' and incident.success
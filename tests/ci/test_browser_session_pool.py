@@ -0,0 +1,87 @@
+"""
+Test leasing warm browsers from a BrowserSessionPool.
+"""
+
+import os
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from browser_use.browser import BrowserProfile, BrowserSessionPool
+from browser_use.browser.pool import PooledBrowser, _get_process_tree_rss_mb
+
+
+class TestBrowserSessionPool:
+	"""Test that pooled browsers are reused, isolated between leases, and retired when used up."""
+
+	def test_process_tree_rss(self):
+		assert _get_process_tree_rss_mb(None) is None
+		rss_mb = _get_process_tree_rss_mb(os.getpid())
+		assert rss_mb is not None and rss_mb > 0
+
+	async def test_leases_are_isolated_sessions_of_the_pooled_browser(self):
+		profile = BrowserProfile(headless=True, user_data_dir=None)
+		pool = BrowserSessionPool(browser_profile=profile, size=1)
+		owner = MagicMock()
+		owner.browser.is_connected.return_value = True
+		owner.new_isolated_session = AsyncMock(side_effect=['lease 1', 'lease 2'])
+		entry = PooledBrowser(session=owner)
+
+		assert await pool._create_lease(entry) == 'lease 1'
+		owner.new_isolated_session.assert_awaited_once_with(browser_profile=profile)
+
+		# a spare session pre-created on release is handed out first
+		entry.spare_session = 'spare lease'  # type: ignore[assignment]
+		assert await pool._create_lease(entry) == 'spare lease'
+		assert entry.spare_session is None
+
+		# a dead browser is retired by acquire(), never relaunched by new_isolated_session()
+		owner.browser.is_connected.return_value = False
+		with pytest.raises(RuntimeError):
+			await pool._create_lease(entry)
+		assert owner.new_isolated_session.await_count == 1
+
+	async def test_leases_reuse_warm_browser_with_clean_contexts(self, httpserver):
+		httpserver.expect_request('/set-cookie').respond_with_data(
+			'<html><body>cookie set</body></html>', headers={'Set-Cookie': 'leaked=yes; Path=/'}
+		)
+
+		pool = BrowserSessionPool(browser_profile=BrowserProfile(headless=True, user_data_dir=None), size=1)
+		await pool.start()
+		try:
+			async with pool.lease() as first:
+				first_browser = first.browser
+				await first.navigate(httpserver.url_for('/set-cookie'))
+				assert any(cookie['name'] == 'leaked' for cookie in await first.get_cookies())
+
+			async with pool.lease() as second:
+				# same warm browser underneath, but a brand new context with no state from the previous lease
+				assert second.browser is first_browser
+				assert second.browser_context is not None
+				assert not any(cookie['name'] == 'leaked' for cookie in await second.get_cookies())
+				# the lease must never own the pooled browser
+				assert second._owns_browser_resources is False
+				await second.stop()
+				assert first_browser is not None and first_browser.is_connected()
+
+			assert pool.stats['launched'] == 1
+			assert pool.stats['leases'] == 2
+		finally:
+			await pool.stop()
+
+	async def test_browser_retired_after_max_leases(self):
+		pool = BrowserSessionPool(
+			browser_profile=BrowserProfile(headless=True, user_data_dir=None), size=1, max_leases_per_browser=1
+		)
+		await pool.start()
+		try:
+			async with pool.lease() as first:
+				first_browser = first.browser
+
+			async with pool.lease() as second:
+				assert second.browser is not first_browser
+
+			assert pool.stats['retired'] >= 1
+			assert pool.stats['launched'] == 2
+		finally:
+			await pool.stop()
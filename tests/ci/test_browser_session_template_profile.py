@@ -0,0 +1,118 @@
+"""
+Test cloning a template user_data_dir into throwaway per-session profiles.
+"""
+
+import asyncio
+import os
+from pathlib import Path
+
+import pytest
+
+from browser_use import BrowserProfile, BrowserSession
+from browser_use.browser.user_data_dir import TEMPLATE_CLONE_PREFIX, clone_template_user_data_dir
+
+
+@pytest.fixture
+def template_dir(tmp_path: Path) -> Path:
+	"""A fake warmed-up chrome profile with immutable cache files, mutable state files and lock files"""
+	template = tmp_path / 'template-profile'
+	(template / 'Default' / 'Cache').mkdir(parents=True)
+	(template / 'Default' / 'Cache' / 'f_000001').write_bytes(b'cached response body')
+	(template / 'Default' / 'Cookies').write_bytes(b'SQLite format 3\x00' + b'\x00' * 64)
+	(template / 'Default' / 'Preferences').write_text('{"profile": {}}')
+	(template / 'Local State').write_text('{}')
+	(template / 'SingletonLock').write_text('some-other-host-12345')
+	(template / 'Default' / 'Local Storage' / 'leveldb').mkdir(parents=True)
+	(template / 'Default' / 'Local Storage' / 'leveldb' / '000003.ldb').write_bytes(b'leveldb table')
+	(template / 'Default' / 'Local Storage' / 'leveldb' / 'MANIFEST-000001').write_bytes(b'leveldb manifest')
+	extension_dir = template / 'Default' / 'Extensions' / 'abcdefghijklmnop' / '1.0_0'
+	extension_dir.mkdir(parents=True)
+	(extension_dir / 'background.js').write_text('chrome.runtime.onInstalled.addListener(() => {})')
+	(extension_dir / 'manifest.json').write_text('{"manifest_version": 3}')
+	return template
+
+
+def any_exists(*paths: Path) -> bool:
+	return any(path.exists() for path in paths)
+
+
+class TestTemplateUserDataDir:
+	"""Test the clone strategies and how BrowserSession uses them."""
+
+	@pytest.mark.parametrize('strategy', ['copy', 'hardlink'])
+	def test_clone_copies_content_without_locks(self, template_dir: Path, strategy):
+		clone, used_strategy = clone_template_user_data_dir(template_dir, strategy=strategy)
+
+		assert used_strategy == strategy
+		assert clone.parent == template_dir.parent
+		assert clone.name.startswith(TEMPLATE_CLONE_PREFIX)
+		assert (clone / 'Default' / 'Cache' / 'f_000001').read_bytes() == b'cached response body'
+		assert (clone / 'Default' / 'Preferences').read_text() == '{"profile": {}}'
+		assert not (clone / 'SingletonLock').exists()
+
+	def test_hardlink_clone_only_shares_immutable_files(self, template_dir: Path):
+		clone, _ = clone_template_user_data_dir(template_dir, strategy='hardlink')
+
+		# only files chrome never writes in place are shared with the template, everything else is a real copy
+		extension_dir = 'Default/Extensions/abcdefghijklmnop/1.0_0'
+		for immutable_file in ('Default/Local Storage/leveldb/000003.ldb', f'{extension_dir}/background.js'):
+			assert os.path.samefile(clone / immutable_file, template_dir / immutable_file)
+		for other_file in (
+			'Default/Cache/f_000001',
+			'Default/Cookies',
+			'Default/Preferences',
+			'Local State',
+			'Default/Local Storage/leveldb/MANIFEST-000001',
+			f'{extension_dir}/manifest.json',
+		):
+			assert not os.path.samefile(clone / other_file, template_dir / other_file)
+
+		(clone / 'Default' / 'Cookies').write_bytes(b'modified by the session')
+		assert (template_dir / 'Default' / 'Cookies').read_bytes().startswith(b'SQLite format 3')
+
+	def test_auto_strategy_falls_back(self, template_dir: Path):
+		clone, used_strategy = clone_template_user_data_dir(template_dir, strategy='auto')
+
+		assert used_strategy in ('reflink', 'hardlink', 'copy')
+		assert (clone / 'Local State').exists()
+		# failed attempts must not leave half-cloned directories behind
+		assert len([p for p in template_dir.parent.iterdir() if p.name.startswith(TEMPLATE_CLONE_PREFIX)]) == 1
+
+	def test_missing_template_raises(self, tmp_path: Path):
+		with pytest.raises(ValueError):
+			clone_template_user_data_dir(tmp_path / 'does-not-exist')
+
+	async def test_session_clones_template_and_cleans_up_in_background(self, template_dir: Path):
+		session = BrowserSession(
+			browser_profile=BrowserProfile(
+				headless=True,
+				template_user_data_dir=template_dir,
+				template_clone_strategy='copy',
+			)
+		)
+
+		await session._clone_template_user_data_dir()
+		clone = Path(session.browser_profile.user_data_dir)  # type: ignore
+		assert clone.name.startswith(TEMPLATE_CLONE_PREFIX)
+		assert await asyncio.to_thread((clone / 'Default' / 'Preferences').exists)
+
+		# every launch gets its own clone
+		await session._clone_template_user_data_dir()
+		second_clone = Path(session.browser_profile.user_data_dir)  # type: ignore
+		assert second_clone != clone
+		assert await asyncio.to_thread((second_clone / 'Default' / 'Preferences').exists)
+
+		# a locked profile falls back to a temp dir, which the relaunch replaces with a clone and removes,
+		# the abandoned clone is removed right away
+		session._fallback_to_temp_profile()
+		fallback_dir = Path(session.browser_profile.user_data_dir)  # type: ignore
+		assert fallback_dir.name.startswith('browseruse-tmp-')
+
+		for user_data_dir in (clone, fallback_dir):
+			session._schedule_user_data_dir_cleanup(user_data_dir)
+		for _ in range(50):
+			if not await asyncio.to_thread(any_exists, clone, second_clone, fallback_dir):
+				break
+			await asyncio.sleep(0.05)
+		assert not await asyncio.to_thread(any_exists, clone, second_clone, fallback_dir)
+		assert await asyncio.to_thread(template_dir.exists)
@@ -0,0 +1,86 @@
+"""Test the raw bytes image content part and how each provider serializer encodes it"""
+
+import base64
+from unittest.mock import patch
+
+from browser_use.llm.anthropic.serializer import AnthropicMessageSerializer
+from browser_use.llm.aws.serializer import AWSBedrockMessageSerializer
+from browser_use.llm.deepseek.serializer import DeepSeekMessageSerializer
+from browser_use.llm.google.serializer import GoogleMessageSerializer
+from browser_use.llm.messages import ContentPartImageBytesParam, ContentPartTextParam, UserMessage
+from browser_use.llm.ollama.serializer import OllamaMessageSerializer
+from browser_use.llm.openai.serializer import OpenAIMessageSerializer
+
+PNG_BYTES = b'\x89PNG\r\n\x1a\nfake image data'
+PNG_BASE64 = base64.b64encode(PNG_BYTES).decode()
+
+
+def make_message() -> UserMessage:
+	return UserMessage(
+		content=[
+			ContentPartTextParam(text='Current screenshot:'),
+			ContentPartImageBytesParam.from_base64(PNG_BASE64, detail='low'),
+		]
+	)
+
+
+class TestImageBytesContent:
+	"""Test the image bytes part itself."""
+
+	def test_from_base64_keeps_the_encoded_form(self):
+		with patch('browser_use.llm.messages.base64.b64decode', wraps=base64.b64decode) as b64decode:
+			part = ContentPartImageBytesParam.from_base64(PNG_BASE64)
+			assert str(part) == f'🖼️  Image[image/png, detail=auto]: <{len(PNG_BYTES)} bytes>'
+			assert part.model_dump(mode='json')['data'] == PNG_BASE64
+			b64decode.assert_not_called()  # decoded only once the bytes are needed
+
+			assert part.data == PNG_BYTES
+			assert part.data == PNG_BYTES
+			assert b64decode.call_count == 1
+
+		with patch('browser_use.llm.messages.base64.b64encode') as b64encode:
+			assert part.to_base64() == PNG_BASE64
+			assert part.to_data_url() == f'data:image/png;base64,{PNG_BASE64}'
+			b64encode.assert_not_called()
+
+		assert ContentPartImageBytesParam(data=PNG_BYTES).to_base64() == PNG_BASE64
+		assert part == ContentPartImageBytesParam(data=PNG_BYTES)
+
+	def test_json_round_trip(self):
+		message = make_message()
+		dumped = message.model_dump(mode='json')
+		assert dumped['content'][1]['data'] == PNG_BASE64
+		assert UserMessage.model_validate_json(message.model_dump_json()) == message
+
+
+class TestImageBytesSerializers:
+	"""Test that every provider gets the image in the format its API needs."""
+
+	def test_openai_like_providers_get_a_data_url(self):
+		openai_part = OpenAIMessageSerializer.serialize(make_message())['content'][1]  # type: ignore[index]
+		assert openai_part == {'type': 'image_url', 'image_url': {'url': f'data:image/png;base64,{PNG_BASE64}', 'detail': 'low'}}
+
+		deepseek_part = DeepSeekMessageSerializer.serialize(make_message())['content'][1]  # type: ignore[index]
+		assert deepseek_part == {'type': 'image_url', 'image_url': {'url': f'data:image/png;base64,{PNG_BASE64}'}}
+
+	def test_anthropic_gets_base64(self):
+		block = AnthropicMessageSerializer.serialize(make_message())['content'][1]  # type: ignore[index]
+		assert block == {'type': 'image', 'source': {'type': 'base64', 'media_type': 'image/png', 'data': PNG_BASE64}}
+
+	def test_base64_providers_never_decode(self):
+		with patch('base64.b64decode', wraps=base64.b64decode) as b64decode:
+			OpenAIMessageSerializer.serialize(make_message())
+			AnthropicMessageSerializer.serialize(make_message())
+		b64decode.assert_not_called()
+
+	def test_byte_based_providers_get_the_bytes(self):
+		messages = [make_message() for _ in range(3)]
+		with patch('base64.b64decode', wraps=base64.b64decode) as b64decode:
+			contents, _ = GoogleMessageSerializer.serialize_messages([messages[0]])
+			bedrock_blocks = AWSBedrockMessageSerializer.serialize(messages[1])['content']
+			ollama_message = OllamaMessageSerializer.serialize(messages[2])
+		assert b64decode.call_count == 3  # once per image, in the serializer that needs the bytes
+
+		assert contents[0].parts[1].inline_data.data == PNG_BYTES  # type: ignore
+		assert bedrock_blocks[1] == {'image': {'format': 'png', 'source': {'bytes': PNG_BYTES}}}
+		assert ollama_message.images is not None and len(ollama_message.images) == 1
@@ -0,0 +1,140 @@
+"""Test the local record/replay cache wrapper for LLM calls"""
+
+import base64
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from pydantic import BaseModel
+
+from browser_use.agent.prompts import AgentMessagePrompt
+from browser_use.browser.views import BrowserStateSummary, TabInfo
+from browser_use.dom.views import DOMElementNode
+from browser_use.filesystem.file_system import FileSystem
+from browser_use.llm.cache import CachedChatModel
+from browser_use.llm.exceptions import ModelCacheMissError
+from browser_use.llm.messages import BaseMessage, SystemMessage, UserMessage
+from browser_use.llm.views import ChatInvokeCompletion
+from tests.ci.conftest import create_mock_llm
+
+
+class Answer(BaseModel):
+	text: str
+	success: bool
+
+
+ANSWER_JSON = '{"text": "Task completed", "success": true}'
+
+MESSAGES: list[BaseMessage] = [SystemMessage(content='You are a browser agent'), UserMessage(content='Open example.com')]
+
+
+def make_agent_messages(file_system: FileSystem, now: datetime, screenshot: bytes, url: str) -> list[BaseMessage]:
+	"""The messages of an agent step, with the state message built by AgentMessagePrompt at the given time"""
+	root = DOMElementNode(tag_name='body', xpath='html/body', attributes={}, children=[], is_visible=True, parent=None)
+	browser_state = BrowserStateSummary(
+		element_tree=root, selector_map={}, url=url, title='Example', tabs=[TabInfo(page_id=0, url=url, title='Example')]
+	)
+	prompt = AgentMessagePrompt(
+		browser_state_summary=browser_state,
+		file_system=file_system,
+		task='Open example.com',
+		screenshots=[base64.b64encode(screenshot).decode()],
+	)
+	with patch('browser_use.agent.prompts.datetime') as mock_datetime:
+		mock_datetime.now.return_value = now
+		return [MESSAGES[0], prompt.get_user_message(use_vision=True)]
+
+
+class TestCachedChatModel:
+	"""Test record, replay and passthrough modes and the hit/miss counters."""
+
+	async def test_record_then_replay(self, tmp_path):
+		llm = create_mock_llm([ANSWER_JSON, ANSWER_JSON])
+		recorder = CachedChatModel(llm, cache_dir=tmp_path, mode='record')
+
+		first = await recorder.ainvoke(MESSAGES, Answer)
+		second = await recorder.ainvoke(MESSAGES, Answer)
+		assert first.completion == second.completion == Answer(text='Task completed', success=True)
+		assert (recorder.misses, recorder.hits) == (1, 1)
+		assert llm.ainvoke.await_count == 1  # type: ignore[attr-defined]
+		assert len(list(tmp_path.glob('*.json'))) == 1
+
+		# a new process replays from disk without ever calling the model
+		offline_llm = create_mock_llm()
+		replayer = CachedChatModel(offline_llm, cache_dir=tmp_path, mode='replay')
+		replayed = await replayer.ainvoke(MESSAGES, Answer)
+		assert replayed.completion == first.completion
+		assert replayed.usage is None
+		assert offline_llm.ainvoke.await_count == 0  # type: ignore[attr-defined]
+		assert (replayer.hits, replayer.misses) == (1, 0)
+
+	async def test_streaming_records_and_replays(self, tmp_path):
+		async def ainvoke_streaming(messages, output_format, on_text):
+			on_text(ANSWER_JSON[:10])
+			on_text(ANSWER_JSON[10:])
+			return ChatInvokeCompletion(completion=output_format.model_validate_json(ANSWER_JSON), usage=None)
+
+		llm = create_mock_llm()
+		llm.ainvoke_streaming = AsyncMock(side_effect=ainvoke_streaming)  # type: ignore[attr-defined]
+		recorder = CachedChatModel(llm, cache_dir=tmp_path, mode='record')
+
+		recorded_chunks: list[str] = []
+		first = await recorder.ainvoke_streaming(MESSAGES, Answer, recorded_chunks.append)  # type: ignore[attr-defined]
+		assert ''.join(recorded_chunks) == ANSWER_JSON
+
+		replayed_chunks: list[str] = []
+		second = await recorder.ainvoke_streaming(MESSAGES, Answer, replayed_chunks.append)  # type: ignore[attr-defined]
+		assert second.completion == first.completion
+		assert [Answer.model_validate_json(chunk) for chunk in replayed_chunks] == [first.completion]
+		assert llm.ainvoke_streaming.await_count == 1  # type: ignore[attr-defined]
+		assert (recorder.misses, recorder.hits) == (1, 1)
+
+	async def test_replay_miss_raises(self, tmp_path):
+		replayer = CachedChatModel(create_mock_llm(), cache_dir=tmp_path, mode='replay')
+
+		with pytest.raises(ModelCacheMissError):
+			await replayer.ainvoke(MESSAGES)
+		assert replayer.misses == 1
+
+	async def test_passthrough_never_touches_the_cache(self, tmp_path):
+		llm = create_mock_llm()
+		passthrough = CachedChatModel(llm, cache_dir=tmp_path / 'cache', mode='passthrough')
+
+		await passthrough.ainvoke(MESSAGES)
+		await passthrough.ainvoke(MESSAGES)
+		assert llm.ainvoke.await_count == 2  # type: ignore[attr-defined]
+		assert (passthrough.hits, passthrough.misses) == (0, 0)
+		assert not (tmp_path / 'cache').exists()
+
+	def test_cache_key_is_stable_and_covers_the_request(self, tmp_path):
+		cached = CachedChatModel(create_mock_llm(), cache_dir=tmp_path)
+		key = cached.get_cache_key(MESSAGES, Answer)
+
+		assert key == cached.get_cache_key([message.model_copy() for message in MESSAGES], Answer)
+		assert key != cached.get_cache_key(MESSAGES)
+		assert key != cached.get_cache_key(MESSAGES[:1], Answer)
+		assert key != cached.get_cache_key([MESSAGES[0], UserMessage(content='Open example.org')], Answer)
+		assert cached.model == cached.name == 'mock-llm'
+		assert cached.provider == 'mock'
+
+	async def test_replay_of_a_later_agent_step(self, tmp_path):
+		file_system = FileSystem(tmp_path / 'files')
+		recorded = make_agent_messages(file_system, datetime(2025, 1, 1, 12, 1), b'first run pixels', 'https://example.com')
+		later = make_agent_messages(file_system, datetime(2025, 1, 1, 12, 7), b'second run pixels', 'https://example.com')
+		assert recorded[1].text != later[1].text  # the agent state has a different time
+
+		recorder = CachedChatModel(create_mock_llm([ANSWER_JSON]), cache_dir=tmp_path / 'cache', mode='record')
+		await recorder.ainvoke(recorded, Answer)
+
+		replayer = CachedChatModel(create_mock_llm(), cache_dir=tmp_path / 'cache', mode='replay')
+		replayed = await replayer.ainvoke(later, Answer)
+		assert replayed.completion == Answer(text='Task completed', success=True)
+
+		# a different page is still a different request
+		other_page = make_agent_messages(file_system, datetime(2025, 1, 1, 12, 1), b'first run pixels', 'https://example.org')
+		with pytest.raises(ModelCacheMissError):
+			await replayer.ainvoke(other_page, Answer)
+
+		# the normalization can be replaced, e.g. to key on the exact messages
+		exact = CachedChatModel(create_mock_llm(), cache_dir=tmp_path, normalize_message=lambda m: m.model_dump(mode='json'))
+		assert exact.get_cache_key(recorded, Answer) != exact.get_cache_key(later, Answer)
@@ -0,0 +1,80 @@
+"""Test that chat models build their SDK client once and reuse its connection pool across calls"""
+
+import asyncio
+
+import httpx
+from pytest_httpserver import HTTPServer
+
+from browser_use.llm.anthropic.chat import ChatAnthropic
+from browser_use.llm.messages import BaseMessage, UserMessage
+from browser_use.llm.openai.chat import ChatOpenAI
+
+CHAT_COMPLETION_RESPONSE = {
+	'id': 'chatcmpl-test',
+	'object': 'chat.completion',
+	'created': 0,
+	'model': 'gpt-4o-mini',
+	'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': 'hello'}, 'finish_reason': 'stop'}],
+	'usage': {'prompt_tokens': 1, 'completion_tokens': 1, 'total_tokens': 2},
+}
+
+
+def _make_llm(httpserver: HTTPServer, **kwargs) -> ChatOpenAI:
+	httpserver.expect_request('/v1/chat/completions', method='POST').respond_with_json(CHAT_COMPLETION_RESPONSE)
+	return ChatOpenAI(model='gpt-4o-mini', api_key='test-key', base_url=httpserver.url_for('/v1'), max_retries=0, **kwargs)
+
+
+async def test_client_reused_across_calls_and_closed_by_aclose(httpserver: HTTPServer):
+	llm = _make_llm(httpserver, http_pool_limits=httpx.Limits(max_connections=7, max_keepalive_connections=3))
+	messages: list[BaseMessage] = [UserMessage(content='hi')]
+
+	client = llm.get_client()
+	results = await asyncio.gather(*(llm.ainvoke(messages) for _ in range(3)))
+	assert [result.completion for result in results] == ['hello'] * 3
+	assert llm.get_client() is client
+	assert len(httpserver.log) == 3
+
+	# the configured pool limits end up on the shared http client
+	pool = client._client._transport._pool  # type: ignore[attr-defined]
+	assert pool._max_connections == 7
+	assert pool._max_keepalive_connections == 3
+
+	await llm.aclose()
+	assert client.is_closed()
+
+	# the next call transparently builds a new client
+	assert (await llm.ainvoke(messages)).completion == 'hello'
+	assert llm.get_client() is not client
+	await llm.aclose()
+
+
+async def test_user_supplied_http_client_is_not_closed(httpserver: HTTPServer):
+	http_client = httpx.AsyncClient()
+	llm = _make_llm(httpserver, http_client=http_client)
+
+	assert (await llm.ainvoke([UserMessage(content='hi')])).completion == 'hello'
+	await llm.aclose()
+
+	assert not http_client.is_closed
+	await http_client.aclose()
+
+
+def test_clients_are_per_event_loop(httpserver: HTTPServer):
+	llm = _make_llm(httpserver)
+
+	async def get_client_and_call():
+		await llm.ainvoke([UserMessage(content='hi')])
+		return llm.get_client()
+
+	# a client bound to a closed loop must never be handed out to the next one
+	first = asyncio.run(get_client_and_call())
+	second = asyncio.run(get_client_and_call())
+	assert first is not second
+	assert len(httpserver.log) == 2
+
+
+def test_user_supplied_http_client_wins_over_pool_limits():
+	http_client = httpx.AsyncClient()
+	llm = ChatAnthropic(model='claude-sonnet-4-0', api_key='test-key', http_client=http_client, http_pool_limits=httpx.Limits())
+
+	assert llm._get_client_params()['http_client'] is http_client
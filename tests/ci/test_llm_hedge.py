@@ -0,0 +1,76 @@
+"""Test hedged LLM requests: the dynamic hedge delay, the race between both models and the hedge counters"""
+
+import asyncio
+
+import pytest
+
+from browser_use.llm.exceptions import ModelProviderError
+from browser_use.llm.hedge import HedgedChatModel
+from browser_use.llm.messages import UserMessage
+from tests.ci.conftest import create_slow_mock_llm
+
+MESSAGES = [UserMessage(content='Open example.com')]
+
+
+class TestHedgedChatModel:
+	"""Test when the hedge request is sent and who wins."""
+
+	async def test_fast_primary_is_not_hedged(self):
+		primary, secondary = create_slow_mock_llm('primary', [0.01]), create_slow_mock_llm('secondary', [0.01])
+		hedged = HedgedChatModel(primary, secondary, initial_hedge_delay=1)
+
+		assert (await hedged.ainvoke(MESSAGES)).completion == 'primary'
+		assert secondary.ainvoke.await_count == 0  # type: ignore[attr-defined]
+		assert (hedged.calls, hedged.hedged_calls, hedged.hedge_rate) == (1, 0, 0)
+
+	async def test_slow_primary_loses_to_secondary_and_is_cancelled(self):
+		primary, secondary = create_slow_mock_llm('primary', [5]), create_slow_mock_llm('secondary', [0.01])
+		hedged = HedgedChatModel(primary, secondary, initial_hedge_delay=0.05)
+
+		assert (await hedged.ainvoke(MESSAGES)).completion == 'secondary'
+		await asyncio.sleep(0.01)  # let the cancellation and its done callbacks run
+		assert primary.cancelled == 1  # type: ignore[attr-defined]
+		assert (hedged.hedged_calls, hedged.secondary_wins, hedged.hedge_rate) == (1, 1, 1.0)
+		assert len(hedged._latencies) == 1 and hedged._latencies[0] >= 0.05  # lower bound of the cancelled primary
+
+	async def test_failed_hedge_waits_for_primary(self):
+		primary = create_slow_mock_llm('primary', [0.2])
+		secondary = create_slow_mock_llm('secondary', [0.01], error=ModelProviderError('overloaded', status_code=529))
+		hedged = HedgedChatModel(primary, secondary, initial_hedge_delay=0.05)
+
+		assert (await hedged.ainvoke(MESSAGES)).completion == 'primary'
+		assert (hedged.hedged_calls, hedged.secondary_wins) == (1, 0)
+
+		failing = create_slow_mock_llm('failing', [0.1], error=ModelProviderError('down', status_code=503))
+		failing_hedged = HedgedChatModel(failing, initial_hedge_delay=0.01)
+		with pytest.raises(ModelProviderError):
+			await failing_hedged.ainvoke(MESSAGES)
+		assert len(failing_hedged._latencies) == 0
+
+	async def test_hedge_delay_follows_observed_latencies(self):
+		primary = create_slow_mock_llm('primary', [0.001])
+		hedged = HedgedChatModel(primary, initial_hedge_delay=7, min_hedge_delay=0, min_samples=5, hedge_percentile=0.8)
+		assert hedged.get_hedge_delay() == 7
+
+		hedged._latencies.extend([1.0, 2.0, 3.0, 4.0, 10.0])
+		assert hedged.get_hedge_delay() == 4.0  # p80 of 5 samples, the 10s outlier is not the threshold
+		hedged.min_hedge_delay = 5
+		assert hedged.get_hedge_delay() == 5
+
+		await hedged.ainvoke(MESSAGES)
+		assert len(hedged._latencies) == 6
+		assert (hedged.model, hedged.provider) == ('primary', 'mock')
+
+	async def test_slow_tail_keeps_hedge_delay_up(self):
+		# bimodal primary: mostly fast, every third call far slower than the hedge delay and cancelled by the hedge
+		primary = create_slow_mock_llm('primary', [1, 0.001, 0.001] * 3 + [0.001])
+		secondary = create_slow_mock_llm('secondary', [0.01])
+		hedged = HedgedChatModel(primary, secondary, initial_hedge_delay=0.05, min_hedge_delay=0, min_samples=5)
+
+		for _ in range(10):
+			await hedged.ainvoke(MESSAGES)
+			await asyncio.sleep(0.01)  # let the cancelled primary's done callback run
+
+		assert (hedged.hedged_calls, hedged.secondary_wins) == (3, 3)
+		assert len(hedged._latencies) == 10
+		assert hedged.get_hedge_delay() >= 0.05  # the cancelled slow calls still count, the p95 is not a fast call
@@ -0,0 +1,144 @@
+"""Test the process-wide RPM/TPM token-bucket limiter for LLM calls"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from browser_use.llm.exceptions import ModelRateLimitError
+from browser_use.llm.messages import SystemMessage, UserMessage
+from browser_use.llm.rate_limit import (
+	LLMRateLimiter,
+	RateLimitedChatModel,
+	TokenBucket,
+	estimate_prompt_tokens,
+	get_rate_limiter,
+)
+from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
+from tests.ci.conftest import create_mock_llm
+
+MESSAGES = [SystemMessage(content='x' * 400), UserMessage(content='y' * 400)]
+
+
+def make_usage(total_tokens: int) -> ChatInvokeUsage:
+	return ChatInvokeUsage(
+		prompt_tokens=total_tokens,
+		prompt_cached_tokens=None,
+		prompt_cache_creation_tokens=None,
+		prompt_image_tokens=None,
+		completion_tokens=0,
+		total_tokens=total_tokens,
+	)
+
+
+class TestTokenBucket:
+	"""Test the refill and reservation math of a single bucket."""
+
+	def test_reservations_queue_up_behind_each_other(self):
+		bucket = TokenBucket(capacity=60, level=60, updated_at=0)  # refills 1 per second
+
+		assert bucket.reserve(60, now=0) == (0, 60)
+		assert bucket.reserve(10, now=0) == (10, 10)  # waits for 10 tokens to refill
+		assert bucket.reserve(10, now=0) == (20, 10)  # and the next one queues behind it
+		assert bucket.reserve(10, now=30) == (0, 10)  # 30s later the debt of 20 is paid and 10 are left
+
+	def test_oversized_request_waits_for_a_full_bucket(self):
+		bucket = TokenBucket(capacity=60, level=0, updated_at=0)
+		assert bucket.reserve(1_000, now=0) == (60, 60)  # only a full bucket is taken, and has to be given back
+
+	def test_adjust_and_drain(self):
+		bucket = TokenBucket(capacity=60, level=30, updated_at=0)
+		bucket.adjust(100, now=0)
+		assert bucket.level == 60  # never above capacity
+		bucket.adjust(-90, now=0)
+		assert bucket.level == -30
+		bucket.drain(now=60)
+		assert bucket.level == 0
+
+
+class TestLLMRateLimiter:
+	"""Test the shared limiter and the rate limited chat model wrapper."""
+
+	def test_limiters_are_shared_per_provider_and_model(self):
+		limiter = get_rate_limiter('test-provider', 'shared-model', requests_per_minute=10)
+		assert get_rate_limiter('test-provider', 'shared-model') is limiter
+		assert get_rate_limiter('test-provider', 'other-model') is not limiter
+
+		# new limits apply to the existing limiter
+		get_rate_limiter('test-provider', 'shared-model', tokens_per_minute=1_000)
+		assert limiter.requests is not None and limiter.requests.capacity == 10
+		assert limiter.tokens is not None and limiter.tokens.capacity == 1_000
+
+		with pytest.raises(ValueError):
+			LLMRateLimiter(requests_per_minute=0)
+
+	async def test_requests_wait_for_capacity(self):
+		limiter = LLMRateLimiter(requests_per_minute=2, tokens_per_minute=1_000)
+		with patch('browser_use.llm.rate_limit.asyncio.sleep', new_callable=AsyncMock) as sleep:
+			assert await limiter.acquire(100) == (0, 100)
+			assert await limiter.acquire(100) == (0, 100)
+			waited, _ = await limiter.acquire(100)  # third request within the minute
+			assert waited == pytest.approx(30, abs=0.1)
+			sleep.assert_awaited_once()
+
+	async def test_cancelled_wait_releases_the_reservation(self):
+		limiter = LLMRateLimiter(tokens_per_minute=600)
+		await limiter.acquire(600)
+		task = asyncio.create_task(limiter.acquire(300))
+		await asyncio.sleep(0)
+		task.cancel()
+		with pytest.raises(asyncio.CancelledError):
+			await task
+		assert limiter.tokens is not None and limiter.tokens.level == pytest.approx(0, abs=1)
+
+	async def test_wrapper_corrects_estimate_with_real_usage(self):
+		llm = create_mock_llm()
+		llm.ainvoke.side_effect = None  # type: ignore[attr-defined]
+		llm.ainvoke.return_value = ChatInvokeCompletion(completion='ok', usage=make_usage(50))  # type: ignore[attr-defined]
+		llm.model = 'usage-model'
+		limited = RateLimitedChatModel(llm, tokens_per_minute=100_000, estimated_completion_tokens=500)
+
+		estimate = estimate_prompt_tokens(MESSAGES) + 500
+		assert estimate == 708
+		response = await limited.ainvoke(MESSAGES)
+		assert response.completion == 'ok'
+		assert limited.limiter.tokens is not None
+		# the bucket was only charged the 50 tokens actually used
+		assert limited.limiter.tokens.level == pytest.approx(100_000 - 50, abs=5)
+		assert (limited.model, limited.provider) == ('usage-model', 'mock')
+
+	async def test_oversized_estimate_only_gives_back_what_was_taken(self):
+		llm = create_mock_llm()
+		llm.ainvoke.side_effect = None  # type: ignore[attr-defined]
+		llm.ainvoke.return_value = ChatInvokeCompletion(completion='ok', usage=make_usage(50))  # type: ignore[attr-defined]
+		llm.model = 'oversized-model'
+		limited = RateLimitedChatModel(llm, tokens_per_minute=100, estimated_completion_tokens=500)
+
+		with patch('browser_use.llm.rate_limit.asyncio.sleep', new_callable=AsyncMock):
+			await limited.ainvoke(MESSAGES)
+		assert limited.limiter.tokens is not None
+		# a full bucket (100) was taken for the 708 token estimate, only 100 - 50 used tokens are credited back
+		assert limited.limiter.tokens.level == pytest.approx(100 - 50, abs=1)
+
+	async def test_streaming_goes_through_the_limiter(self):
+		llm = create_mock_llm()
+		llm.model = 'streaming-model'
+		llm.ainvoke_streaming = AsyncMock(return_value=ChatInvokeCompletion(completion='ok', usage=make_usage(50)))  # type: ignore[attr-defined]
+		limited = RateLimitedChatModel(llm, requests_per_minute=60, tokens_per_minute=100_000)
+
+		chunks: list[str] = []
+		assert (await limited.ainvoke_streaming(MESSAGES, None, chunks.append)).completion == 'ok'  # type: ignore[attr-defined]
+		llm.ainvoke_streaming.assert_awaited_once_with(MESSAGES, None, chunks.append)  # type: ignore[attr-defined]
+		assert limited.limiter.requests is not None and limited.limiter.requests.level == pytest.approx(59, abs=0.1)
+		assert limited.limiter.tokens is not None and limited.limiter.tokens.level == pytest.approx(100_000 - 50, abs=5)
+
+	async def test_provider_rate_limit_drains_the_buckets(self):
+		llm = create_mock_llm()
+		llm.ainvoke.side_effect = ModelRateLimitError('Too many requests', model='drain-model')  # type: ignore[attr-defined]
+		llm.model = 'drain-model'
+		limited = RateLimitedChatModel(llm, requests_per_minute=60, tokens_per_minute=100_000)
+
+		with pytest.raises(ModelRateLimitError):
+			await limited.ainvoke(MESSAGES)
+		assert limited.limiter.requests is not None and limited.limiter.requests.level <= 0.1
+		assert limited.limiter.tokens is not None and limited.limiter.tokens.level <= 0.1
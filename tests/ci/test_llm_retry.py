@@ -0,0 +1,222 @@
+"""Test the provider independent retry policy, Retry-After handling and the shared circuit breaker"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from browser_use.llm.exceptions import ModelCircuitOpenError, ModelOutputParseError, ModelProviderError, ModelRateLimitError
+from browser_use.llm.messages import UserMessage
+from browser_use.llm.openai.chat import ChatOpenAI
+from browser_use.llm.retry import (
+	CircuitBreaker,
+	RetryingChatModel,
+	RetryPolicy,
+	get_circuit_breaker,
+	is_provider_failure,
+	parse_retry_after,
+)
+from browser_use.llm.views import ChatInvokeCompletion
+from tests.ci.conftest import create_named_mock_llm
+
+MESSAGES = [UserMessage(content='Open example.com')]
+OK = ChatInvokeCompletion(completion='ok', usage=None)
+
+
+class Answer(BaseModel):
+	text: str
+
+
+class TestRetryPolicy:
+	"""Test which errors are retried and how long to wait for them."""
+
+	def test_parse_retry_after(self):
+		assert parse_retry_after({'retry-after': '7'}) == 7
+		assert parse_retry_after({'retry-after-ms': '1500', 'retry-after': '7'}) == 1.5
+		assert parse_retry_after({'retry-after': 'Wed, 21 Oct 2015 07:28:00 GMT'}) == 0  # in the past
+		assert parse_retry_after({'retry-after': 'soon'}) is None
+		assert parse_retry_after({}) is None
+
+	def test_retryable_errors_and_delays(self):
+		policy = RetryPolicy(base_delay=2, max_delay=5)
+		assert policy.is_retryable(ModelRateLimitError('slow down'))
+		assert policy.is_retryable(ModelProviderError('bad gateway', status_code=502))
+		assert policy.is_retryable(TimeoutError())
+		assert not policy.is_retryable(ModelProviderError('bad request', status_code=400))
+		assert not policy.is_retryable(ModelCircuitOpenError('open'))
+		assert not policy.is_retryable(ValueError())
+
+		assert policy.get_delay(1, ModelRateLimitError('slow down', retry_after=12)) == 12
+		for attempt in range(1, 6):
+			assert 0 <= policy.get_delay(attempt, TimeoutError()) <= min(5, 2 * 2 ** (attempt - 1))
+
+
+class TestCircuitBreaker:
+	"""Test the closed -> open -> half-open -> closed cycle."""
+
+	def test_opens_on_error_rate_and_recovers_after_trial(self):
+		breaker = CircuitBreaker(failure_rate_threshold=0.5, window_size=10, min_calls=4, cooldown_seconds=30)
+		breaker.record_success()
+		breaker.record_failure()
+		breaker.record_failure()
+		assert breaker.state == 'closed'  # not enough calls to judge yet
+		breaker.record_failure()
+		assert breaker.state == 'open'
+		assert not breaker.allow_request()
+		assert 29 < breaker.seconds_until_retry <= 30
+
+		with patch('browser_use.llm.retry.time.monotonic', return_value=breaker._opened_at + 31):
+			assert breaker.allow_request()  # the trial request
+			assert not breaker.allow_request()  # everyone else still waits for it
+		breaker.record_success()
+		assert breaker.state == 'closed'
+		assert breaker.allow_request()
+
+	def test_failed_trial_reopens(self):
+		breaker = CircuitBreaker(min_calls=1, cooldown_seconds=0)
+		breaker.record_failure()
+		assert breaker.allow_request() and breaker.state == 'half_open'
+		breaker.record_failure()
+		assert breaker.state == 'open'
+
+	def test_stale_trial_times_out(self):
+		breaker = CircuitBreaker(min_calls=1, cooldown_seconds=0, trial_timeout_seconds=60)
+		breaker.record_failure()
+		assert breaker.allow_request() and breaker.state == 'half_open'
+		assert not breaker.allow_request()
+		assert 59 < breaker.seconds_until_retry <= 60
+
+		# the trial never reported back, the next caller makes a new one
+		with patch('browser_use.llm.retry.time.monotonic', return_value=breaker._trial_started_at + 61):
+			assert breaker.allow_request()
+			assert not breaker.allow_request()
+
+
+class TestRetryingChatModel:
+	"""Test retries, the retry time budget, fail fast and fallback."""
+
+	async def test_retries_transient_errors(self):
+		llm = create_named_mock_llm('retry-transient', [ModelProviderError('bad gateway', status_code=502), OK])
+		retrying = RetryingChatModel(llm, use_circuit_breaker=False)
+
+		with patch('browser_use.llm.retry.asyncio.sleep', new_callable=AsyncMock) as sleep:
+			assert (await retrying.ainvoke(MESSAGES)).completion == 'ok'
+		assert llm.ainvoke.await_count == 2  # type: ignore[attr-defined]
+		sleep.assert_awaited_once()
+
+	async def test_gives_up_after_budget_and_on_permanent_errors(self):
+		llm = create_named_mock_llm('retry-budget', ModelRateLimitError('slow down', retry_after=40))
+		retrying = RetryingChatModel(llm, policy=RetryPolicy(max_attempts=5, max_total_delay=60), use_circuit_breaker=False)
+		with patch('browser_use.llm.retry.asyncio.sleep', new_callable=AsyncMock) as sleep:
+			with pytest.raises(ModelRateLimitError):
+				await retrying.ainvoke(MESSAGES)
+		sleep.assert_awaited_once_with(40)  # a second 40s wait would exceed the 60s budget
+		assert llm.ainvoke.await_count == 2  # type: ignore[attr-defined]
+
+		llm = create_named_mock_llm('retry-permanent', ModelProviderError('bad request', status_code=400))
+		with pytest.raises(ModelProviderError):
+			await RetryingChatModel(llm, use_circuit_breaker=False).ainvoke(MESSAGES)
+		assert llm.ainvoke.await_count == 1  # type: ignore[attr-defined]
+
+	async def test_open_circuit_fails_fast_or_falls_back(self):
+		llm = create_named_mock_llm('retry-circuit', ModelProviderError('overloaded', status_code=529))
+		breaker = get_circuit_breaker('mock', 'retry-circuit')
+		for _ in range(breaker.min_calls):
+			breaker.record_failure()
+
+		with pytest.raises(ModelCircuitOpenError) as exc_info:
+			await RetryingChatModel(llm).ainvoke(MESSAGES)
+		assert exc_info.value.retry_after is not None and exc_info.value.retry_after > 0
+		assert llm.ainvoke.await_count == 0  # type: ignore[attr-defined]
+
+		fallback = create_named_mock_llm('fallback-model', [OK])
+		response = await RetryingChatModel(llm, fallback_llm=fallback).ainvoke(MESSAGES)
+		assert response.completion == 'ok'
+		assert fallback.ainvoke.await_count == 1  # type: ignore[attr-defined]
+		assert llm.ainvoke.await_count == 0  # type: ignore[attr-defined]
+
+	async def test_cancelled_trial_reopens_circuit(self):
+		trial_started = asyncio.Event()
+
+		async def hanging_call(messages, output_format=None):
+			trial_started.set()
+			await asyncio.sleep(60)
+
+		llm = create_named_mock_llm('retry-cancelled-trial', hanging_call)
+		breaker = get_circuit_breaker('mock', 'retry-cancelled-trial')
+		breaker.cooldown_seconds = 0
+		for _ in range(breaker.min_calls):
+			breaker.record_failure()
+
+		# the agent's llm_timeout cancels the trial request
+		with pytest.raises(asyncio.TimeoutError):
+			await asyncio.wait_for(RetryingChatModel(llm).ainvoke(MESSAGES), timeout=0.05)
+		assert trial_started.is_set()
+		assert breaker.state == 'open'
+
+		# the next call after the cooldown makes a new trial instead of being refused forever
+		llm.ainvoke.side_effect = [OK]  # type: ignore[attr-defined]
+		assert (await RetryingChatModel(llm).ainvoke(MESSAGES)).completion == 'ok'
+		assert breaker.state == 'closed'
+
+	async def test_streaming_is_retried_only_before_the_first_chunk(self):
+		chunks: list[str] = []
+		attempts = [ModelProviderError('overloaded', status_code=529), ModelProviderError('reset', status_code=502)]
+
+		async def ainvoke_streaming(messages, output_format, on_text):
+			error = attempts.pop(0)
+			if not attempts:
+				on_text('{"text": "par')  # the second attempt fails mid-stream
+			raise error
+
+		llm = create_named_mock_llm('retry-streaming', [OK])
+		llm.ainvoke_streaming = AsyncMock(side_effect=ainvoke_streaming)  # type: ignore[attr-defined]
+		retrying = RetryingChatModel(llm, use_circuit_breaker=False)
+		assert not hasattr(RetryingChatModel(create_named_mock_llm('retry-no-streaming', [OK])), 'ainvoke_streaming')
+
+		with patch('browser_use.llm.retry.asyncio.sleep', new_callable=AsyncMock) as sleep:
+			with pytest.raises(ModelProviderError, match='reset'):
+				await retrying.ainvoke_streaming(MESSAGES, None, chunks.append)  # type: ignore[attr-defined]
+		# retried after the failure before any text, not after a chunk was already handed to on_text
+		assert llm.ainvoke_streaming.await_count == 2  # type: ignore[attr-defined]
+		sleep.assert_awaited_once()
+		assert chunks == ['{"text": "par']
+
+	def test_sdk_retries_disabled_on_a_copy(self):
+		llm = ChatOpenAI(model='gpt-4.1-mini', api_key='test-key', max_retries=10)
+		client = llm.get_client()
+		retrying = RetryingChatModel(llm)
+
+		assert retrying.llm.max_retries == 0  # type: ignore[attr-defined]
+		assert retrying.llm.get_client().max_retries == 0  # type: ignore[attr-defined]
+		# the caller's model and the client it already built keep their SDK retries
+		assert llm.max_retries == 10 and llm.get_client() is not retrying.llm.get_client()
+		assert client.max_retries == 10
+
+	async def test_unparsable_output_is_not_retried_nor_a_provider_failure(self):
+		try:
+			Answer.model_validate_json('{"text": 1}')
+		except ValidationError as e:
+			validation_error = e
+		wrapped = ModelProviderError(str(validation_error), model='retry-parse')
+		wrapped.__cause__ = validation_error
+		policy = RetryPolicy()
+		assert not policy.is_retryable(ModelOutputParseError('Failed to parse structured output'))
+		assert not policy.is_retryable(wrapped)  # a provider wrapping the ValidationError as a generic 502
+
+		llm = create_named_mock_llm(
+			'retry-parse', ModelOutputParseError('Failed to parse structured output', model='retry-parse')
+		)
+		breaker = get_circuit_breaker('mock', 'retry-parse')
+		for _ in range(breaker.min_calls):
+			with pytest.raises(ModelOutputParseError):
+				await RetryingChatModel(llm).ainvoke(MESSAGES, Answer)
+		assert llm.ainvoke.await_count == breaker.min_calls  # type: ignore[attr-defined]
+		assert breaker.state == 'closed'
+
+		# 4xx responses are not provider failures either, 5xx and 429 are
+		assert not is_provider_failure(ModelProviderError('conflict', status_code=409))
+		assert is_provider_failure(ModelProviderError('overloaded', status_code=529))
+		assert is_provider_failure(ModelRateLimitError('slow down'))
+		assert is_provider_failure(TimeoutError())
@@ -0,0 +1,89 @@
+"""Test routing LLM calls between a cheap and a strong model: escalation, de-escalation and the decision records"""
+
+import pytest
+
+from browser_use import Agent
+from browser_use.llm.exceptions import ModelProviderError
+from browser_use.llm.messages import UserMessage
+from browser_use.llm.routing import RoutingChatModel, RoutingSignals
+from tests.ci.conftest import create_named_mock_llm
+
+MESSAGES = [UserMessage(content='Click the search box')]
+
+
+async def run_step(router: RoutingChatModel, step_number: int, **signals) -> str:
+	router.set_step_signals(RoutingSignals(step_number=step_number, **signals))
+	return (await router.ainvoke(MESSAGES)).completion
+
+
+class TestRoutingChatModel:
+	"""Test which model each step is routed to."""
+
+	async def test_escalates_on_failure_and_deescalates_after_successes(self):
+		router = RoutingChatModel(create_named_mock_llm('cheap'), create_named_mock_llm('strong'), deescalate_after_successes=2)
+
+		assert await run_step(router, 1) == 'cheap'
+		assert router.model == 'cheap'
+		assert await run_step(router, 2, consecutive_failures=1) == 'strong'
+		assert router.model == 'strong'  # usage of this call is attributed to the strong model
+		assert await run_step(router, 3) == 'strong'  # 1/2 successful steps
+		assert await run_step(router, 4) == 'cheap'
+
+		assert [d.tier for d in router.decisions] == ['cheap', 'strong', 'strong', 'cheap']
+		assert [d.step_number for d in router.decisions] == [1, 2, 3, 4]
+		assert router.decisions[1].reason == '1 consecutive failures'
+		assert all(d.succeeded and d.latency is not None for d in router.decisions)
+		assert (router.cheap_calls, router.strong_calls) == (2, 2)
+
+	async def test_failure_while_escalated_restarts_recovery(self):
+		router = RoutingChatModel(create_named_mock_llm('cheap'), create_named_mock_llm('strong'), deescalate_after_successes=2)
+
+		await run_step(router, 1, last_step_errors=1)
+		assert await run_step(router, 2) == 'strong'
+		assert await run_step(router, 3, last_step_errors=2) == 'strong'
+		assert router.decisions[-1].reason == '2 actions of the last step failed'
+		assert await run_step(router, 4) == 'strong'
+		assert await run_step(router, 5) == 'cheap'
+
+	async def test_escalates_when_page_stops_changing(self):
+		router = RoutingChatModel(
+			create_named_mock_llm('cheap'), create_named_mock_llm('strong'), escalate_after_unchanged_steps=2
+		)
+
+		assert await run_step(router, 1, page_changed=False) == 'cheap'
+		assert await run_step(router, 2, page_changed=True) == 'cheap'
+		assert await run_step(router, 3, page_changed=False) == 'cheap'
+		assert await run_step(router, 4, page_changed=False) == 'strong'
+		assert router.decisions[-1].reason == 'page unchanged for 2 steps'
+
+	async def test_large_prompt_uses_strong_model_for_that_call_only(self):
+		router = RoutingChatModel(create_named_mock_llm('cheap'), create_named_mock_llm('strong'), max_cheap_prompt_tokens=100)
+
+		large_messages = [UserMessage(content='x' * 2000)]
+		assert (await router.ainvoke(large_messages)).completion == 'strong'
+		assert (await router.ainvoke(MESSAGES)).completion == 'cheap'
+
+	async def test_cheap_failure_is_retried_on_strong(self):
+		error = ModelProviderError('overloaded', status_code=529, model='cheap')
+		strong = create_named_mock_llm('strong')
+		router = RoutingChatModel(create_named_mock_llm('cheap', side_effect=error), strong, deescalate_after_successes=1)
+
+		assert (await router.ainvoke(MESSAGES)).completion == 'strong'
+		assert [(d.tier, d.succeeded) for d in router.decisions] == [('cheap', False), ('strong', True)]
+		assert router.decisions[-1].reason == 'cheap model failed: ModelProviderError'
+
+	async def test_strong_failure_is_raised(self):
+		error = ModelProviderError('overloaded', status_code=529, model='strong')
+		router = RoutingChatModel(create_named_mock_llm('cheap'), create_named_mock_llm('strong', side_effect=error))
+
+		with pytest.raises(ModelProviderError):
+			await run_step(router, 1, consecutive_failures=3)
+		assert router.decisions[-1].succeeded is False
+
+	def test_page_extraction_is_not_routed(self):
+		router = RoutingChatModel(create_named_mock_llm('cheap'), create_named_mock_llm('strong'))
+		assert Agent(task='test', llm=router).settings.page_extraction_llm is router.cheap
+
+		extraction_llm = create_named_mock_llm('extraction')
+		agent = Agent(task='test', llm=router, page_extraction_llm=extraction_llm)
+		assert agent.settings.page_extraction_llm is extraction_llm
@@ -0,0 +1,166 @@
+"""Test streaming structured output and starting the first action before the full response has arrived"""
+
+import asyncio
+import json
+
+from pytest_httpserver import HTTPServer
+
+from browser_use import Agent
+from browser_use.agent.views import ActionResult, AgentOutput
+from browser_use.controller.service import Controller
+from browser_use.llm.messages import UserMessage
+from browser_use.llm.openai.chat import ChatOpenAI
+from browser_use.llm.streaming import IncrementalJSONArrayParser
+from browser_use.llm.views import ChatInvokeCompletion
+from tests.ci.conftest import create_mock_llm
+
+AGENT_OUTPUT_JSON = json.dumps(
+	{
+		'thinking': 'a long "thought" with [brackets] and {braces} and "action": [fake]',
+		'evaluation_previous_goal': 'ok',
+		'memory': 'action',
+		'next_goal': 'search',
+		'action': [
+			{'go_to_url': {'url': 'https://example.com/?q=[1]', 'new_tab': False}},
+			{'input_text': {'index': 3, 'text': 'say \\"hi\\" }'}},
+			{'done': {'text': 'finished', 'success': True}},
+		],
+	}
+)
+
+
+class TestIncrementalJSONArrayParser:
+	"""Test that array items are emitted exactly when their JSON is complete."""
+
+	def test_items_emitted_as_soon_as_complete(self):
+		parser = IncrementalJSONArrayParser('action')
+		expected = json.loads(AGENT_OUTPUT_JSON)['action']
+
+		emitted = []
+		first_item_complete_at = None
+		for position, char in enumerate(AGENT_OUTPUT_JSON):
+			new_items = parser.feed(char)
+			if new_items and first_item_complete_at is None:
+				first_item_complete_at = position
+			emitted.extend(new_items)
+
+		assert emitted == expected
+		assert parser.items == expected
+		# the first action is available right when its closing brace arrives, long before the response ends
+		assert AGENT_OUTPUT_JSON[: first_item_complete_at + 1].endswith('"new_tab": false}}')
+
+	def test_large_chunks_and_no_array(self):
+		parser = IncrementalJSONArrayParser('action')
+		assert parser.feed(AGENT_OUTPUT_JSON[:10]) == []
+		assert len(parser.feed(AGENT_OUTPUT_JSON[10:])) == 3
+
+		other = IncrementalJSONArrayParser('missing')
+		assert other.feed(AGENT_OUTPUT_JSON) == []
+
+
+class TestChatOpenAIStreaming:
+	"""Test ainvoke_streaming() against a local server speaking the OpenAI streaming protocol."""
+
+	async def test_streams_chunks_and_returns_validated_output(self, httpserver: HTTPServer):
+		pieces = [AGENT_OUTPUT_JSON[i : i + 25] for i in range(0, len(AGENT_OUTPUT_JSON), 25)]
+		events = [
+			{
+				'id': 'chatcmpl-test',
+				'object': 'chat.completion.chunk',
+				'created': 0,
+				'model': 'gpt-4o-mini',
+				'choices': [{'index': 0, 'delta': {'content': piece}, 'finish_reason': None}],
+			}
+			for piece in pieces
+		]
+		events.append(
+			{
+				'id': 'chatcmpl-test',
+				'object': 'chat.completion.chunk',
+				'created': 0,
+				'model': 'gpt-4o-mini',
+				'choices': [],
+				'usage': {'prompt_tokens': 10, 'completion_tokens': 20, 'total_tokens': 30},
+			}
+		)
+		body = ''.join(f'data: {json.dumps(event)}\n\n' for event in events) + 'data: [DONE]\n\n'
+		httpserver.expect_request('/v1/chat/completions', method='POST').respond_with_data(body, content_type='text/event-stream')
+
+		llm = ChatOpenAI(model='gpt-4o-mini', api_key='test-key', base_url=httpserver.url_for('/v1'), max_retries=0)
+		agent_output_type = AgentOutput.type_with_custom_actions(Controller().registry.create_action_model())
+
+		received: list[str] = []
+		response = await llm.ainvoke_streaming([UserMessage(content='hi')], agent_output_type, received.append)
+
+		assert ''.join(received) == AGENT_OUTPUT_JSON
+		assert len(response.completion.action) == 3
+		assert response.usage is not None and response.usage.total_tokens == 30
+		assert json.loads(httpserver.log[0][0].get_data())['stream'] is True
+		await llm.aclose()
+
+
+def create_streaming_mock_llm():
+	"""The mock LLM plus an ainvoke_streaming() that streams AGENT_OUTPUT_JSON and records if the first action started early"""
+	llm = create_mock_llm()
+	llm.agent = None
+	llm.first_action_started_before_end = None
+
+	async def ainvoke_streaming(messages, output_format, on_text):
+		for i in range(0, len(AGENT_OUTPUT_JSON), 10):
+			on_text(AGENT_OUTPUT_JSON[i : i + 10])
+			await asyncio.sleep(0)
+		llm.first_action_started_before_end = llm.agent._early_action_task is not None
+		return ChatInvokeCompletion(completion=output_format.model_validate_json(AGENT_OUTPUT_JSON), usage=None)
+
+	llm.ainvoke_streaming = ainvoke_streaming
+	return llm
+
+
+class TestAgentEarlyFirstAction:
+	"""Test that the agent starts the first streamed action early and reuses its result."""
+
+	async def test_first_action_started_while_streaming(self):
+		llm = create_streaming_mock_llm()
+		agent = Agent(task='test', llm=llm, stream_actions=True)
+		llm.agent = agent
+
+		executed = []
+
+		async def fake_act(action):
+			executed.append(action.model_dump(exclude_unset=True))
+			return ActionResult(extracted_content='ok')
+
+		agent._act = fake_act  # type: ignore[method-assign]
+
+		model_output = await agent.get_model_output([UserMessage(content='hi')])
+
+		assert llm.first_action_started_before_end is True
+		assert agent._time_to_first_action is not None
+		assert agent._early_action_task is not None
+		result = await agent._early_action_task
+		assert result.extracted_content == 'ok'
+		assert list(executed[0]) == ['go_to_url']
+		assert len(model_output.action) == 3
+
+	async def test_done_is_never_started_early_and_failures_cancel(self):
+		agent = Agent(task='test', llm=create_streaming_mock_llm(), stream_actions=True)
+
+		agent._on_first_action_streamed({'done': {'text': 'finished', 'success': True}}, 0.0)
+		assert agent._early_action_task is None
+
+		started = asyncio.Event()
+
+		async def slow_act(action):
+			started.set()
+			await asyncio.sleep(10)
+			return ActionResult()
+
+		agent._act = slow_act  # type: ignore[method-assign]
+		agent._on_first_action_streamed({'go_to_url': {'url': 'https://example.com', 'new_tab': False}}, 0.0)
+		task = agent._early_action_task
+		assert task is not None
+		await started.wait()
+
+		await agent._cancel_early_action()
+		assert task.cancelled()
+		assert agent._early_action_task is None
@@ -0,0 +1,141 @@
+"""Test the incrementally rendered agent history and its token-budgeted compaction"""
+
+from unittest.mock import patch
+
+from browser_use.agent.message_manager.service import CHARS_PER_TOKEN, MessageManager
+from browser_use.agent.message_manager.views import HistoryItem
+from browser_use.agent.views import ActionResult, AgentOutput, AgentStepInfo, MessageManagerState
+from browser_use.browser.views import BrowserStateSummary, TabInfo
+from browser_use.dom.views import DOMElementNode
+from browser_use.filesystem.file_system import FileSystem
+from browser_use.llm.base import BaseChatModel
+from browser_use.llm.messages import SystemMessage
+from browser_use.llm.views import ChatInvokeCompletion
+from tests.ci.conftest import create_mock_llm
+
+
+def make_message_manager(tmp_path, **kwargs) -> MessageManager:
+	return MessageManager(
+		task='Collect all product prices',
+		system_message=SystemMessage(content='System message'),
+		state=MessageManagerState(),
+		file_system=FileSystem(tmp_path),
+		**kwargs,
+	)
+
+
+def make_model_output(step_number: int) -> AgentOutput:
+	return AgentOutput(
+		evaluation_previous_goal='Success',
+		memory=f'Collected the price of product {step_number}: ${step_number}.99 ' + 'x' * 200,
+		next_goal=f'Open product {step_number + 1}',
+		action=[],
+	)
+
+
+def add_history_step(message_manager: MessageManager, step_number: int) -> None:
+	message_manager._update_agent_history_description(
+		make_model_output(step_number),
+		[ActionResult(long_term_memory=f'Opened product {step_number}')],
+		AgentStepInfo(step_number, 200),
+	)
+
+
+async def run_agent_step(message_manager: MessageManager, step_number: int, llm: BaseChatModel | None = None) -> None:
+	"""Drive the message manager like Agent._prepare_context does: compact the history, then add the state message"""
+	url = f'https://example.com/product/{step_number}'
+	root = DOMElementNode(tag_name='body', xpath='html/body', attributes={}, children=[], is_visible=True, parent=None)
+	await message_manager.acompact_agent_history(llm)
+	message_manager.add_state_message(
+		browser_state_summary=BrowserStateSummary(
+			element_tree=root, selector_map={}, url=url, title='Product', tabs=[TabInfo(page_id=0, url=url, title='Product')]
+		),
+		model_output=make_model_output(step_number - 1),
+		result=[ActionResult(long_term_memory=f'Opened product {step_number - 1}')],
+		step_info=AgentStepInfo(step_number, 200),
+	)
+
+
+class TestIncrementalHistory:
+	"""Test that history items are only rendered once."""
+
+	def test_items_rendered_once(self, tmp_path):
+		message_manager = make_message_manager(tmp_path, max_history_items=None)
+		for step_number in range(1, 6):
+			add_history_step(message_manager, step_number)
+
+		with patch.object(HistoryItem, 'to_string', autospec=True, side_effect=HistoryItem.to_string) as to_string:
+			first = message_manager.agent_history_description
+			assert to_string.call_count == 6  # nothing was rendered yet
+
+			add_history_step(message_manager, 6)
+			second = message_manager.agent_history_description
+			assert to_string.call_count == 7  # only the new item
+
+		assert second.startswith(first)
+		assert 'Open product 7' in second
+
+	def test_rendering_restarts_when_state_is_replaced(self, tmp_path):
+		message_manager = make_message_manager(tmp_path, max_history_items=None)
+		add_history_step(message_manager, 1)
+		assert 'product 1' in message_manager.agent_history_description
+
+		message_manager.state = MessageManagerState()
+		assert message_manager.agent_history_description == '<sys>\nAgent initialized\n</sys>'
+
+
+class TestHistoryCompaction:
+	"""Test that the history stays within max_history_tokens over long runs."""
+
+	async def test_history_bounded_over_long_runs(self, tmp_path):
+		budget = 2000
+		message_manager = make_message_manager(tmp_path, max_history_items=None, max_history_tokens=budget)
+
+		for step_number in range(1, 151):
+			await run_agent_step(message_manager, step_number)
+			# compaction runs before the step's history item is added, so the budget can be exceeded by that one item
+			assert len(message_manager.agent_history_description) <= budget * CHARS_PER_TOKEN * 1.1
+
+		description = message_manager.agent_history_description
+		state = message_manager.state
+		assert state.compacted_history_items > 100
+		assert len(state.agent_history_items) + state.compacted_history_items == 151
+		assert description.startswith('<sys>\nAgent initialized\n</sys>\n<sys>\n[Summary of')
+		# the deterministic summary keeps one line per compacted step, the most recent steps stay verbatim
+		assert 'step_' in state.compacted_history_summary  # type: ignore[operator]
+		assert 'Open product 150' in description
+
+	async def test_llm_summary_in_agent_step_order(self, tmp_path):
+		budget = 2000
+		llm = create_mock_llm()
+		llm.ainvoke.side_effect = None  # type: ignore[attr-defined]
+		llm.ainvoke.return_value = ChatInvokeCompletion(completion='Prices of the first products collected.', usage=None)  # type: ignore[attr-defined]
+		message_manager = make_message_manager(tmp_path, max_history_items=None, max_history_tokens=budget)
+
+		for step_number in range(1, 6):
+			await run_agent_step(message_manager, step_number, llm)
+		assert llm.ainvoke.await_count == 0  # type: ignore[attr-defined]  # under budget: no LLM call
+
+		message_manager.add_new_task('Also collect the shipping costs')
+		for step_number in range(6, 41):
+			await run_agent_step(message_manager, step_number, llm)
+			assert len(message_manager.agent_history_description) <= budget * CHARS_PER_TOKEN * 1.1
+
+		# every compaction was written by the LLM, the deterministic summary never ran first
+		assert llm.ainvoke.await_count >= 1  # type: ignore[attr-defined]
+		assert message_manager.state.compacted_history_items > 0
+		assert message_manager.state.compacted_history_summary == 'Prices of the first products collected.'
+		assert 'Prices of the first products collected.' in message_manager.agent_history_description
+
+	def test_summary_bound_keeps_whole_lines(self, tmp_path):
+		message_manager = make_message_manager(tmp_path, max_history_tokens=100)
+		lines = [f'step_{step_number}: Collected the price of product {step_number}' for step_number in range(1, 31)]
+
+		bounded = message_manager._bound_history_summary('\n'.join(lines))
+		assert len(bounded) <= 100 * CHARS_PER_TOKEN // 4
+		marker, *kept_lines = bounded.split('\n')
+		assert kept_lines == lines[-len(kept_lines) :]
+		assert marker == f'[... {30 - len(kept_lines)} older summary lines omitted]'
+
+		# a single line that is too long is cut at the end
+		assert message_manager._bound_history_summary('x' * 500) == 'x' * 97 + '...'
@@ -0,0 +1,86 @@
+"""Test that provider message serializations are memoized on the messages and only new messages are serialized"""
+
+import base64
+from unittest.mock import patch
+
+from browser_use.llm.anthropic.serializer import AnthropicMessageSerializer
+from browser_use.llm.google.serializer import GoogleMessageSerializer
+from browser_use.llm.messages import (
+	AssistantMessage,
+	BaseMessage,
+	ContentPartImageParam,
+	ContentPartTextParam,
+	ImageURL,
+	SystemMessage,
+	UserMessage,
+)
+from browser_use.llm.openai.serializer import OpenAIMessageSerializer
+
+IMAGE_URL = 'data:image/png;base64,' + base64.b64encode(b'fake png bytes').decode()
+
+
+def make_messages() -> list[BaseMessage]:
+	return [
+		SystemMessage(content='System prompt', cache=True),
+		UserMessage(content='Task', cache=True),
+		AssistantMessage(content='Clicked the button'),
+		UserMessage(
+			content=[ContentPartTextParam(text='Current state'), ContentPartImageParam(image_url=ImageURL(url=IMAGE_URL))],
+			cache=True,
+		),
+	]
+
+
+class TestMessageSerializationCache:
+	"""Test the per-message memoization and when it is invalidated."""
+
+	def test_only_new_messages_are_serialized(self):
+		messages = make_messages()
+		first = OpenAIMessageSerializer.serialize_messages(messages)
+
+		with patch.object(OpenAIMessageSerializer, 'serialize', wraps=OpenAIMessageSerializer.serialize) as serialize:
+			messages.append(UserMessage(content='Next state'))
+			second = OpenAIMessageSerializer.serialize_messages(messages)
+			assert serialize.call_count == 1
+
+		assert second[:4] == first
+		assert second[:4] == [OpenAIMessageSerializer.serialize(m) for m in make_messages()]
+
+	def test_assignment_invalidates_and_copies_start_empty(self):
+		message = UserMessage(content='Task')
+		assert OpenAIMessageSerializer.serialize_messages([message])[0]['content'] == 'Task'
+
+		message.content = 'Changed task'
+		assert OpenAIMessageSerializer.serialize_messages([message])[0]['content'] == 'Changed task'
+
+		copy = message.model_copy(update={'content': 'Copied task'})
+		assert OpenAIMessageSerializer.serialize_messages([copy])[0]['content'] == 'Copied task'
+		assert OpenAIMessageSerializer.serialize_messages([message])[0]['content'] == 'Changed task'
+		# the cache is not part of the message's value
+		assert message == UserMessage(content='Changed task')
+		assert message.model_dump() == {'role': 'user', 'cache': False, 'content': 'Changed task', 'name': None}
+
+	def test_anthropic_keeps_only_last_cache_breakpoint_without_copying(self):
+		messages = make_messages()
+
+		serialized, system = AnthropicMessageSerializer.serialize_messages(messages)
+		assert isinstance(system, list) and system[0].get('cache_control')
+		assert serialized[0]['content'] == 'Task'  # cache flag cleaned, only the last cached message keeps it
+		assert isinstance(serialized[2]['content'], list) and serialized[2]['content'][0].get('cache_control')
+		assert messages[1].cache  # the input messages are left untouched
+
+		# the previously last cached message loses its breakpoint once a newer cached message follows
+		messages.append(UserMessage(content='Next state', cache=True))
+		serialized, _ = AnthropicMessageSerializer.serialize_messages(messages)
+		assert not any(block.get('cache_control') for block in serialized[2]['content'])  # type: ignore
+		assert serialized[3]['content'][0].get('cache_control')  # type: ignore
+
+	def test_google_decodes_images_once(self):
+		messages = make_messages()
+		with patch('browser_use.llm.google.serializer.base64.b64decode', wraps=base64.b64decode) as b64decode:
+			contents, system = GoogleMessageSerializer.serialize_messages(messages)
+			GoogleMessageSerializer.serialize_messages(messages)
+			assert b64decode.call_count == 1
+
+		assert system == 'System prompt'
+		assert [content.role for content in contents] == ['user', 'model', 'user']  # type: ignore
@@ -0,0 +1,98 @@
+"""Test the cache friendly prompt layout, the Anthropic cache breakpoints and the per-step cached token counts"""
+
+from browser_use.agent.message_manager.service import MessageManager
+from browser_use.agent.views import ActionResult, AgentOutput, AgentStepInfo, MessageManagerState, StepMetadata
+from browser_use.browser.views import BrowserStateSummary, TabInfo
+from browser_use.dom.views import DOMElementNode
+from browser_use.filesystem.file_system import FileSystem
+from browser_use.llm.anthropic.serializer import AnthropicMessageSerializer
+from browser_use.llm.messages import ContentPartTextParam, SystemMessage, UserMessage
+
+
+def make_browser_state(url: str) -> BrowserStateSummary:
+	root = DOMElementNode(tag_name='body', xpath='html/body', attributes={}, children=[], is_visible=True, parent=None)
+	return BrowserStateSummary(
+		element_tree=root, selector_map={}, url=url, title='Example', tabs=[TabInfo(page_id=0, url=url, title='Example')]
+	)
+
+
+def make_message_manager(tmp_path, cache_friendly_prompt: bool) -> MessageManager:
+	return MessageManager(
+		task='Find the price of the cheapest item',
+		system_message=SystemMessage(content='System message', cache=True),
+		state=MessageManagerState(),
+		file_system=FileSystem(tmp_path),
+		cache_friendly_prompt=cache_friendly_prompt,
+	)
+
+
+def add_step(message_manager: MessageManager, step_number: int) -> None:
+	model_output = AgentOutput(
+		evaluation_previous_goal='Success', memory=f'Visited page {step_number}', next_goal='Open the next page', action=[]
+	)
+	message_manager.add_state_message(
+		browser_state_summary=make_browser_state(f'https://example.com/{step_number}'),
+		model_output=model_output if step_number > 0 else None,
+		result=[ActionResult(long_term_memory=f'Clicked item {step_number}')] if step_number > 0 else None,
+		step_info=AgentStepInfo(step_number=step_number, max_steps=10),
+	)
+
+
+def get_texts(message) -> list[str]:
+	assert isinstance(message.content, list)
+	return [part.text for part in message.content if isinstance(part, ContentPartTextParam)]
+
+
+class TestCacheFriendlyPromptLayout:
+	"""Test that the stable part of the prompt stays a byte-identical prefix across steps."""
+
+	def test_stable_prefix_only_grows(self, tmp_path):
+		message_manager = make_message_manager(tmp_path, cache_friendly_prompt=True)
+
+		add_step(message_manager, 0)
+		system, stable, state = message_manager.get_messages()
+		assert stable.cache and not state.cache
+		assert '<user_request>\nFind the price of the cheapest item\n</user_request>' in get_texts(stable)[0]
+		# everything that changes every step lives in the second message
+		assert isinstance(state.content, str)
+		assert state.content.startswith('</agent_history>\n<agent_state>')
+		assert '<step_info>' in state.content and 'https://example.com/0' in state.content
+		assert '<user_request>' not in state.content
+
+		add_step(message_manager, 1)
+		add_step(message_manager, 2)
+		_, next_stable, _ = message_manager.get_messages()
+		next_texts = get_texts(next_stable)
+		assert next_texts[: len(get_texts(stable))] == get_texts(stable)
+		assert len(next_texts) == len(get_texts(stable)) + 2
+		assert 'Clicked item 2' in next_texts[-1]
+
+	def test_default_layout_unchanged(self, tmp_path):
+		message_manager = make_message_manager(tmp_path, cache_friendly_prompt=False)
+
+		add_step(message_manager, 0)
+		system, state = message_manager.get_messages()
+		assert state.cache
+		assert isinstance(state.content, str)
+		assert state.content.startswith(
+			'<agent_history>\n<sys>\nAgent initialized\n</sys>\n</agent_history>\n<agent_state>\n<user_request>'
+		)
+
+
+class TestAnthropicCacheBreakpoints:
+	"""Test that a cached message only gets one cache breakpoint, however many parts it has."""
+
+	def test_only_last_text_part_gets_cache_control(self):
+		message = UserMessage(content=[ContentPartTextParam(text=f'part {i}') for i in range(10)], cache=True)
+
+		blocks = AnthropicMessageSerializer.serialize(message)['content']
+		assert [block.get('cache_control') is not None for block in blocks] == [False] * 9 + [True]  # type: ignore
+
+		uncached = AnthropicMessageSerializer.serialize(UserMessage(content=message.content, cache=False))['content']
+		assert not any(block.get('cache_control') for block in uncached)  # type: ignore
+
+
+def test_step_metadata_prompt_cache_hit_rate():
+	metadata = StepMetadata(step_start_time=0, step_end_time=1, step_number=1, prompt_tokens=4000, prompt_cached_tokens=3000)
+	assert metadata.prompt_cache_hit_rate == 0.75
+	assert StepMetadata(step_start_time=0, step_end_time=1, step_number=1).prompt_cache_hit_rate is None
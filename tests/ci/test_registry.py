@@ -11,26 +11,34 @@ Tests cover:
 """
 
 import asyncio
+import json
 import logging
+from typing import Literal
+from unittest.mock import patch
 
 import pytest
 from pydantic import Field
 from pytest_httpserver import HTTPServer
 from pytest_httpserver.httpserver import HandlerType
 
-from browser_use.agent.views import ActionResult
+from browser_use.agent.views import ActionResult, AgentSettings
 from browser_use.browser import BrowserSession
 from browser_use.browser.profile import BrowserProfile
 from browser_use.browser.types import Page
+from browser_use.browser.views import BrowserStateSummary, TabInfo
 from browser_use.controller.registry.service import Registry
 from browser_use.controller.registry.views import ActionModel as BaseActionModel
+from browser_use.controller.registry.views import ActionSubsetContext, ActionSubsetPolicy
+from browser_use.controller.service import Controller
 from browser_use.controller.views import (
 	ClickElementAction,
 	InputTextAction,
 	NoParamsAction,
 	SearchGoogleAction,
 )
+from browser_use.dom.views import DOMElementNode
 from browser_use.llm.messages import UserMessage
+from browser_use.llm.schema import SchemaOptimizer
 from tests.ci.conftest import create_mock_llm
 
 # Configure logging
@@ -1226,3 +1234,177 @@ class TestParamsModelArgsAndKwargs:
 			# logger.info(f'Success with our fix! Result: {result3}')
 		except Exception as e:
 			logger.error(f'Error with our manual test: {str(e)}')
+
+
+class TestActionModelCache:
+	"""Test that generated action models are built once per distinct action set"""
+
+	def test_same_action_set_returns_same_model(self, registry):
+		class FakePage:
+			def __init__(self, url: str):
+				self.url = url
+
+		@registry.action('Always available')
+		def common_action():
+			return ActionResult()
+
+		@registry.action('Only on example.com', domains=['example.com'])
+		def example_action():
+			return ActionResult()
+
+		on_example = registry.create_action_model(page=FakePage('https://example.com/a'))
+		assert registry.create_action_model(page=FakePage('https://example.com/b')) is on_example
+		assert 'example_action' in str(on_example.model_json_schema())
+
+		# a different filtered action set gets its own model
+		elsewhere = registry.create_action_model(page=FakePage('https://other.com'))
+		assert elsewhere is not on_example
+		assert elsewhere is registry.create_action_model(page=FakePage('https://another.com'))
+		assert registry.create_action_model(include_actions=['common_action']) is not on_example
+
+	def test_reregistered_action_invalidates_cached_model(self, registry):
+		@registry.action('First version')
+		def my_action():
+			return ActionResult()
+
+		first_model = registry.create_action_model()
+
+		@registry.action('Second version')
+		def my_action():  # noqa: F811
+			return ActionResult()
+
+		second_model = registry.create_action_model()
+		assert second_model is not first_model
+		assert second_model.model_fields['my_action'].description == 'Second version'
+
+
+class TestDispatchPlan:
+	"""Test the per-action dispatch plan computed at registration time"""
+
+	def test_plan_contents(self, registry):
+		@registry.action('Types text')
+		async def type_text(text: str, count: int, browser_session: BrowserSession, page: Page):
+			return ActionResult()
+
+		@registry.action('Scrolls', param_model=ComplexParams)
+		async def scroll(params: ComplexParams, file_system=None):
+			return ActionResult()
+
+		@registry.action('Switches tab')
+		async def switch(page_id: int, mode: Literal['fast', 'slow'] = 'fast', flag: bool | None = None):
+			return ActionResult()
+
+		plan = registry.registry.actions['type_text'].dispatch_plan
+		assert plan.special_param_names == {'browser_session', 'page'}
+		assert plan.needs_page
+		assert plan.secret_param_fields == {'text'}
+
+		plan = registry.registry.actions['scroll'].dispatch_plan
+		assert plan.special_param_names == {'file_system'}
+		assert not plan.needs_page
+		assert plan.secret_param_fields == {'text'}
+
+		plan = registry.registry.actions['switch'].dispatch_plan
+		assert plan.special_param_names == frozenset()
+		assert plan.secret_param_fields == frozenset()
+
+	async def test_secret_replacement_only_when_placeholder_present(self, registry):
+		@registry.action('Types text')
+		async def type_text(text: str):
+			return ActionResult(extracted_content=text)
+
+		@registry.action('Switches tab')
+		async def switch(page_id: int):
+			return ActionResult(extracted_content=str(page_id))
+
+		sensitive_data = {'password': 'hunter2'}
+		with patch.object(
+			Registry, '_replace_sensitive_data', autospec=True, side_effect=Registry._replace_sensitive_data
+		) as replace:
+			await registry.execute_action('switch', {'page_id': 1}, sensitive_data=sensitive_data)
+			await registry.execute_action('type_text', {'text': 'hello'}, sensitive_data=sensitive_data)
+			assert replace.call_count == 0
+
+			result = await registry.execute_action(
+				'type_text', {'text': '<secret>password</secret>'}, sensitive_data=sensitive_data
+			)
+			assert replace.call_count == 1
+			assert result.extracted_content == 'hunter2'
+
+	async def test_plan_built_lazily_for_manually_registered_actions(self, registry):
+		@registry.action('Types text')
+		async def type_text(text: str, available_file_paths: list[str]):
+			return ActionResult(extracted_content=f'{text} {available_file_paths}')
+
+		action = registry.registry.actions['type_text']
+		action.dispatch_plan = None
+
+		result = await registry.execute_action('type_text', {'text': 'hi'}, available_file_paths=['a.txt'])
+		assert result.extracted_content == "hi ['a.txt']"
+		assert action.dispatch_plan is not None
+		assert action.dispatch_plan.special_param_names == {'available_file_paths'}
+
+
+def make_subset_context(
+	elements: list[tuple[str, dict[str, str]]] | None = None, tab_count: int = 1, available_file_paths: list[str] | None = None
+) -> ActionSubsetContext:
+	"""Browser state with one interactive element per (tag_name, attributes) pair"""
+	root = DOMElementNode(tag_name='body', xpath='html/body', attributes={}, children=[], is_visible=True, parent=None)
+	selector_map = {
+		index: DOMElementNode(
+			tag_name=tag_name, xpath=f'html/body/{tag_name}', attributes=attributes, children=[], is_visible=True, parent=root
+		)
+		for index, (tag_name, attributes) in enumerate(elements or [])
+	}
+	tabs = [TabInfo(page_id=i, url=f'https://example.com/{i}', title='Example') for i in range(tab_count)]
+	browser_state = BrowserStateSummary(
+		element_tree=root, selector_map=selector_map, url='https://example.com/0', title='Example', tabs=tabs
+	)
+	return ActionSubsetContext(browser_state=browser_state, available_file_paths=available_file_paths or [])
+
+
+class TestActionSubsetPolicy:
+	"""Test the per-step rules that narrow the action schema"""
+
+	def test_default_rules(self):
+		policy = ActionSubsetPolicy()
+
+		plain_page = make_subset_context([('a', {'href': '/next'}), ('input', {'type': 'text'})])
+		assert policy.get_excluded_actions(plain_page) == {
+			'get_dropdown_options',
+			'select_dropdown_option',
+			'switch_tab',
+			'close_tab',
+			'upload_file',
+		}
+
+		assert 'select_dropdown_option' not in policy.get_excluded_actions(make_subset_context([('select', {})]))
+		assert 'get_dropdown_options' not in policy.get_excluded_actions(make_subset_context([('div', {'role': 'listbox'})]))
+		assert 'switch_tab' not in policy.get_excluded_actions(make_subset_context(tab_count=2))
+		assert 'upload_file' not in policy.get_excluded_actions(make_subset_context(available_file_paths=['cv.pdf']))
+
+	def test_broken_rule_keeps_action(self):
+		def broken_rule(context: ActionSubsetContext) -> bool:
+			raise RuntimeError('boom')
+
+		policy = ActionSubsetPolicy(rules={'my_action': broken_rule, 'close_tab': lambda context: False})
+		assert policy.get_excluded_actions(make_subset_context()) == {'close_tab'}
+
+	def test_excluded_actions_shrink_schema(self):
+		registry = Controller().registry
+		full_model = registry.create_action_model()
+		excluded = ActionSubsetPolicy().get_excluded_actions(make_subset_context())
+
+		subset_model = registry.create_action_model(exclude_actions=excluded)
+		assert registry.create_action_model(exclude_actions=excluded) is subset_model
+		schema = SchemaOptimizer.create_optimized_json_schema_str(subset_model)
+		assert 'select_dropdown_option' not in schema and 'upload_file' not in schema
+		assert 'click_element_by_index' in schema
+		assert SchemaOptimizer.estimate_tokens(subset_model) < SchemaOptimizer.estimate_tokens(full_model)
+
+	def test_settings_with_policy_serialize(self):
+		settings = AgentSettings(action_subset_policy=ActionSubsetPolicy(rules={'close_tab': lambda context: True}))
+
+		assert 'action_subset_policy' not in json.loads(json.dumps(settings.model_dump()))
+		assert 'action_subset_policy' not in json.loads(settings.model_dump_json())
+		assert settings.action_subset_policy is not None
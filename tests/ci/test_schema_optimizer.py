@@ -3,6 +3,9 @@ Tests for the SchemaOptimizer to ensure it correctly processes and
 optimizes the schemas for agent actions without losing information.
 """
 
+import json
+from unittest.mock import patch
+
 from pydantic import BaseModel
 
 from browser_use.agent.views import AgentOutput
@@ -64,3 +67,39 @@ def test_optimizer_preserves_all_fields_in_structured_done_action():
 		f'Missing from optimized: {original_fields - optimized_fields}\n'
 		f'Unexpected in optimized: {optimized_fields - original_fields}'
 	)
+
+
+def test_optimized_schema_is_cached_per_model_and_safe_to_modify():
+	"""The schema is generated once per model class, but every caller gets its own copy to modify."""
+	controller = Controller(output_model=ProductInfo)
+	agent_output_model = AgentOutput.type_with_custom_actions(controller.registry.create_action_model())
+
+	first = SchemaOptimizer.create_optimized_json_schema(agent_output_model)
+	first['properties'].clear()  # e.g. providers popping keys they don't support
+	second = SchemaOptimizer.create_optimized_json_schema(agent_output_model)
+
+	assert second['properties'], 'modifying a returned schema must not corrupt the cached one'
+	assert second == SchemaOptimizer._build_optimized_json_schema(agent_output_model)
+	assert SchemaOptimizer.create_optimized_json_schema_str(
+		agent_output_model
+	) is SchemaOptimizer.create_optimized_json_schema_str(agent_output_model)
+	assert json.loads(SchemaOptimizer.create_optimized_json_schema_str(agent_output_model)) == second
+
+	# a different model class gets its own schema
+	assert SchemaOptimizer.create_optimized_json_schema(ProductInfo) != second
+
+
+def test_optimized_schema_built_once_per_model():
+	"""Repeated calls reuse the cached schema instead of regenerating it."""
+
+	class SearchResult(BaseModel):
+		url: str
+		snippet: str
+
+	build = SchemaOptimizer._build_optimized_json_schema
+	with patch.object(SchemaOptimizer, '_build_optimized_json_schema', side_effect=build) as build_mock:
+		first = SchemaOptimizer.create_optimized_json_schema_str(SearchResult)
+		for _ in range(20):
+			assert SchemaOptimizer.create_optimized_json_schema_str(SearchResult) is first
+			SchemaOptimizer.create_optimized_json_schema(SearchResult)
+	assert build_mock.call_count == 1
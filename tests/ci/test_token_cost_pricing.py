@@ -0,0 +1,168 @@
+"""Test that TokenCost prices models offline from the bundled snapshot and the local pricing file"""
+
+import asyncio
+import json
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from browser_use.llm.views import ChatInvokeUsage
+from browser_use.tokens.service import TokenCost
+
+
+def make_usage(prompt_tokens: int, completion_tokens: int) -> ChatInvokeUsage:
+	return ChatInvokeUsage(
+		prompt_tokens=prompt_tokens,
+		prompt_cached_tokens=None,
+		prompt_cache_creation_tokens=None,
+		prompt_image_tokens=None,
+		completion_tokens=completion_tokens,
+		total_tokens=prompt_tokens + completion_tokens,
+	)
+
+
+class TestOfflinePricing:
+	"""Test that pricing loads without touching the network unless the refresh is opted into."""
+
+	async def test_bundled_pricing_without_network(self, monkeypatch):
+		monkeypatch.delenv('BROWSER_USE_PRICING_FILE', raising=False)
+		monkeypatch.delenv('BROWSER_USE_REFRESH_PRICING', raising=False)
+		token_cost = TokenCost(include_cost=True)
+
+		with patch.object(TokenCost, '_fetch_and_cache_pricing_data') as fetch:
+			pricing = await token_cost.get_model_pricing('gpt-4.1-mini')
+			fetch.assert_not_called()
+
+		assert pricing is not None
+		assert pricing.input_cost_per_token and pricing.output_cost_per_token
+		cost = await token_cost.calculate_cost('gpt-4.1-mini', make_usage(1_000_000, 1_000_000))
+		assert cost is not None
+		assert cost.total_cost == pytest.approx(1_000_000 * (pricing.input_cost_per_token + pricing.output_cost_per_token))
+
+	async def test_local_pricing_file_overrides_bundled(self, tmp_path):
+		pricing_file = tmp_path / 'pricing.json'
+		pricing_file.write_text(
+			json.dumps(
+				{
+					'gpt-4.1-mini': {'input_cost_per_token': 1e-3},
+					'my-finetuned-model': {'input_cost_per_token': 2e-6, 'output_cost_per_token': 4e-6},
+				}
+			)
+		)
+		token_cost = TokenCost(include_cost=True, pricing_file=pricing_file, refresh_pricing=False)
+		bundled = json.loads(TokenCost.BUNDLED_PRICING_FILE.read_text())
+
+		overridden = await token_cost.get_model_pricing('gpt-4.1-mini')
+		assert overridden is not None
+		assert overridden.input_cost_per_token == 1e-3
+		# prices the local file does not set keep their bundled value
+		assert overridden.output_cost_per_token == bundled['gpt-4.1-mini']['output_cost_per_token']
+
+		custom = await token_cost.get_model_pricing('my-finetuned-model')
+		assert custom is not None and custom.output_cost_per_token == 4e-6
+
+	async def test_invalid_local_pricing_file_is_ignored(self, tmp_path):
+		pricing_file = tmp_path / 'pricing.json'
+		pricing_file.write_text('not json')
+		token_cost = TokenCost(include_cost=True, pricing_file=pricing_file, refresh_pricing=False)
+
+		assert await token_cost.get_model_pricing('gpt-4.1-mini') is not None
+
+
+class TestModelNameLookup:
+	"""Test that the model ids used across the examples find their pricing without a remote refresh."""
+
+	@pytest.mark.parametrize(
+		'model_name, pricing_key',
+		[
+			('gemini-2.0-flash-exp', 'gemini-2.0-flash-exp'),
+			('claude-3-5-sonnet-20240620', 'claude-3-5-sonnet-20240620'),
+			('claude-3-5-haiku-latest', 'claude-3-5-haiku-latest'),
+			('anthropic.claude-3-5-sonnet-20240620-v1:0', 'claude-3-5-sonnet-20240620'),
+			('us.anthropic.claude-sonnet-4-20250514-v1:0', 'claude-sonnet-4-20250514'),
+			('us.meta.llama4-maverick-17b-instruct-v1:0', 'meta.llama4-maverick-17b-instruct-v1:0'),
+			('openai/gpt-4o-mini', 'gpt-4o-mini'),
+			('x-ai/grok-4', 'xai/grok-4'),
+			('gpt-4o-2024-05-13', 'gpt-4o-2024-05-13'),  # priced differently from gpt-4o
+		],
+	)
+	async def test_example_models_are_priced(self, model_name, pricing_key):
+		token_cost = TokenCost(include_cost=True, refresh_pricing=False)
+		bundled = json.loads(TokenCost.BUNDLED_PRICING_FILE.read_text())
+
+		pricing = await token_cost.get_model_pricing(model_name)
+		assert pricing is not None
+		assert pricing.model == model_name
+		assert pricing.input_cost_per_token == bundled[pricing_key]['input_cost_per_token']
+
+	async def test_unknown_snapshot_priced_as_alias_with_warning(self, caplog):
+		token_cost = TokenCost(include_cost=True, refresh_pricing=False)
+		bundled = json.loads(TokenCost.BUNDLED_PRICING_FILE.read_text())
+
+		with caplog.at_level(logging.WARNING, logger='browser_use.tokens.service'):
+			pricing = await token_cost.get_model_pricing('gpt-4.1-2099-01-01')
+			await token_cost.get_model_pricing('gpt-4.1-2099-01-01')
+		assert pricing is not None
+		assert pricing.input_cost_per_token == bundled['gpt-4.1']['input_cost_per_token']
+		assert [record.message for record in caplog.records].count(
+			'💲 No pricing data for snapshot gpt-4.1-2099-01-01, pricing it as gpt-4.1 which may not match its actual price. '
+			'Add it to a local pricing file (BROWSER_USE_PRICING_FILE) or set BROWSER_USE_REFRESH_PRICING=true'
+		) == 1
+
+	async def test_unpriced_model_warns_once(self, caplog):
+		token_cost = TokenCost(include_cost=True, refresh_pricing=False)
+
+		with caplog.at_level(logging.WARNING, logger='browser_use.tokens.service'):
+			assert await token_cost.calculate_cost('my-local-model', make_usage(100, 10)) is None
+			assert await token_cost.calculate_cost('my-local-model', make_usage(100, 10)) is None
+		assert [record.message for record in caplog.records].count(
+			'💲 No pricing data for model my-local-model, its cost is not counted. '
+			'Add it to a local pricing file (BROWSER_USE_PRICING_FILE) or set BROWSER_USE_REFRESH_PRICING=true'
+		) == 1
+
+
+class TestBackgroundRefresh:
+	"""Test that the opt-in remote refresh never blocks loading the pricing."""
+
+	async def test_refresh_runs_in_background(self, tmp_path):
+		token_cost = TokenCost(include_cost=True, refresh_pricing=True)
+		token_cost._cache_dir = tmp_path
+		fetch_started = asyncio.Event()
+		release_fetch = asyncio.Event()
+
+		class FakeResponse:
+			def raise_for_status(self) -> None:
+				pass
+
+			def json(self):
+				return {'gpt-4.1-mini': {'input_cost_per_token': 5e-7, 'output_cost_per_token': 2e-6}}
+
+		async def slow_get(*args, **kwargs):
+			fetch_started.set()
+			await release_fetch.wait()
+			return FakeResponse()
+
+		with patch('httpx.AsyncClient.get', side_effect=slow_get):
+			# the pricing is available while the fetch is still in flight
+			pricing = await asyncio.wait_for(token_cost.get_model_pricing('gpt-4.1-mini'), timeout=1)
+			assert pricing is not None and pricing.input_cost_per_token == 4e-7
+			await asyncio.wait_for(fetch_started.wait(), timeout=1)
+
+			release_fetch.set()
+			assert token_cost._refresh_task is not None
+			await token_cost._refresh_task
+
+		refreshed = await token_cost.get_model_pricing('gpt-4.1-mini')
+		assert refreshed is not None and refreshed.input_cost_per_token == 5e-7
+		assert len(list(tmp_path.glob('pricing_*.json'))) == 1
+		# models missing from the fetched table keep their bundled pricing
+		assert await token_cost.get_model_pricing('claude-sonnet-4-20250514') is not None
+
+		# the next service in this process loads the cached fetch instead of fetching again
+		next_token_cost = TokenCost(include_cost=True, refresh_pricing=True)
+		next_token_cost._cache_dir = tmp_path
+		with patch('httpx.AsyncClient.get') as get:
+			cached = await next_token_cost.get_model_pricing('gpt-4.1-mini')
+			get.assert_not_called()
+		assert cached is not None and cached.input_cost_per_token == 5e-7
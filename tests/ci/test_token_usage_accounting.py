@@ -0,0 +1,116 @@
+"""Test the bounded token usage history, the running per-model totals and per-task snapshots"""
+
+import logging
+from datetime import datetime, timedelta
+
+import pytest
+
+from browser_use.llm.views import ChatInvokeUsage
+from browser_use.tokens.service import TokenCost
+
+
+def make_usage(prompt_tokens: int, completion_tokens: int, cached_tokens: int | None = None) -> ChatInvokeUsage:
+	return ChatInvokeUsage(
+		prompt_tokens=prompt_tokens,
+		prompt_cached_tokens=cached_tokens,
+		prompt_cache_creation_tokens=None,
+		prompt_image_tokens=None,
+		completion_tokens=completion_tokens,
+		total_tokens=prompt_tokens + completion_tokens,
+	)
+
+
+class TestRunningTotals:
+	"""Test that summaries come from the totals, not from the raw history."""
+
+	async def test_history_bounded_and_totals_exact(self):
+		token_cost = TokenCost(max_history_entries=10)
+		for _ in range(1000):
+			token_cost.add_usage('gpt-4.1-mini', make_usage(100, 10, cached_tokens=50))
+		token_cost.add_usage('claude-sonnet-4-20250514', make_usage(200, 20))
+
+		assert len(token_cost.usage_history) == 10
+		summary = await token_cost.get_usage_summary()
+		assert summary.entry_count == 1001
+		assert summary.total_prompt_tokens == 100_200
+		assert summary.total_prompt_cached_tokens == 50_000
+		assert summary.total_completion_tokens == 10_020
+		assert summary.by_model['gpt-4.1-mini'].invocations == 1000
+		assert summary.by_model['gpt-4.1-mini'].average_tokens_per_invocation == 110
+
+		tokens = token_cost.get_usage_tokens_for_model('gpt-4.1-mini')
+		assert (tokens.prompt_tokens, tokens.prompt_cached_tokens, tokens.total_tokens) == (100_000, 50_000, 110_000)
+
+		only_claude = await token_cost.get_usage_summary(model='claude-sonnet-4-20250514')
+		assert only_claude.entry_count == 1 and only_claude.total_tokens == 220
+
+	async def test_cost_matches_per_entry_cost(self):
+		token_cost = TokenCost(include_cost=True, refresh_pricing=False)
+		usages = [make_usage(1000, 100, cached_tokens=400), make_usage(3000, 50), make_usage(2000, 500, cached_tokens=1500)]
+		for usage in usages:
+			token_cost.add_usage('gpt-4.1-mini', usage)
+
+		summary = await token_cost.get_usage_summary()
+		costs = [await token_cost.calculate_cost('gpt-4.1-mini', usage) for usage in usages]
+		assert summary.by_model['gpt-4.1-mini'].cost == pytest.approx(sum(c.total_cost for c in costs if c))
+		assert summary.total_completion_cost == pytest.approx(sum(c.completion_cost for c in costs if c))
+
+	async def test_since_datetime_uses_recent_entries(self):
+		token_cost = TokenCost()
+		token_cost.add_usage('gpt-4.1-mini', make_usage(100, 10)).timestamp = datetime.now() - timedelta(minutes=5)
+		since = datetime.now() - timedelta(minutes=1)
+		token_cost.add_usage('gpt-4.1-mini', make_usage(300, 30))
+
+		summary = await token_cost.get_usage_summary(since=since)
+		assert summary.entry_count == 1 and summary.total_prompt_tokens == 300
+
+	async def test_since_older_than_history_warns(self, caplog):
+		token_cost = TokenCost(max_history_entries=2)
+		since = datetime.now() - timedelta(minutes=1)
+		for _ in range(3):
+			token_cost.add_usage('gpt-4.1-mini', make_usage(100, 10))
+		# still a list, so slicing keeps working
+		assert token_cost.usage_history[-2:] == token_cost.usage_history
+
+		with caplog.at_level(logging.WARNING, logger='browser_use.tokens.service'):
+			summary = await token_cost.get_usage_summary(since=since)
+			assert summary.entry_count == 2
+			assert any('is incomplete' in record.message for record in caplog.records)
+
+			caplog.clear()
+			await token_cost.get_usage_summary(since=datetime.now())
+			assert not caplog.records
+
+
+class TestSnapshots:
+	"""Test per-task accounting on a TokenCost shared by many tasks."""
+
+	async def test_usage_since_snapshot(self):
+		token_cost = TokenCost()
+		token_cost.add_usage('gpt-4.1-mini', make_usage(100, 10))
+
+		snapshot = token_cost.snapshot()
+		token_cost.add_usage('gpt-4.1-mini', make_usage(300, 30))
+		token_cost.add_usage('gpt-4.1', make_usage(500, 50))
+
+		task_summary = await token_cost.get_usage_summary(since=snapshot)
+		assert task_summary.entry_count == 2
+		assert task_summary.by_model['gpt-4.1-mini'].prompt_tokens == 300
+		assert task_summary.by_model['gpt-4.1'].prompt_tokens == 500
+		# the snapshot is a copy, later usage does not change it
+		assert snapshot.by_model['gpt-4.1-mini'].prompt_tokens == 100
+
+		unchanged = await token_cost.get_usage_summary(since=token_cost.snapshot())
+		assert unchanged.entry_count == 0 and unchanged.by_model == {}
+
+	async def test_reset(self):
+		token_cost = TokenCost()
+		token_cost.add_usage('gpt-4.1-mini', make_usage(100, 10))
+
+		finished_task = token_cost.reset()
+		assert finished_task.by_model['gpt-4.1-mini'].invocations == 1
+		assert len(token_cost.usage_history) == 0
+		assert (await token_cost.get_usage_summary()).entry_count == 0
+
+		token_cost.add_usage('gpt-4.1-mini', make_usage(300, 30))
+		assert token_cost.get_usage_tokens_for_model('gpt-4.1-mini').prompt_tokens == 300